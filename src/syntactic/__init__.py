@@ -3,33 +3,103 @@
 A Python port of the R syntactic package by Acid Genomics.
 """
 
+from syntactic.cache import (
+    CacheInfo,
+    cache_enabled,
+    cache_info,
+    clear_cache,
+    disable_cache,
+    enable_cache,
+)
 from syntactic.capitalize import capitalize, sentence_case
 from syntactic.case_conversion import (
+    Converter,
     camel_case,
+    convert,
     dotted_case,
     kebab_case,
+    screaming_snake_case,
     snake_case,
+    train_case,
     upper_camel_case,
 )
 from syntactic.make_dimnames import make_dimnames
-from syntactic.make_names import make_names
-from syntactic.make_words import make_label, make_title, make_words
-from syntactic.pad_zeros import autopad_zeros
-from syntactic.rename import syntactic_rename
+from syntactic.make_names import NamePipeline, UniqueNamer, make_names
+from syntactic.make_words import make_label, make_labels, make_title, make_words
+from syntactic.pad_zeros import autopad_zeros, natural_argsort, natural_sort_key
+from syntactic.parallel import BatchExecutor
+from syntactic.rename import RenamePlan, syntactic_rename
+from syntactic.streaming import (
+    iter_autopad_zeros,
+    iter_camel_case,
+    iter_dotted_case,
+    iter_kebab_case,
+    iter_make_names,
+    iter_make_words,
+    iter_snake_case,
+    iter_upper_camel_case,
+)
+from syntactic.validation import (
+    conforms,
+    first_violation,
+    is_camel_case,
+    is_dotted_case,
+    is_kebab_case,
+    is_screaming_snake_case,
+    is_snake_case,
+    is_syntactic_name,
+    is_train_case,
+    is_upper_camel_case,
+)
 
 __all__ = [
+    "BatchExecutor",
+    "CacheInfo",
+    "Converter",
+    "NamePipeline",
+    "RenamePlan",
+    "UniqueNamer",
     "autopad_zeros",
+    "cache_enabled",
+    "cache_info",
     "camel_case",
     "capitalize",
+    "clear_cache",
+    "conforms",
+    "convert",
+    "disable_cache",
     "dotted_case",
+    "enable_cache",
+    "first_violation",
+    "is_camel_case",
+    "is_dotted_case",
+    "is_kebab_case",
+    "is_screaming_snake_case",
+    "is_snake_case",
+    "is_syntactic_name",
+    "is_train_case",
+    "is_upper_camel_case",
+    "iter_autopad_zeros",
+    "iter_camel_case",
+    "iter_dotted_case",
+    "iter_kebab_case",
+    "iter_make_names",
+    "iter_make_words",
+    "iter_snake_case",
+    "iter_upper_camel_case",
     "kebab_case",
     "make_dimnames",
     "make_label",
+    "make_labels",
     "make_names",
     "make_title",
     "make_words",
+    "natural_argsort",
+    "natural_sort_key",
+    "screaming_snake_case",
     "sentence_case",
     "snake_case",
     "syntactic_rename",
+    "train_case",
     "upper_camel_case",
 ]
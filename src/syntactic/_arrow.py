@@ -0,0 +1,224 @@
+"""Apache Arrow backend for the syntactic naming functions.
+
+The regex stages of :func:`~syntactic.make_names` and the ``_syntactic``
+engine are expressed as :mod:`pyarrow.compute` regex (RE2) and utf8 kernels,
+so conversions run over Arrow buffers without materializing Python strings.
+Python is only used for the rows that need Unicode transliteration, for
+order-dependent uniquification when duplicates occur, and for camelCase and
+word conversions, which need per-match case changes that RE2 cannot express.
+Dictionary-encoded arrays only have their dictionary converted.
+"""
+
+from collections.abc import Callable
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from syntactic.case_conversion import _convert_case
+from syntactic.make_names import _name_pipeline, _Namespace, _transliterate
+from syntactic.make_words import _make_words
+
+type _ArrowArray = pa.Array | pa.ChunkedArray
+type _Transform = Callable[[pa.Array], pa.Array]
+
+# Python's str pattern "\s", restricted to the ASCII range.
+_WS = r"[\t\n\x0b\f\r\x1c-\x1f ]"
+
+# RE2 translation of the make_names smart rules, in order. The third field
+# flags regex (True) versus literal (False) substitutions.
+_SMART_RULES: tuple[tuple[str, str, bool], ...] = (
+    ("&", "_and_", False),
+    ("+", "_plus_", False),
+    (_WS + "-" + _WS, " ", True),
+    ("-" + _WS, "_minus_", True),
+    ("^-(.+)$", r"minus_\1", True),
+    ("^(.+)-$", r"\1_minus", True),
+    ("/", "_slash_", False),
+    ("%", "_percent_", False),
+    ("*", "_times_", False),
+    (r"([0-9]),([0-9])", r"\1\2", True),
+)
+
+# RE2 translation of _sanitize_acronyms, applied to dot-separated words.
+# Case-changing callbacks are expanded into one literal rule per match.
+_ACRONYM_RULES: tuple[tuple[str, str], ...] = (
+    (r"(?i)\bid\b", "ID"),
+    *((rf"\b{c}M\b", f"{c}m") for c in "mnu"),
+    *((rf"([0-9]+){c}M\b", rf"\1{c}m") for c in "mnu"),
+    (r"\b([A-Z0-9]+)s\b", r"\1S"),
+    *((rf"\b{t}RNA\b", f"{t.upper()}RNA") for t in ("mi", "nc", "pi", "m", "r")),
+    (r"\bRNAi\b", "RNAI"),
+    (r"\bEtOH\b", "Etoh"),
+)
+
+_BOUNDARY_RULES: tuple[tuple[str, str], ...] = (
+    (r"([a-z])([A-Z])", r"\1_\2"),
+    (r"([A-Z0-9])([A-Z])([a-z]{2,})", r"\1_\2\3"),
+    (r"([A-Z0-9]{2,})([A-Z])([a-z].+)", r"\1_\2\3"),
+)
+
+
+def _sub(x: pa.Array, pattern: str, replacement: str) -> pa.Array:
+    """Replace all non-overlapping regex matches."""
+    return pc.replace_substring_regex(x, pattern=pattern, replacement=replacement)
+
+
+def _replace(x: pa.Array, pattern: str, replacement: str) -> pa.Array:
+    """Replace all occurrences of a literal substring."""
+    return pc.replace_substring(x, pattern=pattern, replacement=replacement)
+
+
+def _mask(x: pa.Array) -> pa.Array:
+    """Treat null entries of a boolean array as false."""
+    return pc.fill_null(x, fill_value=False)
+
+
+def _patch(x: pa.Array, mask: pa.Array, func: Callable[[str], str]) -> pa.Array:
+    """Apply a scalar function to the masked entries of an array."""
+    if not pc.any(mask).as_py():
+        return x
+    values = [func(s) for s in pc.filter(x, mask).to_pylist()]
+    return pc.replace_with_mask(x, mask, pa.array(values, type=x.type))
+
+
+def _stems(x: pa.Array, *, smart: bool) -> pa.Array:
+    """Run the make_names stages that precede uniquification."""
+    empty = pc.equal(pc.utf8_length(x), 0)
+    assert not pc.any(empty).as_py(), "All strings must be non-empty."
+    x = _replace(x, "&#181;", "u")
+    x = _patch(x, _mask(pc.invert(pc.string_is_ascii(x))), _transliterate)
+    original = x
+    if smart:
+        for pattern, replacement, regex in _SMART_RULES:
+            x = (_sub if regex else _replace)(x, pattern, replacement)
+    x = _sub(x, "[^a-zA-Z0-9]", "_")
+    x = _sub(_sub(x, "^_", ""), "_$", "")
+    x = _sub(x, "^([0-9])", r"X\1")
+    x = pc.if_else(pc.equal(pc.utf8_length(x), 0), pa.scalar("X", type=x.type), x)
+    if smart:
+        # Python's "$" also matches before a trailing newline; RE2's does not.
+        pipeline = _name_pipeline(False, smart)
+        trailing = _mask(pc.ends_with(original, "\n"))
+        if pc.any(trailing).as_py():
+            values = [pipeline._stem(s) for s in pc.filter(original, trailing).to_pylist()]
+            x = pc.replace_with_mask(x, trailing, pa.array(values, type=x.type))
+    return x
+
+
+def _finalize(x: pa.Array) -> pa.Array:
+    """Collapse repeated underscores and strip them from the ends."""
+    return _sub(_sub(_sub(x, "_{2,}", "_"), "^_", ""), "_$", "")
+
+
+def _make_names(x: pa.Array, *, unique: bool, smart: bool) -> pa.Array:
+    """Make syntactically valid names out of a string array."""
+    stems = _stems(x, smart=smart)
+    if unique and pc.count_distinct(stems, mode="all").as_py() < len(stems):
+        pipeline = _name_pipeline(unique, smart)
+        namespace = _Namespace()
+        values = [
+            None if s is None else pipeline._finalize(namespace.claim(s)) for s in stems.to_pylist()
+        ]
+        return pa.array(values, type=x.type)
+    return _finalize(stems)
+
+
+def _syntactic(x: pa.Array, *, smart: bool, prefix: bool) -> pa.Array:
+    """Split words of syntactic names with underscores."""
+    x = _make_names(x, unique=False, smart=smart)
+    if smart:
+        x = _replace(x, "_", ".")
+        for pattern, replacement in _ACRONYM_RULES:
+            x = _sub(x, pattern, replacement)
+        x = _replace(x, ".", "_")
+    if not prefix:
+        x = _sub(x, "(?i)^X([^a-zA-Z])", r"\1")
+    for pattern, replacement in _BOUNDARY_RULES:
+        x = _sub(x, pattern, replacement)
+    return x
+
+
+def _delimited_case(x: pa.Array, *, sep: str, smart: bool, prefix: bool) -> pa.Array:
+    """Convert a string array to lowercase words joined by a separator."""
+    x = pc.utf8_lower(_syntactic(x, smart=smart, prefix=prefix))
+    if sep != "_":
+        x = _replace(x, "_", sep)
+    return x
+
+
+def _scalar(func: Callable[..., list[str]], **kwargs: bool | str) -> _Transform:
+    """Wrap a scalar batch engine as an Arrow transform."""
+
+    def transform(x: pa.Array) -> pa.Array:
+        values = x.to_pylist()
+        present = [s for s in values if s is not None]
+        converted = iter(func(present, **kwargs))
+        return pa.array([None if s is None else next(converted) for s in values], type=x.type)
+
+    return transform
+
+
+def _as_string(x: pa.Array) -> pa.Array:
+    """Cast string views to a type supported by all the string kernels."""
+    if pa.types.is_string_view(x.type):
+        return x.cast(pa.string())
+    return x
+
+
+def _apply(x: _ArrowArray, transform: _Transform, *, elementwise: bool = True) -> _ArrowArray:
+    """Apply a transform, chunk by chunk and dictionary-only where possible."""
+    if isinstance(x, pa.ChunkedArray):
+        if elementwise:
+            return pa.chunked_array([_apply(c, transform) for c in x.chunks], type=x.type)
+        return pa.chunked_array([_apply(x.combine_chunks(), transform, elementwise=False)])
+    if isinstance(x, pa.DictionaryArray):
+        if not elementwise:
+            return _apply(x.dictionary_decode(), transform, elementwise=False)
+        # Convert the dictionary only, then merge entries that converge.
+        converted = _apply(x.dictionary, transform)
+        dictionary = pc.unique(converted)
+        remap = pc.index_in(converted, value_set=dictionary)
+        indices = pc.take(remap, x.indices).cast(x.indices.type)
+        return pa.DictionaryArray.from_arrays(indices, dictionary)
+    return transform(_as_string(x)).cast(x.type)
+
+
+def make_names(x: _ArrowArray, *, unique: bool, smart: bool) -> _ArrowArray:
+    """Make syntactically valid names out of an Arrow string array."""
+
+    def transform(a: pa.Array) -> pa.Array:
+        return _make_names(a, unique=unique, smart=smart)
+
+    return _apply(x, transform, elementwise=not unique)
+
+
+def delimited_case(x: _ArrowArray, *, sep: str, smart: bool, prefix: bool) -> _ArrowArray:
+    """Convert an Arrow string array to snake_case, kebab-case or dotted.case."""
+
+    def transform(a: pa.Array) -> pa.Array:
+        return _delimited_case(a, sep=sep, smart=smart, prefix=prefix)
+
+    return _apply(x, transform)
+
+
+def camel_case(
+    x: _ArrowArray,
+    *,
+    format: str,
+    strict: bool,
+    smart: bool,
+    prefix: bool,
+) -> _ArrowArray:
+    """Convert an Arrow string array to lowerCamelCase or UpperCamelCase."""
+    transform = _scalar(_convert_case, format=format, strict=strict, smart=smart, prefix=prefix)
+    return _apply(x, transform)
+
+
+def convert_case(x: _ArrowArray, *, format: str, **kwargs: bool) -> _ArrowArray:
+    """Convert an Arrow string array to any case format."""
+    return _apply(x, _scalar(_convert_case, format=format, **kwargs))
+
+
+def make_words(x: _ArrowArray) -> _ArrowArray:
+    """Convert an Arrow string array of variable names to words."""
+    return _apply(x, _scalar(_make_words))
@@ -0,0 +1,31 @@
+"""Detection helpers for optional array library dependencies.
+
+These checks never import an optional dependency. An object can only be an
+instance of a library's type if that library has already been imported.
+"""
+
+import sys
+from typing import TYPE_CHECKING, Any, TypeGuard
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+    from numpy.typing import NDArray
+
+
+def _is_ndarray(obj: object) -> TypeGuard["NDArray[Any]"]:
+    """Check whether an object is a NumPy array."""
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(obj, np.ndarray)
+
+
+def _is_arrow(obj: object) -> TypeGuard["pa.Array | pa.ChunkedArray"]:
+    """Check whether an object is a PyArrow array or chunked array."""
+    pa = sys.modules.get("pyarrow")
+    return pa is not None and isinstance(obj, pa.Array | pa.ChunkedArray)
+
+
+def _is_pandas(obj: object) -> TypeGuard["pd.Series | pd.Index"]:
+    """Check whether an object is a pandas series or index."""
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(obj, pd.Series | pd.Index)
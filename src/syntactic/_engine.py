@@ -1,50 +1,70 @@
 """Internal engine functions for syntactic name processing."""
 
 import re
+from collections.abc import Callable
+from functools import cache
 
 from syntactic.make_names import make_names
 
+# Acronym rules, combined into one alternation so that each string is
+# scanned once. Rules apply to whole words, except that digit-prefixed
+# molarity (e.g. "X10uM") also matches at the end of a word.
+_ACRONYM_PATTERN = re.compile(
+    # Identifier variants (e.g. "Id" to "ID").
+    r"\b(?i:(id))\b"
+    # Mixed case RNA types, RNA interference and ethanol.
+    r"|\b((?:mi|nc|pi|m|r)RNA|RNAi|EtOH)\b"
+    # Molarity (e.g. "10nM" to "10nm").
+    r"|(?:\b[mnu]|[0-9]+[mnu])M\b"
+    # Pluralized acronyms (e.g. "UMIs" to "UMIS").
+    r"|\b[A-Z0-9]+s\b"
+)
+
+_ACRONYM_WORDS = {
+    "miRNA": "MIRNA",
+    "ncRNA": "NCRNA",
+    "piRNA": "PIRNA",
+    "mRNA": "MRNA",
+    "rRNA": "RRNA",
+    "RNAi": "RNAI",
+    "EtOH": "Etoh",
+}
+
+
+def _replace_acronym(m: re.Match[str]) -> str:
+    """Return the replacement for a match of the combined acronym pattern."""
+    if m[1]:
+        return "ID"
+    if m[2]:
+        return _ACRONYM_WORDS[m[2]]
+    # Molarity and plural matches only change the case of their last letter.
+    s = m[0]
+    return s[:-1] + s[-1].swapcase()
+
+
+def _sanitize_acronym(s: str) -> str:
+    """Sanitize mixed-case acronyms in a string."""
+    # Work with dots as word separators for regex matching.
+    return _ACRONYM_PATTERN.sub(_replace_acronym, s.replace("_", ".")).replace(".", "_")
+
 
 def _sanitize_acronyms(x: list[str]) -> list[str]:
     """Sanitize mixed-case acronyms in strings."""
-    result = []
-    for item in x:
-        # Work with dots as word separators for regex matching.
-        s = item.replace("_", ".")
-        # Identifier variants (e.g. "Id" to "ID").
-        s = re.sub(r"\b(id)\b", "ID", s, flags=re.IGNORECASE)
-        # Molarity (e.g. "10nM" to "10nm").
-        s = re.sub(
-            r"\b([mnu]M)\b",
-            lambda m: m.group(1).lower(),
-            s,
-        )
-        # Also handle digit-prefixed molarity (e.g. "X10uM" -> "X10um").
-        s = re.sub(
-            r"([0-9]+[mnu]M)\b",
-            lambda m: m.group(1).lower(),
-            s,
-        )
-        # Pluralized acronyms (e.g. "UMIs" to "UMIS").
-        s = re.sub(
-            r"\b([A-Z0-9]+)s\b",
-            lambda m: m.group(1) + "S",
-            s,
-        )
-        # Mixed case RNA types.
-        s = re.sub(
-            r"\b((?:mi|nc|pi|m|r)RNA)\b",
-            lambda m: m.group(1).upper(),
-            s,
-        )
-        # RNA interference.
-        s = re.sub(r"\b(RNAi)\b", "RNAI", s)
-        # Ethanol.
-        s = re.sub(r"\b(EtOH)\b", "Etoh", s)
-        # Convert back to underscores.
-        s = s.replace(".", "_")
-        result.append(s)
-    return result
+    return [_sanitize_acronym(s) for s in x]
+
+
+# Word boundaries within a name: a lowercase letter followed by an uppercase
+# letter (e.g. "nCount"), or a word following an acronym (e.g. "HTMLRemap").
+_BOUNDARY_PATTERN = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z0-9])(?=[A-Z][a-z]{2})")
+# Remaining long acronym sequence (e.g. "ABCd5" to "AB_Cd5"), split once.
+_LONG_ACRONYM_PATTERN = re.compile(r"([A-Z0-9]{2,})([A-Z])([a-z].+)")
+_PREFIX_PATTERN = re.compile(r"^X([^a-zA-Z])", flags=re.IGNORECASE)
+_CAPITALIZED_PATTERN = re.compile(r"[A-Z][a-z0-9]*")
+
+
+def _split_words(s: str) -> str:
+    """Insert underscores at the word boundaries of a syntactic name."""
+    return _LONG_ACRONYM_PATTERN.sub(r"\1_\2\3", _BOUNDARY_PATTERN.sub("_", s), count=1)
 
 
 def _syntactic(
@@ -52,7 +72,11 @@ def _syntactic(
     smart: bool = True,
     prefix: bool = True,
 ) -> list[str]:
-    """Core syntactic name processing engine."""
+    """Core syntactic name processing engine.
+
+    Returns syntactic names with words joined by underscores, in their
+    original case.
+    """
     x = make_names(x, smart=smart, unique=False)
     if smart:
         # Strip any remaining apostrophes after make_names.
@@ -61,19 +85,151 @@ def _syntactic(
         x = _sanitize_acronyms(x)
     # Include "X" prefix by default, but allow manual disable.
     if not prefix:
-        x = [re.sub(r"^X([^a-zA-Z])", r"\1", s, flags=re.IGNORECASE) for s in x]
-    result = []
-    for item in x:
-        # Establish word boundaries for camelCase acronyms.
-        # Acronym following a word: e.g. "nCount" -> "n_Count"
-        s = re.sub(r"([a-z])([A-Z])", r"\1_\2", item)
-        # Word following an acronym: e.g. "HTMLRemap" -> "HTML_Remap"
-        s = re.sub(r"([A-Z0-9])([A-Z])([a-z]{2,})", r"\1_\2\3", s)
-        # Handle remaining long acronym sequences.
-        s = re.sub(
-            r"([A-Z0-9]{2,})([A-Z])([a-z].+)",
-            lambda m: m.group(1) + "_" + m.group(2) + m.group(3),
-            s,
-        )
-        result.append(s)
-    return result
+        x = [_PREFIX_PATTERN.sub(r"\1", s) for s in x]
+    return [_split_words(s) for s in x]
+
+
+class _Token:
+    """Word of a syntactic name, with flags used to render case formats."""
+
+    __slots__ = ("acronym", "number", "text")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        # All-caps words, e.g. "HTML" or "RNA2".
+        self.acronym = len(text) > 1 and text.isupper()
+        # Words that start with a digit, e.g. "10um".
+        self.number = text[:1].isdigit()
+
+
+def _tokenize(s: str) -> list[_Token]:
+    """Split a syntactic name into word tokens."""
+    return [_Token(word) for word in s.split("_")]
+
+
+def _capitalize(word: str) -> str:
+    """Uppercase the first character of a word, keeping the rest."""
+    return word[:1].upper() + word[1:]
+
+
+def _render_camel(tokens: list[_Token], *, upper: bool, strict: bool) -> str:
+    """Join words in lowerCamelCase or UpperCamelCase."""
+    words = [t.text.lower() for t in tokens] if strict else [t.text for t in tokens]
+    first = words[0]
+    parts = [_capitalize(first) if upper else first.lower()]
+    previous = first
+    for token, word in zip(tokens[1:], words[1:], strict=True):
+        if not token.number:
+            parts.append(_capitalize(word))
+        elif previous[-1:].isalpha():
+            parts.append(word)
+        else:
+            # Keep adjacent numbers apart, e.g. "1_2" to "1x2".
+            parts.append(("X" if upper else "x") + word)
+        previous = word
+    return "".join(parts)
+
+
+def _render_train(tokens: list[_Token], *, strict: bool) -> str:
+    """Join capitalized words with hyphens, keeping acronyms unless strict."""
+    return "-".join(
+        t.text if t.acronym and not strict else _capitalize(t.text.lower()) for t in tokens
+    )
+
+
+def _render_words(tokens: list[_Token]) -> str:
+    """Join words with spaces, lowercasing capitalized words but not acronyms."""
+    words = []
+    for token in tokens:
+        word = token.text
+        # Single uppercase letters and capitalized words, e.g. "A" or "Count".
+        if _CAPITALIZED_PATTERN.fullmatch(word):
+            word = word.lower()
+        # Include period for versus.
+        if word in ("v", "vs"):
+            word += "."
+        words.append(word)
+    return " ".join(words)
+
+
+type _Renderer = Callable[[list[_Token], bool], str]
+
+# Renderers for each case format, taking the tokens and the strict flag.
+_RENDERERS: dict[str, _Renderer] = {
+    "snake": lambda tokens, _: "_".join([t.text.lower() for t in tokens]),
+    "kebab": lambda tokens, _: "-".join([t.text.lower() for t in tokens]),
+    "dotted": lambda tokens, _: ".".join([t.text.lower() for t in tokens]),
+    "screaming_snake": lambda tokens, _: "_".join([t.text.upper() for t in tokens]),
+    "camel": lambda tokens, strict: _render_camel(tokens, upper=False, strict=strict),
+    "upper_camel": lambda tokens, strict: _render_camel(tokens, upper=True, strict=strict),
+    "train": lambda tokens, strict: _render_train(tokens, strict=strict),
+}
+
+
+# Patterns matching strings that are already fixed points of each format.
+# A camelCase uppercase letter must follow a lowercase one, since any other
+# uppercase letter is lowercased or split off by the conversion.
+# camelCase characters: an uppercase letter must start a word, either after a
+# lowercase letter, or after a letter or number when followed by two
+# lowercase letters (see _BOUNDARY_PATTERN).
+_CAMEL_TAIL = r"(?:[a-z0-9]|(?<=[a-z])[A-Z]|(?<=[A-Z0-9])[A-Z](?=[a-z]{2}))*"
+# At most one further word may start after a longer acronym (see
+# _LONG_ACRONYM_PATTERN, which is applied once).
+_CAMEL_LONG_ACRONYM = r"(?:(?<=[A-Z0-9]{2})[A-Z](?=[a-z].)" + _CAMEL_TAIL + r")?"
+_TRAIN_WORD = r"(?:[A-Z0-9][a-z0-9]*)"
+_TRAIN_ACRONYM = r"(?:[A-Z0-9]*[A-Z][A-Z0-9]*)"
+
+# Strings that a case conversion leaves unchanged, by format and strict flag.
+_FIXED_POINT_PATTERNS: dict[tuple[str, bool], str] = {
+    ("snake", True): r"[a-z0-9]+(?:_[a-z0-9]+)*",
+    ("kebab", True): r"[a-z0-9]+(?:-[a-z0-9]+)*",
+    ("dotted", True): r"[a-z0-9]+(?:\.[a-z0-9]+)*",
+    ("screaming_snake", True): r"[A-Z0-9]+(?:_[A-Z0-9]+)*",
+    ("camel", True): r"[a-z0-9]" + _CAMEL_TAIL + _CAMEL_LONG_ACRONYM,
+    ("upper_camel", True): r"[A-Z0-9]" + _CAMEL_TAIL + _CAMEL_LONG_ACRONYM,
+    ("train", True): rf"{_TRAIN_WORD}(?:-{_TRAIN_WORD})*",
+    # Non-strict formats keep the case of words after the first one.
+    ("camel", False): (
+        r"[a-z0-9]+(?:(?:(?<=[a-z])|(?<=[0-9])(?=[A-Z][a-z]{2})|(?<=[0-9]{2})(?=[A-Z][a-z].))"
+        r"[A-Z][A-Za-z0-9]*)?"
+    ),
+    ("upper_camel", False): r"[A-Z0-9][A-Za-z0-9]*",
+    ("train", False): (
+        rf"(?:{_TRAIN_WORD}|{_TRAIN_ACRONYM})(?:-(?:{_TRAIN_WORD}|{_TRAIN_ACRONYM}))*"
+    ),
+}
+
+# Strings excluded from the fixed points when acronyms are sanitized. Only
+# sanitizations that survive rendering in each format are listed.
+_SMART_EXCLUSIONS: dict[tuple[str, bool], str] = {
+    ("camel", True): r"(?!(?:iD|[mnu]M|.*[0-9][mnu]M)\Z)",
+    ("upper_camel", True): r"(?!.*[0-9][mnu]M\Z)",
+    ("camel", False): r"(?!(?:iD|(?:mi|nc|pi|m|r)RNA|[mnu]M|.*[0-9][mnu]M)\Z)",
+    ("upper_camel", False): r"(?!(?:Id|RNAi|EtOH|[A-Z0-9]+s|.*[0-9][mnu]M)\Z)",
+    ("train", False): r"(?!(?:.*-)?(?:Id|[A-Z0-9]+s)(?:-|\Z))",
+}
+
+
+@cache
+def _fixed_point(
+    format: str,
+    *,
+    strict: bool,
+    smart: bool,
+    prefix: bool,
+) -> Callable[[str], object]:
+    """Return a matcher for strings that a case conversion leaves unchanged.
+
+    Matching strings may skip make_names, acronym sanitization and word
+    splitting entirely. The matcher is exact: a string matches if and only
+    if it converts to itself.
+    """
+    # The strict flag only affects the camel and train formats.
+    key = (format, strict or (format, False) not in _FIXED_POINT_PATTERNS)
+    pattern = _FIXED_POINT_PATTERNS[key]
+    if smart:
+        pattern = _SMART_EXCLUSIONS.get(key, "") + pattern
+    # Leading numbers are prefixed with "X". Without the prefix, an "x" before
+    # a non-letter is stripped instead.
+    guard = r"(?=[a-zA-Z])" if prefix else r"(?![xX][^a-zA-Z])"
+    return re.compile(guard + pattern).fullmatch
@@ -0,0 +1,50 @@
+"""Factorized (dedupe-then-scatter) execution of element-wise conversions.
+
+Highly repetitive inputs are split into their distinct values and integer
+codes. Only the distinct values are converted, and the results are scattered
+back through the codes.
+"""
+
+from collections.abc import Callable
+
+# Inputs shorter than this are never factorized automatically.
+_MIN_SIZE = 2048
+_SAMPLE_SIZE = 1024
+# Factorize automatically when at most this fraction of a sample is distinct.
+_MAX_DISTINCT_RATIO = 0.5
+
+
+def _use_factorize(x: list[str], factorize: bool | None) -> bool:
+    """Decide whether to factorize an input.
+
+    ``None`` selects factorization automatically, from the distinct ratio of
+    an evenly strided sample of the input.
+    """
+    if factorize is not None:
+        return factorize
+    if len(x) < _MIN_SIZE:
+        return False
+    sample = x[:: len(x) // _SAMPLE_SIZE]
+    return len(set(sample)) <= _MAX_DISTINCT_RATIO * len(sample)
+
+
+def _factorize(x: list[str]) -> tuple[list[int], list[str]]:
+    """Return integer codes and distinct values, in order of appearance."""
+    index: dict[str, int] = {}
+    codes = [index.setdefault(s, len(index)) for s in x]
+    return codes, list(index)
+
+
+def _factorized(
+    func: Callable[..., list[str]],
+    x: list[str],
+    *,
+    factorize: bool | None,
+    **kwargs: bool | str,
+) -> list[str]:
+    """Apply an element-wise batch function, converting each distinct value once."""
+    if not _use_factorize(x, factorize):
+        return func(x, **kwargs)
+    codes, uniques = _factorize(x)
+    values = func(uniques, **kwargs)
+    return [values[i] for i in codes]
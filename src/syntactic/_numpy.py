@@ -0,0 +1,170 @@
+"""NumPy array backend for the syntactic naming functions.
+
+Strings that are already fixed points of a conversion are detected with
+vectorized :mod:`numpy.strings` operations and passed through untouched.
+Only the remaining strings are converted by the scalar engine.
+"""
+
+import string
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from syntactic.case_conversion import _convert_case
+from syntactic.make_names import _name_pipeline, _Namespace
+from syntactic.make_words import _make_words
+from syntactic.pad_zeros import autopad_zeros as _autopad_zeros
+
+_STRING = np.dtypes.StringDType()
+_LOWER = string.ascii_lowercase
+_UPPER = string.ascii_uppercase
+_DIGITS = string.digits
+_LETTERS = _LOWER + _UPPER
+
+type _Mask = Callable[[NDArray[Any]], NDArray[np.bool_]]
+
+
+def _as_strings(x: NDArray[Any]) -> NDArray[Any]:
+    """Return a flattened ``StringDType`` copy of an array."""
+    return x.astype(_STRING).ravel()
+
+
+def _restore(values: NDArray[Any], like: NDArray[Any]) -> NDArray[Any]:
+    """Reshape converted strings and cast them back to the input string dtype."""
+    values = values.reshape(like.shape)
+    if isinstance(like.dtype, np.dtypes.StringDType):
+        return values
+    if like.dtype == np.object_:
+        return values.astype(object)
+    width = int(np.strings.str_len(values).max()) if values.size else 1
+    return values.astype(f"U{max(width, 1)}")
+
+
+def _consists_of(x: NDArray[Any], chars: str) -> NDArray[np.bool_]:
+    """Check which strings consist only of the given characters."""
+    return np.strings.str_len(np.strings.lstrip(x, chars)) == 0
+
+
+def _fixed_mask(x: NDArray[Any], *, first: str, rest: str, sep: str = "") -> NDArray[np.bool_]:
+    """Check which strings match ``[first][rest]*`` with single inner separators."""
+    mask = np.strings.str_len(x) > 0
+    mask &= _consists_of(np.strings.slice(x, 0, 1), first)
+    mask &= _consists_of(np.strings.slice(x, 1, None), rest + sep)
+    if sep:
+        mask &= np.strings.find(x, sep * 2) < 0
+        mask &= ~np.strings.endswith(x, sep)
+    return mask
+
+
+def _convert(
+    x: NDArray[Any],
+    func: Callable[..., list[str]],
+    mask: _Mask | None,
+    **kwargs: bool | str,
+) -> NDArray[Any]:
+    """Convert the strings of an array that are not already fixed points."""
+    values = _as_strings(x)
+    todo = np.flatnonzero(~mask(values)) if mask is not None else np.arange(values.size)
+    if todo.size:
+        values[todo] = func(values[todo].tolist(), **kwargs)
+    return _restore(values, x)
+
+
+def _first_lower(prefix: bool) -> str:
+    """Return the leading characters preserved by lowercase conversions."""
+    # Without the prefix, "x" followed by a non-letter is stripped.
+    return _LOWER if prefix else _LOWER.replace("x", "")
+
+
+def make_names(x: NDArray[Any], *, unique: bool, smart: bool) -> NDArray[Any]:
+    """Make syntactically valid names out of a string array."""
+    values = _as_strings(x)
+    pipeline = _name_pipeline(unique, smart)
+    todo = np.flatnonzero(~_fixed_mask(values, first=_LETTERS, rest=_LETTERS + _DIGITS, sep="_"))
+    stems = [pipeline._stem(s) for s in values[todo].tolist()]
+    if todo.size:
+        values[todo] = stems
+    if unique and np.unique(values).size < values.size:
+        namespace = _Namespace()
+        values[:] = [pipeline._finalize(namespace.claim(s)) for s in values.tolist()]
+    elif todo.size:
+        values[todo] = [pipeline._finalize(s) for s in stems]
+    return _restore(values, x)
+
+
+def camel_case(
+    x: NDArray[Any],
+    *,
+    format: str,
+    strict: bool,
+    smart: bool,
+    prefix: bool,
+) -> NDArray[Any]:
+    """Convert a string array to lowerCamelCase or UpperCamelCase."""
+    mask: _Mask | None
+    if format == "camel":
+
+        def mask(v: NDArray[Any]) -> NDArray[np.bool_]:
+            return _fixed_mask(v, first=_first_lower(prefix), rest=_LOWER + _DIGITS)
+
+    elif strict:
+        first = _UPPER if prefix else _UPPER.replace("X", "")
+
+        def mask(v: NDArray[Any]) -> NDArray[np.bool_]:
+            return _fixed_mask(v, first=first, rest=_LOWER + _DIGITS)
+
+    else:
+        # Acronym sanitization can uppercase the tail of non-strict output.
+        mask = None
+    return _convert(
+        x,
+        _convert_case,
+        mask,
+        format=format,
+        strict=strict,
+        smart=smart,
+        prefix=prefix,
+    )
+
+
+def _delimited_case(x: list[str], *, sep: str, smart: bool, prefix: bool) -> list[str]:
+    """Convert strings to lowercase words joined by a separator."""
+    x = _convert_case(x, format="snake", smart=smart, prefix=prefix)
+    if sep == "_":
+        return x
+    return [s.replace("_", sep) for s in x]
+
+
+def delimited_case(x: NDArray[Any], *, sep: str, smart: bool, prefix: bool) -> NDArray[Any]:
+    """Convert a string array to snake_case, kebab-case or dotted.case."""
+    first = _first_lower(prefix)
+
+    def mask(v: NDArray[Any]) -> NDArray[np.bool_]:
+        return _fixed_mask(v, first=first, rest=_LOWER + _DIGITS, sep=sep)
+
+    return _convert(x, _delimited_case, mask, sep=sep, smart=smart, prefix=prefix)
+
+
+def convert_case(x: NDArray[Any], *, format: str, **kwargs: bool) -> NDArray[Any]:
+    """Convert a string array to any case format, without fixed-point detection."""
+    return _convert(x, _convert_case, None, format=format, **kwargs)
+
+
+def make_words(x: NDArray[Any]) -> NDArray[Any]:
+    """Convert a string array of variable names to human-readable words."""
+    return _convert(x, _make_words, None)
+
+
+def autopad_zeros(x: NDArray[Any]) -> NDArray[Any]:
+    """Pad the numbers of an integer or string array with leading zeros."""
+    if x.dtype.kind in "iu" and (x.size == 0 or x.min() >= 0):
+        # The widest number is the maximum, so no string lengths are needed.
+        width = len(str(x.max())) if x.size else 0
+        values = x.astype(_STRING)
+        return _restore(np.strings.zfill(values, width), values)
+    values = np.array(_autopad_zeros(x.ravel().tolist()), dtype=_STRING)
+    if x.dtype.kind in "iub":
+        return values.reshape(x.shape)
+    return _restore(values, x)
@@ -0,0 +1,277 @@
+"""pandas accessors for syntactic row, column and index labels.
+
+Importing this module registers a ``syntactic`` accessor on
+:class:`pandas.DataFrame` and :class:`pandas.Index`. Axes are relabeled
+without copying column data, and each distinct label is converted once.
+
+Examples
+--------
+>>> import pandas as pd
+>>> import syntactic.accessor
+>>> df = pd.DataFrame({"sampleID": [1], "nCount RNA": [2]})
+>>> df.syntactic.snake_case_columns().columns.tolist()
+['sample_id', 'n_count_rna']
+"""
+
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+from syntactic.case_conversion import (
+    camel_case,
+    dotted_case,
+    kebab_case,
+    snake_case,
+    upper_camel_case,
+)
+from syntactic.make_names import make_names
+from syntactic.validation import _matcher, _passes
+
+# Fixed-point formats of the naming functions, as in syntactic.validation.
+_FORMATS: dict[Callable[..., list[str]], str] = {
+    make_names: "names",
+    snake_case: "snake",
+    kebab_case: "kebab",
+    dotted_case: "dotted",
+    camel_case: "camel",
+    upper_camel_case: "upper_camel",
+}
+
+
+def _conforms(
+    labels: list[str],
+    func: Callable[..., list[str]],
+    *,
+    unique: bool = False,
+    **kwargs: bool,
+) -> bool:
+    """Check whether every label is already a fixed point of a conversion."""
+    match = _matcher(
+        _FORMATS[func],
+        strict=kwargs.get("strict", True),
+        smart=kwargs.get("smart", True),
+        prefix=kwargs.get("prefix", True),
+    )
+    return all(_passes(labels, match, unique=unique))
+
+
+def _convert_strings(index: pd.Index, func: Callable[..., list[str]], **kwargs: bool) -> pd.Index:
+    """Convert an index whose labels are all strings or missing."""
+    if func is make_names and kwargs.get("unique", True):
+        # Uniqueness depends on label order, so convert every label.
+        labels = index.tolist()
+        missing = index.isna()
+        strings = [s for s, na in zip(labels, missing, strict=True) if not na]
+        if _conforms(strings, func, unique=True):
+            return index
+        names = iter(func(strings, **kwargs))
+        new = [s if na else next(names) for s, na in zip(labels, missing, strict=True)]
+        return pd.Index(new, name=index.name)
+    codes, uniques = index.factorize()
+    old = uniques.tolist()
+    if _conforms(old, func, **kwargs):
+        return index
+    new = func(old, **kwargs)
+    return pd.Index(new, name=index.name).take(codes, allow_fill=True, fill_value=np.nan)
+
+
+def _convert_categorical(
+    index: pd.CategoricalIndex, func: Callable[..., list[str]], **kwargs: bool
+) -> pd.Index:
+    """Convert the categories of a categorical index."""
+    if func is make_names and kwargs.get("unique", True):
+        # Unique labels cannot share categories.
+        return _convert_flat(index.astype(object), func, **kwargs)
+    categories = _convert_flat(index.categories, func, **kwargs)
+    if categories is index.categories:
+        return index
+    codes = np.asarray(index.codes)
+    if categories.has_duplicates:
+        # Distinct categories may converge (e.g. "a b" and "a_b").
+        remap, categories = categories.factorize()
+        codes = np.where(codes < 0, -1, remap[codes])
+    values = pd.Categorical.from_codes(codes, categories, ordered=index.ordered)
+    return pd.CategoricalIndex(values, name=index.name)
+
+
+def _convert_flat(index: pd.Index, func: Callable[..., list[str]], **kwargs: bool) -> pd.Index:
+    """Convert the string labels of a flat index.
+
+    Non-string labels (e.g. of the default ``RangeIndex``) and missing labels
+    are left unchanged, and the categories of a ``CategoricalIndex`` are
+    converted. The input index is returned as-is, before any conversion,
+    when every string label is already a fixed point of the conversion.
+    """
+    if isinstance(index, pd.CategoricalIndex):
+        return _convert_categorical(index, func, **kwargs)
+    if index.inferred_type == "string":
+        return _convert_strings(index, func, **kwargs)
+    if index.dtype != object:
+        return index
+    # Mixed labels: convert the strings and keep the others in place.
+    labels = index.tolist()
+    is_str = [isinstance(s, str) for s in labels]
+    if not any(is_str):
+        return index
+    strings = pd.Index([s for s, ok in zip(labels, is_str, strict=True) if ok], dtype=object)
+    converted = _convert_strings(strings, func, **kwargs)
+    if converted is strings:
+        return index
+    names = iter(converted.tolist())
+    new = [next(names) if ok else s for s, ok in zip(labels, is_str, strict=True)]
+    return pd.Index(new, dtype=object, name=index.name)
+
+
+def _convert_index(index: pd.Index, func: Callable[..., list[str]], **kwargs: bool) -> pd.Index:
+    """Convert the labels of an index, level by level for a MultiIndex.
+
+    Only the unique values of each level are converted. Levels are never
+    made unique, since uniqueness applies to whole tuples.
+    """
+    if not isinstance(index, pd.MultiIndex):
+        return _convert_flat(index, func, **kwargs)
+    if func is make_names:
+        kwargs = kwargs | {"unique": False}
+    levels: list[pd.Index] = []
+    codes: list[np.ndarray] = []
+    changed = False
+    for level, level_codes in zip(index.levels, index.codes, strict=True):
+        new_level = _convert_flat(level, func, **kwargs)
+        new_codes = np.asarray(level_codes)
+        if new_level is not level:
+            changed = True
+            if new_level.has_duplicates:
+                # Distinct labels may converge (e.g. "a b" and "a_b").
+                remap, new_level = new_level.factorize()
+                new_codes = np.where(new_codes < 0, -1, remap[new_codes])
+        levels.append(new_level)
+        codes.append(new_codes)
+    if not changed:
+        return index
+    return pd.MultiIndex(levels=levels, codes=codes, names=index.names, verify_integrity=False)
+
+
+@pd.api.extensions.register_index_accessor("syntactic")
+class SyntacticIndexAccessor:
+    """Syntactic label conversion for a :class:`pandas.Index`.
+
+    Each method returns a new index, or the original index when its labels
+    are already conformant.
+
+    Parameters
+    ----------
+    index : pandas.Index
+        Index to convert.
+    """
+
+    def __init__(self, index: pd.Index) -> None:
+        self._index = index
+
+    def make_names(self, unique: bool = True, smart: bool = False) -> pd.Index:
+        """Make syntactically valid labels, as in :func:`~syntactic.make_names`."""
+        return _convert_index(self._index, make_names, unique=unique, smart=smart)
+
+    def snake_case(self, smart: bool = True, prefix: bool = True) -> pd.Index:
+        """Convert labels to snake_case."""
+        return _convert_index(self._index, snake_case, smart=smart, prefix=prefix)
+
+    def kebab_case(self, smart: bool = True, prefix: bool = True) -> pd.Index:
+        """Convert labels to kebab-case."""
+        return _convert_index(self._index, kebab_case, smart=smart, prefix=prefix)
+
+    def dotted_case(self, smart: bool = True, prefix: bool = True) -> pd.Index:
+        """Convert labels to dotted.case."""
+        return _convert_index(self._index, dotted_case, smart=smart, prefix=prefix)
+
+    def camel_case(self, strict: bool = True, smart: bool = True, prefix: bool = True) -> pd.Index:
+        """Convert labels to lowerCamelCase."""
+        return _convert_index(self._index, camel_case, strict=strict, smart=smart, prefix=prefix)
+
+    def upper_camel_case(
+        self,
+        strict: bool = True,
+        smart: bool = True,
+        prefix: bool = True,
+    ) -> pd.Index:
+        """Convert labels to UpperCamelCase."""
+        return _convert_index(
+            self._index, upper_camel_case, strict=strict, smart=smart, prefix=prefix
+        )
+
+
+@pd.api.extensions.register_dataframe_accessor("syntactic")
+class SyntacticFrameAccessor:
+    """Syntactic axis relabeling for a :class:`pandas.DataFrame`.
+
+    Each method returns a shallow copy with converted axis labels. Column
+    data is shared with the original frame, not copied.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Data frame to relabel.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self._df = df
+
+    def _relabel(self, *, index: pd.Index, columns: pd.Index) -> pd.DataFrame:
+        """Return a shallow copy of the data frame with new axis labels."""
+        df = self._df.copy(deep=False)
+        if index is not self._df.index:
+            df.index = index
+        if columns is not self._df.columns:
+            df.columns = columns
+        return df
+
+    def _relabel_columns(self, func: Callable[..., list[str]], **kwargs: bool) -> pd.DataFrame:
+        """Convert the column labels with a naming function."""
+        columns = _convert_index(self._df.columns, func, **kwargs)
+        return self._relabel(index=self._df.index, columns=columns)
+
+    def make_dimnames(self) -> pd.DataFrame:
+        """Make syntactically valid, unique row and column labels.
+
+        Equivalent to :func:`~syntactic.make_dimnames` applied to the index
+        and columns. Non-string axes, such as a default ``RangeIndex``, are
+        left unchanged.
+        """
+        return self._relabel(
+            index=_convert_index(self._df.index, make_names, unique=True),
+            columns=_convert_index(self._df.columns, make_names, unique=True),
+        )
+
+    def make_names_columns(self, unique: bool = True, smart: bool = False) -> pd.DataFrame:
+        """Make syntactically valid column labels."""
+        return self._relabel_columns(make_names, unique=unique, smart=smart)
+
+    def snake_case_columns(self, smart: bool = True, prefix: bool = True) -> pd.DataFrame:
+        """Convert column labels to snake_case."""
+        return self._relabel_columns(snake_case, smart=smart, prefix=prefix)
+
+    def kebab_case_columns(self, smart: bool = True, prefix: bool = True) -> pd.DataFrame:
+        """Convert column labels to kebab-case."""
+        return self._relabel_columns(kebab_case, smart=smart, prefix=prefix)
+
+    def dotted_case_columns(self, smart: bool = True, prefix: bool = True) -> pd.DataFrame:
+        """Convert column labels to dotted.case."""
+        return self._relabel_columns(dotted_case, smart=smart, prefix=prefix)
+
+    def camel_case_columns(
+        self,
+        strict: bool = True,
+        smart: bool = True,
+        prefix: bool = True,
+    ) -> pd.DataFrame:
+        """Convert column labels to lowerCamelCase."""
+        return self._relabel_columns(camel_case, strict=strict, smart=smart, prefix=prefix)
+
+    def upper_camel_case_columns(
+        self,
+        strict: bool = True,
+        smart: bool = True,
+        prefix: bool = True,
+    ) -> pd.DataFrame:
+        """Convert column labels to UpperCamelCase."""
+        return self._relabel_columns(upper_camel_case, strict=strict, smart=smart, prefix=prefix)
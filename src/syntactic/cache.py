@@ -0,0 +1,210 @@
+"""Opt-in memoization of syntactic name conversions.
+
+Conversions are cached per string in a single size-bounded LRU cache, keyed
+on the input string, the converting function, and its options. Caching is
+disabled by default; enable it globally with :func:`enable_cache` or for a
+block of code with :func:`cache_enabled`.
+"""
+
+import inspect
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from typing import NamedTuple
+
+_DEFAULT_MAXSIZE = 65536
+
+type _Key = tuple[str, str, tuple[tuple[str, object], ...]]
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for the conversion cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class _LRUCache:
+    """Thread-safe, size-bounded least recently used string cache."""
+
+    __slots__ = ("_data", "_lock", "evictions", "hits", "maxsize", "misses")
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[_Key, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def info(self) -> CacheInfo:
+        """Return the current cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.maxsize,
+                len(self._data),
+            )
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def apply(
+        self,
+        func: Callable[..., list[str]],
+        x: list[str],
+        *,
+        name: str,
+        options: dict[str, object],
+    ) -> list[str]:
+        """Apply an element-wise batch function, serving repeats from the cache."""
+        opts = tuple(sorted(options.items()))
+        data = self._data
+        result: list[str] = []
+        missing: dict[str, list[int]] = {}
+        with self._lock:
+            for i, s in enumerate(x):
+                key = (s, name, opts)
+                value = data.get(key)
+                if value is not None:
+                    data.move_to_end(key)
+                    self.hits += 1
+                    result.append(value)
+                    continue
+                if s in missing:
+                    self.hits += 1
+                    missing[s].append(i)
+                else:
+                    self.misses += 1
+                    missing[s] = [i]
+                result.append(s)
+        if not missing:
+            return result
+        computed = func(list(missing), **options)
+        with self._lock:
+            for (s, indices), value in zip(missing.items(), computed, strict=True):
+                for i in indices:
+                    result[i] = value
+                data[(s, name, opts)] = value
+            overflow = len(data) - self.maxsize
+            for _ in range(max(overflow, 0)):
+                data.popitem(last=False)
+            self.evictions += max(overflow, 0)
+        return result
+
+
+_cache: _LRUCache | None = None
+
+
+def enable_cache(maxsize: int = _DEFAULT_MAXSIZE) -> None:
+    """Enable the conversion cache.
+
+    Replaces any active cache, discarding its entries and statistics.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached conversions. The least recently used entry
+        is evicted when the cache is full.
+    """
+    global _cache  # noqa: PLW0603
+    _cache = _LRUCache(maxsize)
+
+
+def disable_cache() -> None:
+    """Disable the conversion cache and discard its entries."""
+    global _cache  # noqa: PLW0603
+    _cache = None
+
+
+def clear_cache() -> None:
+    """Remove all cached conversions and reset the statistics."""
+    if _cache is not None:
+        _cache.clear()
+
+
+def cache_info() -> CacheInfo | None:
+    """Return statistics for the conversion cache.
+
+    Returns
+    -------
+    CacheInfo or None
+        Hit, miss and eviction counts along with the size limits, or ``None``
+        when caching is disabled.
+    """
+    return _cache.info() if _cache is not None else None
+
+
+@contextmanager
+def cache_enabled(maxsize: int = _DEFAULT_MAXSIZE) -> Iterator[None]:
+    """Enable a fresh conversion cache for the duration of a block.
+
+    The previously active cache (or disabled state) is restored on exit.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached conversions.
+
+    Yields
+    ------
+    None
+        Control returns to the block with caching enabled.
+
+    Examples
+    --------
+    >>> from syntactic import snake_case
+    >>> with cache_enabled(maxsize=1024):
+    ...     snake_case(["sampleID", "sampleID"])
+    ['sample_id', 'sample_id']
+    """
+    global _cache  # noqa: PLW0603
+    previous = _cache
+    _cache = _LRUCache(maxsize)
+    try:
+        yield
+    finally:
+        _cache = previous
+
+
+def _cache_enabled() -> bool:
+    """Check whether the conversion cache is enabled."""
+    return _cache is not None
+
+
+def _memoize(func: Callable[..., list[str]]) -> Callable[..., list[str]]:
+    """Cache an element-wise batch function on its string inputs.
+
+    The wrapped function must take a list of strings as its first argument
+    and options as keyword arguments, and map each input string to exactly
+    one output string independently of the others.
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+    defaults = {
+        param.name: param.default
+        for param in list(inspect.signature(func).parameters.values())[1:]
+        if param.default is not inspect.Parameter.empty
+    }
+
+    @wraps(func)
+    def wrapper(x: list[str], **options: object) -> list[str]:
+        cache = _cache
+        if cache is None:
+            return func(x, **options)
+        return cache.apply(func, x, name=name, options=defaults | options)
+
+    return wrapper
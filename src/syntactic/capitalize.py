@@ -1,6 +1,57 @@
 """Capitalize and sentence case functions."""
 
 import re
+import string
+
+# Batches are joined into a single string for capitalization, separated by a
+# NUL character that cannot otherwise occur in them.
+_SEPARATOR = "\0 "
+
+# Word starts to uppercase in ASCII strings, with a leading space.
+_WORD_STARTS = tuple((" " + c, " " + c.upper()) for c in string.ascii_lowercase)
+
+# Words kept as-is by sentence_case: all uppercase letters, numbers and
+# periods, or containing an uppercase letter that follows a letter, number or
+# period (e.g. "AIC", "nCount", "p.Value"). Matches whole space-delimited
+# words, anywhere in a string.
+_ACRONYM_WORD_PATTERN = re.compile(
+    r"(?<![^ ])(?:[.A-Z0-9]+\n?|[^ ]*?[.a-zA-Z0-9][A-Z][^ ]*)(?![^ ])"
+)
+
+
+def _capitalize_words(s: str, *, strict: bool) -> str:
+    """Capitalize each space-delimited word of a string."""
+    if s.isascii():
+        if strict:
+            return " ".join(map(str.capitalize, s.split(" ")))
+        s = " " + s
+        for lower, upper in _WORD_STARTS:
+            s = s.replace(lower, upper)
+        return s[1:]
+    if strict:
+        return " ".join([w[:1].upper() + w[1:].lower() for w in s.split(" ")])
+    return " ".join([w[:1].upper() + w[1:] for w in s.split(" ")])
+
+
+def _lower_words(s: str) -> str:
+    """Lowercase the space-delimited words of a string, except acronyms."""
+    lowered = s.lower()
+    if lowered == s:
+        return s
+    if not s.isascii():
+        # Lowercasing may change the length of non-ASCII strings.
+        return " ".join([w if _ACRONYM_WORD_PATTERN.match(w) else w.lower() for w in s.split(" ")])
+    # Copy acronyms back from the original, which has the same positions.
+    parts = []
+    pos = 0
+    for m in _ACRONYM_WORD_PATTERN.finditer(s):
+        parts.append(lowered[pos : m.start()])
+        parts.append(m[0])
+        pos = m.end()
+    if not parts:
+        return lowered
+    parts.append(lowered[pos:])
+    return "".join(parts)
 
 
 def capitalize(obj: str | list[str], strict: bool = False) -> list[str]:
@@ -10,22 +61,10 @@ def capitalize(obj: str | list[str], strict: bool = False) -> list[str]:
     """
     if isinstance(obj, str):
         obj = [obj]
-    result = []
-    for s in obj:
-        if not s:
-            result.append(s)
-            continue
-        words = s.split(" ")
-        out_words = []
-        for w in words:
-            if not w:
-                out_words.append(w)
-                continue
-            first = w[0].upper()
-            tail = w[1:].lower() if strict else w[1:]
-            out_words.append(first + tail)
-        result.append(" ".join(out_words))
-    return result
+    joined = _SEPARATOR.join(obj)
+    if joined.count("\0") == len(obj) - 1:
+        return _capitalize_words(joined, strict=strict).split(_SEPARATOR)
+    return [_capitalize_words(s, strict=strict) for s in obj]
 
 
 def sentence_case(obj: str | list[str], strict: bool = False) -> list[str]:
@@ -44,22 +83,10 @@ def sentence_case(obj: str | list[str], strict: bool = False) -> list[str]:
         if " " not in s:
             result.append(s)
             continue
-        words = s.split(" ")
+        first, _, rest = s.partition(" ")
         if strict:
             # In strict mode, first word: capitalize first letter, lowercase rest
-            first_word = words[0][0].upper() + words[0][1:].lower() if words[0] else ""
-            other_words = [w.lower() for w in words[1:]]
+            result.append(first[:1].upper() + first[1:].lower() + " " + rest.lower())
         else:
-            first_word = words[0][0].upper() + words[0][1:] if words[0] else ""
-            other_words = []
-            for word in words[1:]:
-                if (
-                    re.match(r"^[.A-Z0-9]+$", word)
-                    or re.search(r"[.a-z0-9][A-Z]", word)
-                    or re.search(r"[A-Z]{2}", word)
-                ):
-                    other_words.append(word)
-                else:
-                    other_words.append(word.lower())
-        result.append(" ".join([first_word, *other_words]))
+            result.append(first[:1].upper() + first[1:] + " " + _lower_words(rest))
     return result
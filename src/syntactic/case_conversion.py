@@ -1,99 +1,580 @@
 """Case conversion functions."""
 
-import re
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, overload
 
-from syntactic._engine import _syntactic
+from syntactic._compat import _is_arrow, _is_ndarray
+from syntactic._engine import (
+    _PREFIX_PATTERN,
+    _RENDERERS,
+    _fixed_point,
+    _sanitize_acronym,
+    _split_words,
+    _syntactic,
+    _tokenize,
+)
+from syntactic._factorize import _factorize, _factorized, _use_factorize
+from syntactic.cache import _cache_enabled, _memoize
+from syntactic.make_names import _name_pipeline
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from numpy.typing import NDArray
 
-def _camel_case(
+
+@_memoize
+def _convert_case(
     x: list[str],
-    format: str = "lower",
+    format: str = "snake",
     strict: bool = True,
     **kwargs: bool,
 ) -> list[str]:
-    """Internal camelCase conversion engine."""
-    assert format in ("lower", "upper")
-    x = _syntactic(x, **kwargs)
-    x = [s.replace("_", ".") for s in x]
-    if strict:
-        x = [s.lower() for s in x]
-    result = []
-    for item in x:
-        if format == "lower":
-            s = re.sub(r"^(\w+)\b", lambda m: m.group(1).lower(), item)
-        elif format == "upper":
-            s = re.sub(r"^([a-z])", lambda m: m.group(1).upper(), item)
-        else:
-            s = item
-        s = re.sub(r"([a-zA-Z])\.([0-9])", r"\1\2", s)
-        s = re.sub(r"\.([a-zA-Z])", lambda m: m.group(1).upper(), s)
-        if "." in s:
-            replacement = "x" if format == "lower" else "X"
-            s = s.replace(".", replacement)
-        result.append(s)
-    return result
+    """Internal case conversion engine.
+
+    Strings that are already in the requested format are passed through.
+    Each remaining string is tokenized once and rendered in the format.
+    """
+    match = _fixed_point(format, strict=strict, **kwargs)
+    fixed = [match(s) is not None for s in x]
+    if all(fixed):
+        return list(x)
+    render = _RENDERERS[format]
+    todo = [s for s, skip in zip(x, fixed, strict=True) if not skip]
+    converted = iter([render(_tokenize(s), strict) for s in _syntactic(todo, **kwargs)])
+    return [s if skip else next(converted) for s, skip in zip(x, fixed, strict=True)]
+
+
+class Converter:
+    """Reusable case converter with bound options.
+
+    Options are validated and bound once, so repeated calls skip argument
+    handling. A single string is converted directly and returned as a
+    string; batches return a list.
+
+    Parameters
+    ----------
+    format : str
+        Case format: one of ``"snake"``, ``"kebab"``, ``"dotted"``,
+        ``"screaming_snake"``, ``"camel"``, ``"upper_camel"`` or ``"train"``.
+    strict : bool
+        Lowercase acronyms in camelCase and Train-Case formats.
+    smart : bool
+        Replace symbols with words and standardize acronyms.
+    prefix : bool
+        Keep the ``X`` prefix added to names that start with a number.
+
+    Examples
+    --------
+    >>> to_snake = Converter("snake")
+    >>> to_snake("sampleID")
+    'sample_id'
+    >>> to_snake(["nCount", "G2M.Score"])
+    ['n_count', 'g2m_score']
+    """
+
+    __slots__ = ("_fixed", "_names", "_render", "format", "prefix", "smart", "strict")
+
+    def __init__(
+        self,
+        format: str = "snake",
+        *,
+        strict: bool = True,
+        smart: bool = True,
+        prefix: bool = True,
+    ) -> None:
+        if format not in _RENDERERS:
+            raise ValueError(f"Invalid format '{format}'. Must be one of: {', '.join(_RENDERERS)}")
+        self.format = format
+        self.strict = strict
+        self.smart = smart
+        self.prefix = prefix
+        self._names = _name_pipeline(False, smart)
+        self._render = _RENDERERS[format]
+        self._fixed = _fixed_point(format, strict=strict, smart=smart, prefix=prefix)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the converter."""
+        return (
+            f"Converter(format={self.format!r}, strict={self.strict!r}, "
+            f"smart={self.smart!r}, prefix={self.prefix!r})"
+        )
 
+    def _convert(self, s: str) -> str:
+        """Convert a single string, bypassing the batch engine."""
+        if self._fixed(s) is not None:
+            return s
+        names = self._names
+        s = names._finalize(names._stem(s))
+        if self.smart:
+            s = _sanitize_acronym(s.replace("'", ""))
+        if not self.prefix:
+            s = _PREFIX_PATTERN.sub(r"\1", s)
+        return self._render(_tokenize(_split_words(s)), self.strict)
 
+    @overload
+    def __call__(self, x: str) -> str: ...
+    @overload
+    def __call__(self, x: Iterable[str]) -> list[str]: ...
+    def __call__(self, x: str | Iterable[str]) -> str | list[str]:
+        """Convert a string, or each string in a batch."""
+        if isinstance(x, str):
+            # The batch engine is only needed to serve the conversion cache.
+            return self([x])[0] if _cache_enabled() else self._convert(x)
+        return _factorized(
+            _convert_case,
+            list(x),
+            factorize=None,
+            format=self.format,
+            strict=self.strict,
+            smart=self.smart,
+            prefix=self.prefix,
+        )
+
+
+@overload
 def camel_case(
     obj: str | list[str],
+    strict: bool = ...,
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> list[str]: ...
+@overload
+def camel_case(
+    obj: "NDArray[Any]",
+    strict: bool = ...,
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "NDArray[Any]": ...
+@overload
+def camel_case(
+    obj: "pa.Array | pa.ChunkedArray",
+    strict: bool = ...,
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "pa.Array | pa.ChunkedArray": ...
+def camel_case(
+    obj: "str | list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray",
     strict: bool = True,
     smart: bool = True,
     prefix: bool = True,
-) -> list[str]:
+    *,
+    factorize: bool | None = None,
+) -> "list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray":
     """Convert strings to lowerCamelCase."""
+    if _is_ndarray(obj):
+        from syntactic import _numpy  # noqa: PLC0415
+
+        return _numpy.camel_case(obj, format="camel", strict=strict, smart=smart, prefix=prefix)
+    if _is_arrow(obj):
+        from syntactic import _arrow  # noqa: PLC0415
+
+        return _arrow.camel_case(obj, format="camel", strict=strict, smart=smart, prefix=prefix)
     if isinstance(obj, str):
         obj = [obj]
-    return _camel_case(x=list(obj), format="lower", strict=strict, smart=smart, prefix=prefix)
+    return _factorized(
+        _convert_case,
+        list(obj),
+        factorize=factorize,
+        format="camel",
+        strict=strict,
+        smart=smart,
+        prefix=prefix,
+    )
 
 
+@overload
 def upper_camel_case(
     obj: str | list[str],
+    strict: bool = ...,
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> list[str]: ...
+@overload
+def upper_camel_case(
+    obj: "NDArray[Any]",
+    strict: bool = ...,
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "NDArray[Any]": ...
+@overload
+def upper_camel_case(
+    obj: "pa.Array | pa.ChunkedArray",
+    strict: bool = ...,
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "pa.Array | pa.ChunkedArray": ...
+def upper_camel_case(
+    obj: "str | list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray",
     strict: bool = True,
     smart: bool = True,
     prefix: bool = True,
-) -> list[str]:
+    *,
+    factorize: bool | None = None,
+) -> "list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray":
     """Convert strings to UpperCamelCase (PascalCase)."""
-    if isinstance(obj, str):
-        obj = [obj]
-    return _camel_case(x=list(obj), format="upper", strict=strict, smart=smart, prefix=prefix)
+    if _is_ndarray(obj):
+        from syntactic import _numpy  # noqa: PLC0415
 
+        return _numpy.camel_case(
+            obj, format="upper_camel", strict=strict, smart=smart, prefix=prefix
+        )
+    if _is_arrow(obj):
+        from syntactic import _arrow  # noqa: PLC0415
 
-def _snake_case(x: list[str], **kwargs: bool) -> list[str]:
-    """Internal snake_case conversion engine."""
-    x = _syntactic(x, **kwargs)
-    return [s.lower() for s in x]
+        return _arrow.camel_case(
+            obj, format="upper_camel", strict=strict, smart=smart, prefix=prefix
+        )
+    if isinstance(obj, str):
+        obj = [obj]
+    return _factorized(
+        _convert_case,
+        list(obj),
+        factorize=factorize,
+        format="upper_camel",
+        strict=strict,
+        smart=smart,
+        prefix=prefix,
+    )
 
 
+@overload
 def snake_case(
     obj: str | list[str],
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> list[str]: ...
+@overload
+def snake_case(
+    obj: "NDArray[Any]",
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "NDArray[Any]": ...
+@overload
+def snake_case(
+    obj: "pa.Array | pa.ChunkedArray",
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "pa.Array | pa.ChunkedArray": ...
+def snake_case(
+    obj: "str | list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray",
     smart: bool = True,
     prefix: bool = True,
-) -> list[str]:
+    *,
+    factorize: bool | None = None,
+) -> "list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray":
     """Convert strings to snake_case."""
+    if _is_ndarray(obj):
+        from syntactic import _numpy  # noqa: PLC0415
+
+        return _numpy.delimited_case(obj, sep="_", smart=smart, prefix=prefix)
+    if _is_arrow(obj):
+        from syntactic import _arrow  # noqa: PLC0415
+
+        return _arrow.delimited_case(obj, sep="_", smart=smart, prefix=prefix)
     if isinstance(obj, str):
         obj = [obj]
-    return _snake_case(x=list(obj), smart=smart, prefix=prefix)
+    return _factorized(
+        _convert_case,
+        list(obj),
+        factorize=factorize,
+        format="snake",
+        smart=smart,
+        prefix=prefix,
+    )
 
 
+@overload
 def dotted_case(
     obj: str | list[str],
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> list[str]: ...
+@overload
+def dotted_case(
+    obj: "NDArray[Any]",
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "NDArray[Any]": ...
+@overload
+def dotted_case(
+    obj: "pa.Array | pa.ChunkedArray",
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "pa.Array | pa.ChunkedArray": ...
+def dotted_case(
+    obj: "str | list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray",
     smart: bool = True,
     prefix: bool = True,
-) -> list[str]:
+    *,
+    factorize: bool | None = None,
+) -> "list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray":
     """Convert strings to dotted.case."""
+    if _is_ndarray(obj):
+        from syntactic import _numpy  # noqa: PLC0415
+
+        return _numpy.delimited_case(obj, sep=".", smart=smart, prefix=prefix)
+    if _is_arrow(obj):
+        from syntactic import _arrow  # noqa: PLC0415
+
+        return _arrow.delimited_case(obj, sep=".", smart=smart, prefix=prefix)
     if isinstance(obj, str):
         obj = [obj]
-    x = _snake_case(x=list(obj), smart=smart, prefix=prefix)
-    return [s.replace("_", ".") for s in x]
+    return _factorized(
+        _convert_case,
+        list(obj),
+        factorize=factorize,
+        format="dotted",
+        smart=smart,
+        prefix=prefix,
+    )
 
 
+@overload
 def kebab_case(
     obj: str | list[str],
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> list[str]: ...
+@overload
+def kebab_case(
+    obj: "NDArray[Any]",
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "NDArray[Any]": ...
+@overload
+def kebab_case(
+    obj: "pa.Array | pa.ChunkedArray",
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "pa.Array | pa.ChunkedArray": ...
+def kebab_case(
+    obj: "str | list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray",
     smart: bool = True,
     prefix: bool = True,
-) -> list[str]:
+    *,
+    factorize: bool | None = None,
+) -> "list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray":
     """Convert strings to kebab-case."""
+    if _is_ndarray(obj):
+        from syntactic import _numpy  # noqa: PLC0415
+
+        return _numpy.delimited_case(obj, sep="-", smart=smart, prefix=prefix)
+    if _is_arrow(obj):
+        from syntactic import _arrow  # noqa: PLC0415
+
+        return _arrow.delimited_case(obj, sep="-", smart=smart, prefix=prefix)
+    if isinstance(obj, str):
+        obj = [obj]
+    return _factorized(
+        _convert_case,
+        list(obj),
+        factorize=factorize,
+        format="kebab",
+        smart=smart,
+        prefix=prefix,
+    )
+
+
+@overload
+def screaming_snake_case(
+    obj: str | list[str],
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> list[str]: ...
+@overload
+def screaming_snake_case(
+    obj: "NDArray[Any]",
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "NDArray[Any]": ...
+@overload
+def screaming_snake_case(
+    obj: "pa.Array | pa.ChunkedArray",
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "pa.Array | pa.ChunkedArray": ...
+def screaming_snake_case(
+    obj: "str | list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray",
+    smart: bool = True,
+    prefix: bool = True,
+    *,
+    factorize: bool | None = None,
+) -> "list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray":
+    """Convert strings to SCREAMING_SNAKE_CASE."""
+    if _is_ndarray(obj):
+        from syntactic import _numpy  # noqa: PLC0415
+
+        return _numpy.convert_case(obj, format="screaming_snake", smart=smart, prefix=prefix)
+    if _is_arrow(obj):
+        from syntactic import _arrow  # noqa: PLC0415
+
+        return _arrow.convert_case(obj, format="screaming_snake", smart=smart, prefix=prefix)
+    if isinstance(obj, str):
+        obj = [obj]
+    return _factorized(
+        _convert_case,
+        list(obj),
+        factorize=factorize,
+        format="screaming_snake",
+        smart=smart,
+        prefix=prefix,
+    )
+
+
+@overload
+def train_case(
+    obj: str | list[str],
+    strict: bool = ...,
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> list[str]: ...
+@overload
+def train_case(
+    obj: "NDArray[Any]",
+    strict: bool = ...,
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "NDArray[Any]": ...
+@overload
+def train_case(
+    obj: "pa.Array | pa.ChunkedArray",
+    strict: bool = ...,
+    smart: bool = ...,
+    prefix: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "pa.Array | pa.ChunkedArray": ...
+def train_case(
+    obj: "str | list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray",
+    strict: bool = True,
+    smart: bool = True,
+    prefix: bool = True,
+    *,
+    factorize: bool | None = None,
+) -> "list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray":
+    """Convert strings to Train-Case.
+
+    Acronyms (e.g. "HTML") keep their case unless ``strict`` is set.
+    """
+    if _is_ndarray(obj):
+        from syntactic import _numpy  # noqa: PLC0415
+
+        return _numpy.convert_case(obj, format="train", strict=strict, smart=smart, prefix=prefix)
+    if _is_arrow(obj):
+        from syntactic import _arrow  # noqa: PLC0415
+
+        return _arrow.convert_case(obj, format="train", strict=strict, smart=smart, prefix=prefix)
+    if isinstance(obj, str):
+        obj = [obj]
+    return _factorized(
+        _convert_case,
+        list(obj),
+        factorize=factorize,
+        format="train",
+        strict=strict,
+        smart=smart,
+        prefix=prefix,
+    )
+
+
+def convert(
+    obj: str | list[str],
+    formats: Iterable[str],
+    strict: bool = True,
+    smart: bool = True,
+    prefix: bool = True,
+    *,
+    factorize: bool | None = None,
+) -> dict[str, list[str]]:
+    """Convert strings to several case formats in one pass.
+
+    Each string goes through the shared syntactic stage and tokenization
+    once, and is then rendered in every requested format.
+
+    Parameters
+    ----------
+    obj : str or list[str]
+        Strings to convert.
+    formats : Iterable[str]
+        Case formats to return: any of ``"snake"``, ``"kebab"``,
+        ``"dotted"``, ``"screaming_snake"``, ``"camel"``, ``"upper_camel"``
+        and ``"train"``.
+    strict : bool
+        Lowercase acronyms in camelCase and Train-Case formats.
+    smart : bool
+        Replace symbols with words and standardize acronyms.
+    prefix : bool
+        Keep the ``X`` prefix added to names that start with a number.
+    factorize : bool or None
+        Convert each distinct string once. Chosen automatically when
+        ``None``.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        Converted strings for each format, in the requested order.
+
+    Examples
+    --------
+    >>> convert(["sampleID"], formats=["snake", "camel", "kebab"])
+    {'snake': ['sample_id'], 'camel': ['sampleId'], 'kebab': ['sample-id']}
+    """
+    formats = list(dict.fromkeys(formats))
+    invalid = [f for f in formats if f not in _RENDERERS]
+    if invalid:
+        raise ValueError(f"Invalid format '{invalid[0]}'. Must be one of: {', '.join(_RENDERERS)}")
     if isinstance(obj, str):
         obj = [obj]
-    x = snake_case(obj, smart=smart, prefix=prefix)
-    return [s.replace("_", "-") for s in x]
+    x = list(obj)
+    codes = None
+    if _use_factorize(x, factorize):
+        codes, x = _factorize(x)
+    renderers = [_RENDERERS[f] for f in formats]
+    columns: list[list[str]] = [[] for _ in formats]
+    for s in _syntactic(x, smart=smart, prefix=prefix):
+        tokens = _tokenize(s)
+        for column, render in zip(columns, renderers, strict=True):
+            column.append(render(tokens, strict))
+    if codes is not None:
+        columns = [[column[i] for i in codes] for column in columns]
+    return dict(zip(formats, columns, strict=True))
@@ -2,6 +2,16 @@
 
 import re
 import unicodedata
+from collections.abc import Iterable
+from functools import cache
+from typing import TYPE_CHECKING, Any, overload
+
+from syntactic._compat import _is_arrow, _is_ndarray
+from syntactic._factorize import _factorize, _factorized, _use_factorize
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from numpy.typing import NDArray
 
 _GREEK_MAP: dict[str, str] = {
     "\u0391": "Alpha",
@@ -56,108 +66,304 @@ _GREEK_MAP: dict[str, str] = {
 }
 
 
-def _transliterate(s: str) -> str:
-    """Transliterate unicode characters to ASCII equivalents."""
-    s = s.replace("\u00b5", "u")
-    s = s.replace("\u03bc", "u")
-    s = s.replace("&#181;", "u")
+# Substitutions applied ahead of NFKD normalization. These take precedence
+# over the Greek map (e.g. lowercase mu transliterates to "u", not "mu").
+_SPECIAL_MAP: dict[str, str] = {
+    "\u00b5": "u",
+    "\u03bc": "u",
     # Multi-character substitutions not handled by NFKD.
-    s = s.replace("\u00c6", "AE")
-    s = s.replace("\u00e6", "ae")
-    s = s.replace("\u0152", "OE")
-    s = s.replace("\u0153", "oe")
-    s = s.replace("\u00de", "TH")
-    s = s.replace("\u00fe", "th")
-    s = s.replace("\u00df", "ss")
+    "\u00c6": "AE",
+    "\u00e6": "ae",
+    "\u0152": "OE",
+    "\u0153": "oe",
+    "\u00de": "TH",
+    "\u00fe": "th",
+    "\u00df": "ss",
     # Single-character substitutions not handled by NFKD.
-    s = s.replace("\u00d8", "O")
-    s = s.replace("\u00f8", "o")
-    s = s.replace("\u00d0", "D")
-    s = s.replace("\u00f0", "d")
-    s = s.replace("\u00d7", "*")
-    s = s.replace("\u00f7", "/")
-    for greek, ascii_name in _GREEK_MAP.items():
-        s = s.replace(greek, ascii_name)
-    normalized = unicodedata.normalize("NFKD", s)
-    result = ""
-    for char in normalized:
-        if ord(char) < 128:
-            result += char
-    return result
-
-
-def _make_names_r(names: list[str], unique: bool = True) -> list[str]:
-    """Emulate R's make.names behavior with allow_=TRUE."""
-    result = []
-    for name in names:
-        s = name
-        if s and (s[0].isdigit() or s[0] == "."):
-            s = "X" + s
-        if not s:
-            s = "X"
-        result.append(s)
-    if unique:
-        result = _make_unique(result)
-    return result
-
-
-def _make_unique(names: list[str]) -> list[str]:
-    """Make a list of names unique by appending numeric suffixes."""
-    seen: dict[str, int] = {}
-    result = []
-    for name in names:
-        if name in seen:
-            counter = seen[name]
+    "\u00d8": "O",
+    "\u00f8": "o",
+    "\u00d0": "D",
+    "\u00f0": "d",
+    "\u00d7": "*",
+    "\u00f7": "/",
+}
+
+
+class _TransliterationTable(dict[int, str]):
+    """Codepoint translation table for :meth:`str.translate`.
+
+    Precomputed entries cover the special cases and Greek letters. Any other
+    codepoint is resolved on first lookup to the ASCII residue of its NFKD
+    decomposition, and memoized.
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, key: int) -> str:
+        decomposed = unicodedata.normalize("NFKD", chr(key))
+        value = "".join(char for char in decomposed if ord(char) < 128)
+        self[key] = value
+        return value
+
+
+_TRANSLITERATION_TABLE = _TransliterationTable(
+    {ord(k): v for k, v in (_GREEK_MAP | _SPECIAL_MAP).items()}
+)
+
+
+def _transliterate(s: str) -> str:
+    """Transliterate unicode characters to ASCII equivalents."""
+    if "&#181;" in s:
+        s = s.replace("&#181;", "u")
+    if s.isascii():
+        return s
+    return s.translate(_TRANSLITERATION_TABLE)
+
+
+# Smart-mode substitutions, applied in order. Plain strings are literal
+# replacements; compiled patterns are regex substitutions.
+_SMART_RULES: tuple[tuple[str | re.Pattern[str], str], ...] = (
+    ("&", "_and_"),
+    ("+", "_plus_"),
+    (re.compile(r"\s-\s"), " "),
+    (re.compile(r"-\s"), "_minus_"),
+    (re.compile(r"^-(.+)$"), r"minus_\1"),
+    (re.compile(r"^(.+)-$"), r"\1_minus"),
+    ("/", "_slash_"),
+    ("%", "_percent_"),
+    ("*", "_times_"),
+    (re.compile(r"(\d),(\d)"), r"\1\2"),
+)
+
+_NON_ALNUM = re.compile(r"[^a-zA-Z0-9]")
+_MULTI_UNDERSCORE = re.compile(r"_{2,}")
+
+
+def _strip_underscore(s: str) -> str:
+    """Strip a single leading and a single trailing underscore."""
+    if s.startswith("_"):
+        s = s[1:]
+    if s.endswith("_"):
+        s = s[:-1]
+    return s
+
+
+class _Namespace:
+    """Set of claimed names with a per-base next-suffix index.
+
+    A duplicate of ``name`` is renamed to ``f"{name}_{n}"`` for the smallest
+    unclaimed ``n`` at or above the base's recorded next suffix, so each
+    suffix candidate is probed at most once per base.
+    """
+
+    __slots__ = ("next_suffix", "taken")
+
+    def __init__(self) -> None:
+        self.taken: set[str] = set()
+        self.next_suffix: dict[str, int] = {}
+
+    def claim(self, name: str) -> str:
+        """Return a unique variant of a name and mark it as taken."""
+        taken = self.taken
+        if name not in taken:
+            taken.add(name)
+            return name
+        counter = self.next_suffix.get(name, 1)
+        new_name = f"{name}_{counter}"
+        while new_name in taken:
+            counter += 1
             new_name = f"{name}_{counter}"
-            while new_name in seen:
-                counter += 1
-                new_name = f"{name}_{counter}"
-            seen[name] = counter + 1
-            seen[new_name] = 1
-            result.append(new_name)
-        else:
-            seen[name] = 1
-            result.append(name)
-    return result
+        self.next_suffix[name] = counter + 1
+        taken.add(new_name)
+        return new_name
+
+
+class NamePipeline:
+    """Compiled :func:`make_names` pipeline for a fixed option set.
 
+    All stages (transliteration, smart substitutions, character replacement,
+    ``X`` prefixing, uniquification, and underscore cleanup) run for each
+    string in a single pass, writing into one output list.
 
+    Parameters
+    ----------
+    unique : bool
+        Append numeric suffixes so that the returned names are unique.
+    smart : bool
+        Replace symbols such as ``&``, ``+``, ``/`` and ``%`` with words.
+
+    Examples
+    --------
+    >>> pipeline = NamePipeline(unique=False, smart=True)
+    >>> pipeline(["%GC", "a+b"])
+    ['percent_GC', 'a_plus_b']
+    """
+
+    __slots__ = ("_rules", "smart", "unique")
+
+    def __init__(self, unique: bool = True, smart: bool = False) -> None:
+        self.unique = unique
+        self.smart = smart
+        self._rules = _SMART_RULES if smart else ()
+
+    def __repr__(self) -> str:
+        """Return the string representation of the pipeline."""
+        return f"NamePipeline(unique={self.unique!r}, smart={self.smart!r})"
+
+    def _stem(self, s: str) -> str:
+        """Process a string up to (but excluding) the uniqueness stage."""
+        assert len(s) > 0, "All strings must be non-empty."
+        s = _transliterate(s)
+        for pattern, repl in self._rules:
+            if isinstance(pattern, str):
+                if pattern in s:
+                    s = s.replace(pattern, repl)
+            else:
+                s = pattern.sub(repl, s)
+        # Replace all non-alphanumeric characters with underscore.
+        if not s.isalnum():
+            s = _NON_ALNUM.sub("_", s)
+        # Strip leading/trailing underscores.
+        s = _strip_underscore(s)
+        # Add X prefix where needed (emulates make.names with allow_=TRUE).
+        if not s:
+            return "X"
+        if s[0].isdigit():
+            return "X" + s
+        return s
+
+    @staticmethod
+    def _finalize(s: str) -> str:
+        """Collapse repeated underscores and strip them from the ends."""
+        if "_" not in s:
+            return s
+        return _strip_underscore(_MULTI_UNDERSCORE.sub("_", s))
+
+    def _apply(self, x: Iterable[str], namespace: _Namespace | None) -> list[str]:
+        """Apply the pipeline, claiming names from ``namespace`` if given."""
+        stem = self._stem
+        finalize = self._finalize
+        if namespace is None:
+            return [finalize(stem(s)) for s in x]
+        claim = namespace.claim
+        return [finalize(claim(stem(s))) for s in x]
+
+    def __call__(self, x: Iterable[str]) -> list[str]:
+        """Apply the pipeline to each string in ``x``."""
+        return self._apply(x, _Namespace() if self.unique else None)
+
+
+class UniqueNamer:
+    """Persistent namespace for making names unique across batches.
+
+    Each call applies :func:`make_names` with ``unique=True`` to a batch of
+    strings while remembering every name issued so far, so that names stay
+    unique across calls without reprocessing earlier batches. Appending
+    batches produces the same names as a single call on their concatenation.
+
+    Parameters
+    ----------
+    smart : bool
+        Replace symbols such as ``&``, ``+``, ``/`` and ``%`` with words.
+
+    Examples
+    --------
+    >>> namer = UniqueNamer()
+    >>> namer(["sample 1", "sample 1"])
+    ['sample_1', 'sample_1_1']
+    >>> namer(["sample 1"])
+    ['sample_1_2']
+    """
+
+    __slots__ = ("_namespace", "_pipeline")
+
+    def __init__(self, smart: bool = False) -> None:
+        self._pipeline = _name_pipeline(True, smart)
+        self._namespace = _Namespace()
+
+    def __repr__(self) -> str:
+        """Return the string representation of the namer."""
+        return f"UniqueNamer(smart={self._pipeline.smart!r}, size={len(self)})"
+
+    def __len__(self) -> int:
+        """Return the number of names claimed so far."""
+        return len(self._namespace.taken)
+
+    def __call__(self, x: Iterable[str] | str) -> list[str]:
+        """Make a batch of names, unique with respect to all earlier batches."""
+        if isinstance(x, str):
+            x = [x]
+        return self._pipeline._apply(x, self._namespace)
+
+    def reset(self) -> None:
+        """Forget all previously issued names."""
+        self._namespace = _Namespace()
+
+
+@cache
+def _name_pipeline(unique: bool, smart: bool) -> NamePipeline:
+    """Return the shared pipeline for an option set."""
+    return NamePipeline(unique=unique, smart=smart)
+
+
+@overload
 def make_names(
     obj: list[str] | str,
+    unique: bool = ...,
+    smart: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> list[str]: ...
+@overload
+def make_names(
+    obj: "NDArray[Any]",
+    unique: bool = ...,
+    smart: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "NDArray[Any]": ...
+@overload
+def make_names(
+    obj: "pa.Array | pa.ChunkedArray",
+    unique: bool = ...,
+    smart: bool = ...,
+    *,
+    factorize: bool | None = ...,
+) -> "pa.Array | pa.ChunkedArray": ...
+def make_names(
+    obj: "list[str] | str | NDArray[Any] | pa.Array | pa.ChunkedArray",
     unique: bool = True,
     smart: bool = False,
-) -> list[str]:
+    *,
+    factorize: bool | None = None,
+) -> "list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray":
     """Make syntactically valid names out of character vectors.
 
-    Emulates R's syntactic::makeNames() behavior.
+    Emulates R's syntactic::makeNames() behavior. NumPy string arrays are
+    converted to arrays of the same shape and string dtype.
+
+    With ``factorize=True``, each distinct string of a list is converted
+    once and the results are scattered back to every occurrence; with
+    ``factorize=None`` this is chosen automatically for repetitive input.
     """
+    if _is_ndarray(obj):
+        from syntactic import _numpy  # noqa: PLC0415
+
+        return _numpy.make_names(obj, unique=unique, smart=smart)
+    if _is_arrow(obj):
+        from syntactic import _arrow  # noqa: PLC0415
+
+        return _arrow.make_names(obj, unique=unique, smart=smart)
     if isinstance(obj, str):
         obj = [obj]
     x = list(obj)
-    assert all(len(s) > 0 for s in x), "All strings must be non-empty."
-    x = [_transliterate(s) for s in x]
-    if smart:
-        result = []
-        for item in x:
-            s = re.sub(r"&", "_and_", item)
-            s = re.sub(r"\+", "_plus_", s)
-            s = re.sub(r"\s-\s", " ", s)
-            s = re.sub(r"-\s", "_minus_", s)
-            s = re.sub(r"^-(.+)$", r"minus_\1", s)
-            s = re.sub(r"^(.+)-$", r"\1_minus", s)
-            s = re.sub(r"/", "_slash_", s)
-            s = re.sub(r"%", "_percent_", s)
-            s = s.replace("*", "_times_")
-            s = re.sub(r"(\d),(\d)", r"\1\2", s)
-            result.append(s)
-        x = result
-    # Replace all non-alphanumeric characters with underscore.
-    x = [re.sub(r"[^a-zA-Z0-9]", "_", s) for s in x]
-    # Strip leading/trailing underscores.
-    x = [re.sub(r"(^_|_$)", "", s) for s in x]
-    # Add X prefix where needed (emulates make.names with allow_=TRUE).
-    x = _make_names_r(x, unique=unique)
-    # Collapse multiple underscores.
-    x = [re.sub(r"_+", "_", s) for s in x]
-    # Strip leading/trailing underscores again.
-    x = [re.sub(r"(^_|_$)", "", s) for s in x]
-    return x
+    pipeline = _name_pipeline(unique, smart)
+    if not unique:
+        return _factorized(pipeline, x, factorize=factorize)
+    if not _use_factorize(x, factorize):
+        return pipeline(x)
+    # Stems are computed per distinct string, but suffixes are claimed in order.
+    codes, uniques = _factorize(x)
+    stems = [pipeline._stem(s) for s in uniques]
+    claim = _Namespace().claim
+    return [pipeline._finalize(claim(stems[i])) for i in codes]
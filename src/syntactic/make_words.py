@@ -1,41 +1,81 @@
 """Make human-readable words, labels, and titles from variable names."""
 
 import re
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, overload
 
-from syntactic._engine import _syntactic
+from syntactic._compat import _is_arrow, _is_ndarray
+from syntactic._engine import _render_words, _syntactic, _tokenize
+from syntactic._factorize import _factorize, _factorized, _use_factorize
+from syntactic.cache import _memoize
 from syntactic.capitalize import sentence_case
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from numpy.typing import NDArray
 
-def make_words(obj: str | list[str]) -> list[str]:
+
+_WHITESPACE_PATTERN = re.compile(r"\s")
+
+
+@_memoize
+def _make_words(x: list[str]) -> list[str]:
+    """Internal human-readable words conversion engine."""
+    spaced = [_WHITESPACE_PATTERN.search(s) is not None for s in x]
+    converted = iter(_syntactic([s for s, skip in zip(x, spaced, strict=True) if not skip]))
+    return [
+        s if skip else _render_words(_tokenize(next(converted)))
+        for s, skip in zip(x, spaced, strict=True)
+    ]
+
+
+@overload
+def make_words(obj: str | list[str], *, factorize: bool | None = ...) -> list[str]: ...
+@overload
+def make_words(
+    obj: "NDArray[Any]",
+    *,
+    factorize: bool | None = ...,
+) -> "NDArray[Any]": ...
+@overload
+def make_words(
+    obj: "pa.Array | pa.ChunkedArray",
+    *,
+    factorize: bool | None = ...,
+) -> "pa.Array | pa.ChunkedArray": ...
+def make_words(
+    obj: "str | list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray",
+    *,
+    factorize: bool | None = None,
+) -> "list[str] | NDArray[Any] | pa.Array | pa.ChunkedArray":
     """Convert variable names to human-readable word strings.
 
     Strings that already contain spaces are returned unmodified.
     """
+    if _is_ndarray(obj):
+        from syntactic import _numpy  # noqa: PLC0415
+
+        return _numpy.make_words(obj)
+    if _is_arrow(obj):
+        from syntactic import _arrow  # noqa: PLC0415
+
+        return _arrow.make_words(obj)
     if isinstance(obj, str):
         obj = [obj]
-    result = []
-    for s in obj:
-        if re.search(r"\s", s):
-            result.append(s)
-            continue
-        processed = _syntactic([s])[0]
-        processed = re.sub(r"[_.]+", " ", processed)
-        # Convert single uppercase letters to lowercase.
-        processed = re.sub(
-            r"\b([A-Z])\b",
-            lambda m: m.group(1).lower(),
-            processed,
-        )
-        # Convert capitalized words (not all-caps acronyms) to lowercase.
-        processed = re.sub(
-            r"\b([A-Z][a-z0-9]+)\b",
-            lambda m: m.group(1).lower(),
-            processed,
-        )
-        # Include period for versus.
-        processed = re.sub(r"\b(v|vs)\b", r"\1.", processed)
-        result.append(processed)
-    return result
+    return _factorized(_make_words, list(obj), factorize=factorize)
+
+
+def _label(words: list[str]) -> list[str]:
+    """Capitalize the first letter of each string."""
+    return [w[:1].upper() + w[1:] for w in words]
+
+
+# Label kinds derived from the output of make_words.
+_LABELERS: dict[str, Callable[[list[str]], list[str]]] = {
+    "words": list,
+    "title": sentence_case,
+    "label": _label,
+}
 
 
 def make_title(obj: str | list[str]) -> list[str]:
@@ -56,11 +96,54 @@ def make_label(obj: str | list[str]) -> list[str]:
     """
     if isinstance(obj, str):
         obj = [obj]
-    words_list = make_words(obj)
-    result = []
-    for w in words_list:
-        if w:
-            result.append(w[0].upper() + w[1:])
-        else:
-            result.append(w)
-    return result
+    return _label(make_words(obj))
+
+
+def make_labels(
+    obj: str | list[str],
+    kinds: Iterable[str] = ("words", "title", "label"),
+    *,
+    factorize: bool | None = None,
+) -> dict[str, list[str]]:
+    """Make several kinds of human-readable labels in one pass.
+
+    The words of each string are computed once and shared by every
+    requested kind.
+
+    Parameters
+    ----------
+    obj : str or list[str]
+        Variable names to convert.
+    kinds : Iterable[str]
+        Labels to return: any of ``"words"`` (as in :func:`make_words`),
+        ``"title"`` (as in :func:`make_title`) and ``"label"`` (as in
+        :func:`make_label`).
+    factorize : bool or None
+        Convert each distinct string once. Chosen automatically when
+        ``None``.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        Labels of each kind, in the requested order.
+
+    Examples
+    --------
+    >>> make_labels(["nGene"])
+    {'words': ['n gene'], 'title': ['N gene'], 'label': ['N gene']}
+    """
+    kinds = list(dict.fromkeys(kinds))
+    invalid = [k for k in kinds if k not in _LABELERS]
+    if invalid:
+        raise ValueError(f"Invalid kind '{invalid[0]}'. Must be one of: {', '.join(_LABELERS)}")
+    if isinstance(obj, str):
+        obj = [obj]
+    x = list(obj)
+    codes = None
+    if _use_factorize(x, factorize):
+        codes, x = _factorize(x)
+    words = _make_words(x)
+    columns = [_LABELERS[k](words) for k in kinds]
+    if codes is not None:
+        columns = [[column[i] for i in codes] for column in columns]
+    return dict(zip(kinds, columns, strict=True))
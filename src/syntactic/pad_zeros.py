@@ -1,49 +1,244 @@
 """Autopad zeros for consistent string sorting."""
 
 import re
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, NamedTuple, overload
 
+from syntactic._compat import _is_ndarray, _is_pandas
 
-def autopad_zeros(obj: int | str | list[int] | list[str]) -> list[str]:
-    """Automatically pad numbers with leading zeros for consistent sorting."""
-    if isinstance(obj, int):
-        return autopad_zeros([str(obj)])
-    if isinstance(obj, str):
-        obj = [obj]
-    if all(isinstance(v, int) for v in obj):
-        return autopad_zeros([str(v) for v in obj])
-    x = [str(v) for v in obj]
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
-    int_pattern = r"^([0-9]+)$"
-    left_pattern = r"^([0-9]+)(.+)$"
-    right_pattern = r"^(.*[^0-9]+)([0-9]+)$"
+# Integers, numbers followed by a stem, and stems followed by a number.
+_INT_PATTERN = re.compile(r"([0-9]+)$")
+_LEFT_PATTERN = re.compile(r"([0-9]+)(.+)$")
+_RIGHT_PATTERN = re.compile(r"(.*[^0-9]+)([0-9]+)$")
 
-    is_int = all(re.match(int_pattern, s) for s in x)
-    is_left = all(re.match(left_pattern, s) for s in x)
-    is_right = all(re.match(right_pattern, s) for s in x)
+_INT = "int"
+_LEFT = "left"
+_RIGHT = "right"
 
+# Runs of digits, kept by re.split at the odd positions of the result.
+_DIGITS_PATTERN = re.compile(r"([0-9]+)")
+# Number of strings whose sort keys are built from one joined string.
+_KEY_CHUNK_SIZE = 65536
+
+
+class _Padding(NamedTuple):
+    """Padding shared by all strings of an input."""
+
+    # One of _INT, _LEFT and _RIGHT, or None to leave the strings unchanged.
+    kind: str | None
+    width: int
+    # Number and stem matches of each string, for the left and right kinds.
+    matches: list[re.Match[str]]
+
+
+def _scan(x: Iterable[str], *, keep: bool = True) -> _Padding:
+    """Classify strings for zero padding in a single pass.
+
+    Each pattern is matched until the first string that it rejects, while
+    tracking the widest number. With ``keep=False``, matches are not stored,
+    so the input can be streamed.
+    """
+    is_int = is_left = is_right = True
+    any_match = False
+    int_width = left_width = right_width = 0
+    lefts: list[re.Match[str]] = []
+    rights: list[re.Match[str]] = []
+    for s in x:
+        match = False
+        if is_int:
+            if _INT_PATTERN.match(s):
+                int_width = max(int_width, len(s))
+                match = True
+            else:
+                is_int = False
+        if is_left:
+            m = _LEFT_PATTERN.match(s)
+            if m is None:
+                is_left = False
+                lefts.clear()
+            else:
+                left_width = max(left_width, len(m[1]))
+                match = True
+                if keep:
+                    lefts.append(m)
+        if is_right:
+            m = _RIGHT_PATTERN.match(s)
+            if m is None:
+                is_right = False
+                rights.clear()
+            else:
+                right_width = max(right_width, len(m[2]))
+                match = True
+                if keep:
+                    rights.append(m)
+        if not any_match:
+            any_match = match or any(
+                p.match(s) for p in (_INT_PATTERN, _LEFT_PATTERN, _RIGHT_PATTERN)
+            )
     if is_int:
-        width = max(len(s) for s in x)
+        return _Padding(_INT, int_width, [])
+    if is_left:
+        return _Padding(_LEFT, left_width, lefts)
+    if is_right:
+        return _Padding(_RIGHT, right_width, rights)
+    if any_match:
+        raise ValueError("Partial padding match detected.")
+    return _Padding(None, 0, [])
+
+
+def _pad(s: str, kind: str | None, width: int) -> str:
+    """Pad the number of a string, as classified by :func:`_scan`."""
+    if kind == _INT:
+        return s.zfill(width)
+    if kind == _LEFT:
+        m = _LEFT_PATTERN.match(s)
+        assert m is not None, "Input changed after classification."
+        return m[1].zfill(width) + m[2]
+    if kind == _RIGHT:
+        m = _RIGHT_PATTERN.match(s)
+        assert m is not None, "Input changed after classification."
+        return m[1] + m[2].zfill(width)
+    return s
+
+
+def _padded(x: list[str], padding: _Padding) -> list[str]:
+    """Pad strings from the matches kept by :func:`_scan`."""
+    kind, width, matches = padding
+    if kind == _INT:
         return [s.zfill(width) for s in x]
-    elif is_left and not is_int:
-        left_matches = [re.match(left_pattern, s) for s in x]
-        assert all(m is not None for m in left_matches)
-        nums = [m.group(1) for m in left_matches if m is not None]
-        stems = [m.group(2) for m in left_matches if m is not None]
-        width = max(len(n) for n in nums)
-        padded = [n.zfill(width) for n in nums]
-        return [p + s for p, s in zip(padded, stems, strict=False)]
-    elif is_right:
-        right_matches = [re.match(right_pattern, s) for s in x]
-        assert all(m is not None for m in right_matches)
-        stems = [m.group(1) for m in right_matches if m is not None]
-        nums = [m.group(2) for m in right_matches if m is not None]
-        width = max(len(n) for n in nums)
-        padded = [n.zfill(width) for n in nums]
-        return [s + p for s, p in zip(stems, padded, strict=False)]
-    else:
-        has_int = any(re.match(int_pattern, s) for s in x)
-        has_left = any(re.match(left_pattern, s) for s in x)
-        has_right = any(re.match(right_pattern, s) for s in x)
-        if has_int or has_left or has_right:
-            raise ValueError("Partial padding match detected.")
-        return list(x)
+    if kind == _LEFT:
+        return [m[1].zfill(width) + m[2] for m in matches]
+    if kind == _RIGHT:
+        return [m[1] + m[2].zfill(width) for m in matches]
+    return x
+
+
+@overload
+def autopad_zeros(obj: int | str | list[int] | list[str]) -> list[str]: ...
+@overload
+def autopad_zeros(obj: "NDArray[Any]") -> "NDArray[Any]": ...
+def autopad_zeros(
+    obj: "int | str | list[int] | list[str] | NDArray[Any]",
+) -> "list[str] | NDArray[Any]":
+    """Automatically pad numbers with leading zeros for consistent sorting.
+
+    NumPy integer arrays, and pandas integer series and indexes, are padded
+    with vectorized string operations.
+    """
+    if _is_ndarray(obj):
+        from syntactic import _numpy  # noqa: PLC0415
+
+        return _numpy.autopad_zeros(obj)
+    if _is_pandas(obj) and obj.dtype.kind in "iu" and not obj.hasnans:
+        from syntactic import _numpy  # noqa: PLC0415
+
+        return _numpy.autopad_zeros(obj.to_numpy()).tolist()
+    values = [obj] if isinstance(obj, int | str) else list(obj)
+    if values and all(type(v) is int and v >= 0 for v in values):
+        width = len(str(max(values)))
+        return [f"{v:0{width}d}" for v in values]
+    x = [str(v) for v in values]
+    return _padded(x, _scan(x))
+
+
+def natural_sort_key(s: str) -> tuple[str | tuple[int, str], ...]:
+    """Return a key that sorts strings with their numbers in numeric order.
+
+    Text and runs of digits alternate in the key, starting and ending with
+    text (which may be empty), so keys of any two strings are comparable.
+    Each run of digits is keyed on its number of significant digits, then
+    on the digits themselves, so numbers of any length compare exactly.
+
+    Examples
+    --------
+    >>> sorted(["sample_10", "sample_2", "sample_1"], key=natural_sort_key)
+    ['sample_1', 'sample_2', 'sample_10']
+    """
+    parts: list[str | tuple[int, str]] = list(_DIGITS_PATTERN.split(s))
+    stripped = [d.lstrip("0") for d in parts[1::2]]
+    parts[1::2] = [(len(d), d) for d in stripped]
+    return tuple(parts)
+
+
+def _encode_number(digits: str) -> str:
+    """Encode a run of digits as text that sorts in numeric order.
+
+    The encoding sorts before any other character, then by number of
+    significant digits, then by the digits themselves.
+    """
+    digits = digits.lstrip("0")
+    return "\0" + chr(0x20 + len(digits)) + digits
+
+
+def _encode_key(s: str) -> str:
+    """Encode the natural sort key of a string as a single string."""
+    parts = _DIGITS_PATTERN.split(s)
+    parts[1::2] = map(_encode_number, parts[1::2])
+    return "".join(parts)
+
+
+def _natural_keys(x: list[str]) -> list[str] | list[tuple[str | tuple[int, str], ...]]:
+    """Return natural sort keys of strings, as strings where possible.
+
+    String keys compare in the same order as :func:`natural_sort_key`, but
+    sort several times faster. Each chunk of strings is joined and split
+    into digit runs once. Inputs containing NUL characters, which string
+    keys cannot represent, get tuple keys instead.
+    """
+    keys: list[str] = []
+    for start in range(0, len(x), _KEY_CHUNK_SIZE):
+        chunk = x[start : start + _KEY_CHUNK_SIZE]
+        joined = "\n".join(chunk)
+        if "\0" in joined:
+            return [natural_sort_key(s) for s in x]
+        if joined.count("\n") == len(chunk) - 1:
+            parts = _DIGITS_PATTERN.split(joined)
+            parts[1::2] = map(_encode_number, parts[1::2])
+            keys.extend("".join(parts).split("\n"))
+        else:
+            keys.extend(map(_encode_key, chunk))
+    return keys
+
+
+@overload
+def natural_argsort(obj: Iterable[str] | Iterable[int]) -> list[int]: ...
+@overload
+def natural_argsort(obj: "NDArray[Any]") -> "NDArray[np.intp]": ...
+def natural_argsort(
+    obj: "Iterable[str] | Iterable[int] | NDArray[Any]",
+) -> "list[int] | NDArray[np.intp]":
+    """Return the permutation that sorts strings in natural order.
+
+    Numbers within the strings are compared numerically, so that
+    ``"sample_2"`` sorts before ``"sample_10"``. Unlike
+    :func:`autopad_zeros`, the strings need not share a pattern, and no
+    padded strings are made. The sort is stable.
+
+    Parameters
+    ----------
+    obj : Iterable[str] or Iterable[int] or numpy.ndarray
+        Strings to sort. NumPy arrays must be one-dimensional.
+
+    Returns
+    -------
+    list[int] or numpy.ndarray
+        Indices that sort the input, as an integer array for array input.
+
+    Examples
+    --------
+    >>> x = ["sample_10", "sample_2", "control", "sample_1"]
+    >>> [x[i] for i in natural_argsort(x)]
+    ['control', 'sample_1', 'sample_2', 'sample_10']
+    """
+    if _is_ndarray(obj):
+        import numpy as np  # noqa: PLC0415
+
+        if obj.ndim != 1:
+            raise ValueError("Only one-dimensional arrays can be sorted.")
+        return np.array(natural_argsort(obj.tolist()), dtype=np.intp)
+    keys = _natural_keys(list(map(str, obj)))
+    return sorted(range(len(keys)), key=keys.__getitem__)
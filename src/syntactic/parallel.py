@@ -0,0 +1,311 @@
+"""Process-pool batch execution of the syntactic naming functions.
+
+Inputs are split into chunks that are converted concurrently by a pool of
+worker processes. Strings travel to and from the workers as UTF-8 encoded
+:mod:`multiprocessing.shared_memory` buffers rather than pickled lists, so
+per-chunk transfer costs one buffer name in each direction. Output order
+always matches input order.
+"""
+
+from array import array
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import accumulate, pairwise
+from math import ceil
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from types import TracebackType
+from typing import Self
+
+from syntactic.case_conversion import (
+    camel_case,
+    dotted_case,
+    kebab_case,
+    snake_case,
+    upper_camel_case,
+)
+from syntactic.make_names import _name_pipeline, _Namespace, make_names
+from syntactic.make_words import make_words
+
+# Lone surrogates (e.g. undecodable file names) must survive the round trip.
+_ERRORS = "surrogatepass"
+_OFFSET_SIZE = array("q").itemsize
+_MIN_CHUNK_SIZE = 4096
+_CHUNKS_PER_WORKER = 4
+# Forking a multi-threaded parent (e.g. after importing pyarrow) can deadlock.
+_START_METHOD = "forkserver" if "forkserver" in get_all_start_methods() else None
+
+
+def _pack(x: list[str]) -> SharedMemory:
+    """Write strings into a new shared memory block.
+
+    The block holds ``len(x) + 1`` int64 byte offsets followed by the
+    concatenated UTF-8 encoded strings.
+    """
+    encoded = [s.encode("utf-8", _ERRORS) for s in x]
+    offsets = array("q", accumulate(map(len, encoded), initial=0))
+    header = len(offsets) * _OFFSET_SIZE
+    shm = SharedMemory(create=True, size=max(header + offsets[-1], 1))
+    shm.buf[:header] = offsets.tobytes()
+    shm.buf[header : header + offsets[-1]] = b"".join(encoded)
+    return shm
+
+
+def _unpack(shm: SharedMemory, *, size: int, start: int, stop: int) -> list[str]:
+    """Read strings ``start`` to ``stop`` from a block of ``size`` strings."""
+    header = (size + 1) * _OFFSET_SIZE
+    with shm.buf[:header].cast("q") as offsets:
+        bounds = offsets[start : stop + 1].tolist()
+    data = bytes(shm.buf[header + bounds[0] : header + bounds[-1]])
+    base = bounds[0]
+    return [data[i - base : j - base].decode("utf-8", _ERRORS) for i, j in pairwise(bounds)]
+
+
+def _run_chunk(
+    func: Callable[..., list[str]],
+    name: str,
+    *,
+    size: int,
+    start: int,
+    stop: int,
+    kwargs: dict[str, bool],
+) -> str:
+    """Convert one chunk of a shared input block in a worker process.
+
+    Returns the name of a new shared memory block holding the output, which
+    the parent process reads and unlinks.
+    """
+    shm = SharedMemory(name=name)
+    try:
+        x = _unpack(shm, size=size, start=start, stop=stop)
+    finally:
+        shm.close()
+    out = _pack(func(x, **kwargs))
+    out.close()
+    return out.name
+
+
+def _collect(name: str, size: int) -> list[str]:
+    """Read and release an output block written by a worker."""
+    shm = SharedMemory(name=name)
+    try:
+        return _unpack(shm, size=size, start=0, stop=size)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _discard(name: str) -> None:
+    """Release an output block written by a worker without reading it."""
+    shm = SharedMemory(name=name)
+    shm.close()
+    shm.unlink()
+
+
+def _make_stems(x: list[str], *, smart: bool) -> list[str]:
+    """Run the make_names stages that precede uniquification."""
+    pipeline = _name_pipeline(False, smart)
+    return [pipeline._stem(s) for s in x]
+
+
+class BatchExecutor:
+    """Convert large string vectors across a pool of worker processes.
+
+    Inputs that fit in a single chunk are converted in the calling process.
+    The pool is started on first use and reused until :meth:`shutdown`, or
+    the end of a ``with`` block.
+
+    Parameters
+    ----------
+    workers : int or None
+        Number of worker processes. Defaults to the number of CPUs.
+    chunk_size : int or None
+        Number of strings converted per task. By default, chunks are sized so
+        that each worker receives several tasks, with a lower bound that keeps
+        scheduling overhead small.
+
+    Examples
+    --------
+    >>> with BatchExecutor(workers=2) as executor:
+    ...     executor.snake_case(["sampleID", "nCount RNA"])
+    ['sample_id', 'n_count_rna']
+    """
+
+    __slots__ = ("_pool", "chunk_size", "workers")
+
+    def __init__(self, workers: int | None = None, *, chunk_size: int | None = None) -> None:
+        if workers is None:
+            workers = cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be a positive integer.")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._pool: Executor | None = None
+
+    def __repr__(self) -> str:
+        """Return the string representation of the executor."""
+        return f"BatchExecutor(workers={self.workers!r}, chunk_size={self.chunk_size!r})"
+
+    def __enter__(self) -> Self:
+        """Return the executor for use in a ``with`` block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Shut down the worker pool."""
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool, if started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _chunk_size(self, size: int) -> int:
+        """Return the number of strings per task for an input size."""
+        if self.chunk_size is not None:
+            return self.chunk_size
+        return max(ceil(size / (self.workers * _CHUNKS_PER_WORKER)), _MIN_CHUNK_SIZE)
+
+    def map(
+        self,
+        func: Callable[..., list[str]],
+        x: Iterable[str] | str,
+        **kwargs: bool,
+    ) -> list[str]:
+        """Apply an element-wise batch naming function in parallel.
+
+        Parameters
+        ----------
+        func : Callable
+            Module-level function mapping a list of strings to a list of
+            strings of the same length, one output per input.
+        x : Iterable[str] or str
+            Strings to convert.
+        **kwargs
+            Options passed to ``func``.
+
+        Returns
+        -------
+        list[str]
+            Converted strings, in input order.
+        """
+        x = [x] if isinstance(x, str) else list(x)
+        size = len(x)
+        chunk_size = self._chunk_size(size)
+        if self.workers == 1 or size <= chunk_size:
+            return func(x, **kwargs)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=get_context(_START_METHOD),
+            )
+        shm = _pack(x)
+        futures: list[Future[str]] = []
+        collected = 0
+        try:
+            bounds = [(i, min(i + chunk_size, size)) for i in range(0, size, chunk_size)]
+            futures = [
+                self._pool.submit(
+                    _run_chunk,
+                    func,
+                    shm.name,
+                    size=size,
+                    start=start,
+                    stop=stop,
+                    kwargs=kwargs,
+                )
+                for start, stop in bounds
+            ]
+            result: list[str] = []
+            for (start, stop), future in zip(bounds, futures, strict=True):
+                name = future.result()
+                collected += 1
+                result.extend(_collect(name, stop - start))
+        finally:
+            # After a failed chunk, release the output of the other chunks.
+            for future in futures[collected:]:
+                future.cancel()
+            for future in futures[collected:]:
+                if not future.cancelled() and future.exception() is None:
+                    _discard(future.result())
+            shm.close()
+            shm.unlink()
+        return result
+
+    def make_names(
+        self,
+        x: Iterable[str] | str,
+        unique: bool = True,
+        smart: bool = False,
+    ) -> list[str]:
+        """Make syntactically valid names, as in :func:`~syntactic.make_names`.
+
+        With ``unique=True``, the workers only compute the name stems.
+        Numeric suffixes are then assigned in one ordered pass over the whole
+        input, so the result is identical to a single-process call.
+        """
+        if not unique:
+            return self.map(make_names, x, unique=False, smart=smart)
+        stems = self.map(_make_stems, x, smart=smart)
+        pipeline = _name_pipeline(True, smart)
+        claim = _Namespace().claim
+        return [pipeline._finalize(claim(s)) for s in stems]
+
+    def camel_case(
+        self,
+        x: Iterable[str] | str,
+        strict: bool = True,
+        smart: bool = True,
+        prefix: bool = True,
+    ) -> list[str]:
+        """Convert strings to lowerCamelCase."""
+        return self.map(camel_case, x, strict=strict, smart=smart, prefix=prefix)
+
+    def upper_camel_case(
+        self,
+        x: Iterable[str] | str,
+        strict: bool = True,
+        smart: bool = True,
+        prefix: bool = True,
+    ) -> list[str]:
+        """Convert strings to UpperCamelCase."""
+        return self.map(upper_camel_case, x, strict=strict, smart=smart, prefix=prefix)
+
+    def snake_case(
+        self,
+        x: Iterable[str] | str,
+        smart: bool = True,
+        prefix: bool = True,
+    ) -> list[str]:
+        """Convert strings to snake_case."""
+        return self.map(snake_case, x, smart=smart, prefix=prefix)
+
+    def kebab_case(
+        self,
+        x: Iterable[str] | str,
+        smart: bool = True,
+        prefix: bool = True,
+    ) -> list[str]:
+        """Convert strings to kebab-case."""
+        return self.map(kebab_case, x, smart=smart, prefix=prefix)
+
+    def dotted_case(
+        self,
+        x: Iterable[str] | str,
+        smart: bool = True,
+        prefix: bool = True,
+    ) -> list[str]:
+        """Convert strings to dotted.case."""
+        return self.map(dotted_case, x, smart=smart, prefix=prefix)
+
+    def make_words(self, x: Iterable[str] | str) -> list[str]:
+        """Convert variable names to human-readable words."""
+        return self.map(make_words, x)
@@ -1,10 +1,15 @@
 """Rename files and directories using syntactic naming functions."""
 
+import json
 import os
 import platform
 import tempfile
-from collections.abc import Callable
-from pathlib import Path
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager, nullcontext
+from operator import attrgetter
+from typing import NamedTuple, Self, TextIO
 
 from syntactic.case_conversion import (
     camel_case,
@@ -13,6 +18,21 @@ from syntactic.case_conversion import (
     upper_camel_case,
 )
 
+# Compound file extensions, indexed by their final extension.
+_COMPOUND_EXTS: dict[str, tuple[str, ...]] = {
+    ".gz": (".fastq.gz", ".tar.gz"),
+    ".bz2": (".tar.bz2",),
+    ".xz": (".tar.xz",),
+}
+# Leading characters of names that are never renamed.
+_SKIP = frozenset(".~_$")
+# Case sensitivity of each file system, by device ID.
+_CASE_SENSITIVE: dict[int, bool] = {}
+# Version of the RenamePlan journal format.
+_JOURNAL_VERSION = 1
+# Renames queued on or running in the thread pool at once, per worker.
+_PENDING_PER_WORKER = 2
+
 
 def _is_case_sensitive_fs(path: str = ".") -> bool:
     """Check if the file system is case-sensitive."""
@@ -28,58 +48,108 @@ def _is_case_sensitive_fs(path: str = ".") -> bool:
         return platform.system() == "Linux"
 
 
+def _is_case_sensitive_dir(path: str) -> bool:
+    """Check if the file system holding a directory is case-sensitive.
+
+    Results are cached per device ID, so each mounted file system is only
+    probed once per process.
+    """
+    try:
+        device = os.stat(path).st_dev
+    except OSError:
+        return _is_case_sensitive_fs(path)
+    sensitive = _CASE_SENSITIVE.get(device)
+    if sensitive is None:
+        sensitive = _CASE_SENSITIVE[device] = _is_case_sensitive_fs(path)
+    return sensitive
+
+
+def _needs_tmp(from_path: str, to_path: str) -> bool:
+    """Check if a rename must go through a temporary name.
+
+    Only names that differ by case alone can refer to the same file, on
+    case-insensitive file systems.
+    """
+    a = os.path.basename(from_path)
+    b = os.path.basename(to_path)
+    if a == b or a.casefold() != b.casefold():
+        return False
+    return not _is_case_sensitive_dir(os.path.dirname(from_path))
+
+
+class _Entry(NamedTuple):
+    """A path found by traversal, with its depth and whether it is a directory."""
+
+    path: str
+    depth: int
+    is_dir: bool
+
+
 def _get_file_depth(path: str) -> int:
-    """Get the depth of a file path."""
-    return len(Path(path).parts)
+    """Get the depth of a normalized absolute path, counting its root."""
+    return path.rstrip(os.sep).count(os.sep) + 1
+
+
+def _walk(root: str, depth: int, *, listed: set[str]) -> Iterator[_Entry]:
+    """Yield the entries below a real directory path.
+
+    Entry types come from the directory listing where the file system
+    provides them, so regular entries need no stat call, and depths are
+    counted during the walk. Only symlinks are resolved, to their real path.
+    Like :func:`os.walk`, unreadable directories are skipped and symlinked
+    directories are not descended into. Directories whose entries are all
+    yielded under their own name are added to ``listed``.
+    """
+    stack = [(root, depth)]
+    while stack:
+        top, depth = stack.pop()
+        try:
+            with os.scandir(top) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        complete = True
+        for entry in entries:
+            if entry.is_symlink():
+                complete = False
+                path = os.path.realpath(entry.path)
+                yield _Entry(path, _get_file_depth(path), entry.is_dir())
+            elif entry.is_dir(follow_symlinks=False):
+                yield _Entry(entry.path, depth + 1, True)
+                stack.append((entry.path, depth + 1))
+            else:
+                yield _Entry(entry.path, depth + 1, False)
+        if complete:
+            listed.add(top)
 
 
-def _get_recursive_paths(
-    paths: list[str],
-) -> tuple[list[str], list[str]]:
-    """Get all recursive file and directory paths."""
-    all_paths: set[str] = set()
+def _get_recursive_entries(paths: list[str], listed: set[str]) -> list[_Entry]:
+    """Get all recursive file and directory entries, deepest first."""
+    found: dict[str, _Entry] = {}
     for raw_path in paths:
         real_path = os.path.realpath(raw_path)
-        all_paths.add(real_path)
-        if os.path.isdir(real_path):
-            for root, dirnames, filenames in os.walk(real_path):
-                for d in dirnames:
-                    all_paths.add(os.path.realpath(os.path.join(root, d)))
-                for f in filenames:
-                    all_paths.add(os.path.realpath(os.path.join(root, f)))
-    dirs = sorted(
-        [p for p in all_paths if os.path.isdir(p)],
-        key=_get_file_depth,
-        reverse=True,
-    )
-    files = sorted(
-        [p for p in all_paths if not os.path.isdir(p)],
-        key=_get_file_depth,
-        reverse=True,
-    )
-    return files, dirs
-
+        entry = _Entry(real_path, _get_file_depth(real_path), os.path.isdir(real_path))
+        found.setdefault(real_path, entry)
+        if entry.is_dir:
+            for e in _walk(real_path, entry.depth, listed=listed):
+                found.setdefault(e.path, e)
+    return sorted(found.values(), key=attrgetter("depth"), reverse=True)
 
-def _file_ext(path: str) -> str | None:
-    """Get the file extension, handling compound extensions."""
-    name = os.path.basename(path)
-    compound_exts = [".fastq.gz", ".tar.gz", ".tar.bz2", ".tar.xz"]
-    for ext in compound_exts:
-        if name.endswith(ext):
-            return ext.lstrip(".")
-    _, ext = os.path.splitext(name)
-    return ext.lstrip(".") if ext else None
 
+def _split_path(path: str, *, is_dir: bool) -> tuple[str, str, str | None]:
+    """Split a path into its directory, stem and extension.
 
-def _basename_sans_ext(path: str) -> str:
-    """Get the basename without its extension."""
-    name = os.path.basename(path)
-    compound_exts = [".fastq.gz", ".tar.gz", ".tar.bz2", ".tar.xz"]
-    for ext in compound_exts:
-        if name.endswith(ext):
-            return name[: -len(ext)]
-    stem, _ = os.path.splitext(name)
-    return stem
+    Compound extensions are looked up by their final extension, so each
+    name is only checked against the compound extensions that can match.
+    """
+    dirname, name = os.path.split(path)
+    if is_dir:
+        return dirname, name, None
+    stem, ext = os.path.splitext(name)
+    for compound in _COMPOUND_EXTS.get(ext, ()):
+        if name.endswith(compound):
+            return dirname, name[: -len(compound)], compound[1:]
+    return dirname, stem, ext[1:] if ext else None
 
 
 def _get_naming_function(fun: str) -> Callable[..., list[str]]:
@@ -100,70 +170,433 @@ def _get_naming_function(fun: str) -> Callable[..., list[str]]:
 def _resolve_from_paths(
     path: list[str],
     recursive: bool,
-) -> list[str]:
-    """Resolve input paths to a list of source paths for renaming."""
+) -> tuple[list[_Entry], set[str]]:
+    """Resolve input paths to the source entries for renaming.
+
+    Files precede directories when recursing, deepest first. Also returns
+    the directories whose entries are all included.
+    """
     for p in path:
         if not os.path.exists(p):
             raise FileNotFoundError(f"Path not found: {p}")
     if len(path) == 1 and os.path.isdir(path[0]) and not recursive:
         dirpath = os.path.realpath(path[0])
-        entries = os.listdir(dirpath)
-        return [os.path.join(dirpath, e) for e in entries]
+        depth = _get_file_depth(dirpath) + 1
+        with os.scandir(dirpath) as it:
+            return [_Entry(e.path, depth, e.is_dir()) for e in it], {dirpath}
+    listed: set[str] = set()
     if recursive:
-        files, dirs = _get_recursive_paths(path)
-        return files + dirs
-    return [os.path.realpath(p) for p in path]
+        entries = _get_recursive_entries(path, listed)
+        return [e for e in entries if not e.is_dir] + [e for e in entries if e.is_dir], listed
+    real_paths = [os.path.realpath(p) for p in path]
+    return [_Entry(p, _get_file_depth(p), os.path.isdir(p)) for p in real_paths], listed
 
 
-def _compute_to_path(
-    from_path: str,
+def _compute_to_paths(
+    entries: list[_Entry],
     naming_fn: Callable[..., list[str]],
     quiet: bool,
     lowercase_ext: bool = False,
-) -> str:
-    """Compute the target path for a single source path."""
-    dirname = os.path.dirname(from_path)
-    if os.path.isdir(from_path):
-        stem = os.path.basename(from_path)
-        ext = None
-    else:
-        stem = _basename_sans_ext(from_path)
-        ext = _file_ext(from_path)
-    if not stem or stem[0] in (".", "_", "~", "$"):
-        if not quiet:
-            print(f"Skipping {from_path}")
-        return from_path
-    result = naming_fn(stem, smart=True, prefix=False)
-    new_stem = result[0] if isinstance(result, list) else result
-    if ext is not None:
-        final_ext = ext.lower() if lowercase_ext else ext
-        basename = f"{new_stem}.{final_ext}"
-    else:
-        basename = new_stem
-    return os.path.join(dirname, basename)
+) -> list[str]:
+    """Compute the target paths of source entries.
 
+    Stems that repeat across directories (e.g. "README") are converted once,
+    in a single batch call of the naming function.
+    """
+    parts = [_split_path(e.path, is_dir=e.is_dir) for e in entries]
+    unique = list(dict.fromkeys(stem for _, stem, _ in parts if stem and stem[0] not in _SKIP))
+    new_stems = dict(zip(unique, naming_fn(unique, smart=True, prefix=False), strict=True))
+    to_paths = []
+    for e, (dirname, stem, ext) in zip(entries, parts, strict=True):
+        if not stem or stem[0] in _SKIP:
+            if not quiet:
+                print(f"Skipping {e.path}")
+            to_paths.append(e.path)
+            continue
+        basename = new_stems[stem]
+        if ext is not None:
+            basename += "." + (ext.lower() if lowercase_ext else ext)
+        to_paths.append(os.path.join(dirname, basename))
+    return to_paths
 
-def _execute_renames(
+
+def _is_taken(from_path: str, to_path: str) -> bool:
+    """Check if a target path exists on disk as a different file than its source.
+
+    On case-insensitive file systems, a target that differs from its source
+    by case only resolves to the source itself.
+    """
+    try:
+        target = os.lstat(to_path)
+    except OSError:
+        return False
+    source = os.lstat(from_path)
+    return (target.st_dev, target.st_ino) != (source.st_dev, source.st_ino)
+
+
+def _find_collisions(
     from_paths: list[str],
     to_paths: list[str],
-    case_sensitive: bool,
-    quiet: bool,
-) -> None:
-    """Execute file rename operations."""
-    for from_path, to_path in zip(from_paths, to_paths, strict=False):
+    *,
+    listed: set[str],
+) -> dict[str, list[str]]:
+    """Find rename targets that are taken by another path.
+
+    Paths are indexed by directory and case-folded name, before and after
+    renaming. A target collides with any other path of the same name, where
+    names that differ by case only collide on case-insensitive file systems.
+    Targets in directories that were not fully listed are also checked on
+    disk.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        Source paths of each contested target, followed by the paths that
+        take it.
+    """
+    index: dict[str, dict[str, list[int]]] = {}
+    for i, (from_path, to_path) in enumerate(zip(from_paths, to_paths, strict=True)):
+        dirname, name = os.path.split(from_path)
+        names = index.setdefault(dirname, {})
+        for key in {name.casefold(), os.path.basename(to_path).casefold()}:
+            names.setdefault(key, []).append(i)
+    collisions: dict[str, list[str]] = {}
+    for i, (from_path, to_path) in enumerate(zip(from_paths, to_paths, strict=True)):
         if from_path == to_path:
             continue
-        if not quiet:
-            print(f"Renaming {from_path} to {to_path}")
-        if case_sensitive:
+        dirname, name = os.path.split(to_path)
+        others = [j for j in index[dirname][name.casefold()] if j != i]
+        exact = [
+            j
+            for j in others
+            if name in (os.path.basename(from_paths[j]), os.path.basename(to_paths[j]))
+        ]
+        if exact or (others and not _is_case_sensitive_dir(dirname)):
+            taken_by = [from_paths[j] for j in exact or others]
+        elif not others and dirname not in listed and _is_taken(from_path, to_path):
+            taken_by = [to_path]
+        else:
+            continue
+        collisions.setdefault(to_path, [from_path, *taken_by])
+    return collisions
+
+
+def _rename(from_path: str, to_path: str, *, via_tmp: bool) -> None:
+    """Rename a path, optionally through a temporary name.
+
+    A rename that is found already done, as after an interruption before
+    its progress was recorded, is completed or skipped.
+    """
+    tmp_path = os.path.join(
+        os.path.dirname(from_path),
+        f"__tmp__{os.path.basename(from_path)}",
+    )
+    try:
+        if not via_tmp:
             os.rename(from_path, to_path)
         else:
-            tmp_path = os.path.join(
-                os.path.dirname(from_path),
-                f"__tmp__{os.path.basename(from_path)}",
-            )
             os.rename(from_path, tmp_path)
             os.rename(tmp_path, to_path)
+    except FileNotFoundError:
+        if os.path.lexists(from_path):
+            raise
+        if via_tmp and os.path.lexists(tmp_path):
+            os.rename(tmp_path, to_path)
+        elif not os.path.lexists(to_path):
+            raise
+
+
+def _rename_graph(
+    from_paths: list[str],
+    to_paths: list[str],
+) -> tuple[list[int], list[list[int]]]:
+    """Build the dependency DAG of renames.
+
+    A rename waits for the renames inside the directory that it moves, whose
+    source paths would otherwise no longer exist, and for earlier renames
+    that touch one of its names, compared case-insensitively. Renames without
+    a path between them in the DAG touch disjoint names, so any order that
+    respects the DAG has the same outcome as renaming in input order.
+
+    Returns
+    -------
+    tuple[list[int], list[list[int]]]
+        Number of unfinished dependencies of each rename, and the renames
+        that depend on each rename.
+    """
+    waiting = [0] * len(from_paths)
+    dependents: list[list[int]] = [[] for _ in from_paths]
+    first: dict[str, int] = {}
+    for i, p in enumerate(from_paths):
+        first.setdefault(p, i)
+    # Closest directory rename at or above each directory, if any.
+    owners: dict[str, int | None] = {}
+    last: dict[str, int] = {}
+    for i, (from_path, to_path) in enumerate(zip(from_paths, to_paths, strict=True)):
+        chain = []
+        d = os.path.dirname(from_path)
+        while d not in owners:
+            chain.append(d)
+            parent = os.path.dirname(d)
+            if d in first:
+                owners[d] = first[d]
+            elif parent == d:
+                owners[d] = None
+            else:
+                d = parent
+        owner = owners[d]
+        for c in chain:
+            owners[c] = owner
+        if owner is not None:
+            dependents[i].append(owner)
+            waiting[owner] += 1
+        for key in {os.path.normcase(from_path).casefold(), os.path.normcase(to_path).casefold()}:
+            j = last.get(key)
+            if j is not None:
+                dependents[j].append(i)
+                waiting[i] += 1
+            last[key] = i
+    return waiting, dependents
+
+
+def _execute_renames(
+    from_paths: list[str],
+    to_paths: list[str],
+    quiet: bool,
+    *,
+    workers: int = 1,
+    done: Callable[[int], None] | None = None,
+) -> None:
+    """Execute file rename operations.
+
+    Renames run in an order that respects their dependencies (see
+    :func:`_rename_graph`). With more than one worker, they run on a thread
+    pool as soon as the renames they depend on have finished. After a failed
+    rename, no further renames are started, and the error is raised once
+    the running ones have finished. ``done`` is called from the calling
+    thread with the index of each finished rename.
+    """
+    ops = [i for i, (f, t) in enumerate(zip(from_paths, to_paths, strict=True)) if f != t]
+    waiting, dependents = _rename_graph([from_paths[i] for i in ops], [to_paths[i] for i in ops])
+    ready = deque(k for k, n in enumerate(waiting) if not n)
+    if workers == 1:
+        while ready:
+            k = ready.popleft()
+            from_path, to_path = from_paths[ops[k]], to_paths[ops[k]]
+            if not quiet:
+                print(f"Renaming {from_path} to {to_path}")
+            _rename(from_path, to_path, via_tmp=_needs_tmp(from_path, to_path))
+            if done is not None:
+                done(ops[k])
+            for j in dependents[k]:
+                waiting[j] -= 1
+                if not waiting[j]:
+                    ready.append(j)
+        return
+    running: dict[Future[None], int] = {}
+    error: BaseException | None = None
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while running or (ready and error is None):
+            while ready and error is None and len(running) < workers * _PENDING_PER_WORKER:
+                k = ready.popleft()
+                from_path, to_path = from_paths[ops[k]], to_paths[ops[k]]
+                if not quiet:
+                    print(f"Renaming {from_path} to {to_path}")
+                via_tmp = _needs_tmp(from_path, to_path)
+                future = pool.submit(_rename, from_path, to_path, via_tmp=via_tmp)
+                running[future] = k
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                k = running.pop(future)
+                if future.exception() is not None:
+                    error = error or future.exception()
+                    continue
+                if done is not None:
+                    done(ops[k])
+                for j in dependents[k]:
+                    waiting[j] -= 1
+                    if not waiting[j]:
+                        ready.append(j)
+    if error is not None:
+        raise error
+
+
+class RenamePlan:
+    """Renames computed up front, applied with a resumable journal.
+
+    A plan holds the source and target path of every rename, and the
+    targets that collide with other paths. Saving a plan writes it to a
+    journal file, which then records each finished rename, so that an
+    interrupted :meth:`apply` can be resumed, or reverted with :meth:`undo`,
+    from the journal alone, without walking the tree again.
+
+    Parameters
+    ----------
+    from_paths : list[str]
+        Source paths.
+    to_paths : list[str]
+        Target paths, in the same directories as the source paths.
+    collisions : dict[str, list[str]] or None
+        Contested targets, mapped to the paths competing for them, as found
+        by :meth:`build`.
+
+    Examples
+    --------
+    >>> plan = RenamePlan.build("/path/to/dir", recursive=True, quiet=True)
+    >>> plan.save("/path/to/rename.journal")
+    >>> plan.apply(workers=8, quiet=True)
+
+    After an interruption, resume or revert from the journal:
+
+    >>> RenamePlan.load("/path/to/rename.journal").apply(quiet=True)
+    >>> RenamePlan.load("/path/to/rename.journal").undo(quiet=True)
+    """
+
+    __slots__ = ("_done", "collisions", "from_paths", "journal", "to_paths")
+
+    def __init__(
+        self,
+        from_paths: list[str],
+        to_paths: list[str],
+        *,
+        collisions: dict[str, list[str]] | None = None,
+    ) -> None:
+        if len(from_paths) != len(to_paths):
+            raise ValueError("from_paths and to_paths must have the same length.")
+        for f, t in zip(from_paths, to_paths, strict=True):
+            if os.path.dirname(f) != os.path.dirname(t):
+                raise ValueError(f"Target is not in the source directory: {t}")
+        self.from_paths = from_paths
+        self.to_paths = to_paths
+        self.collisions = collisions or {}
+        self.journal: str | None = None
+        # Finished renames, in the order they finished.
+        self._done: dict[int, None] = {}
+
+    def __repr__(self) -> str:
+        """Return the string representation of the plan."""
+        return (
+            f"RenamePlan(renames={len(self)}, done={len(self._done)}, "
+            f"collisions={len(self.collisions)})"
+        )
+
+    def __len__(self) -> int:
+        """Return the number of paths that are renamed."""
+        return sum(f != t for f, t in zip(self.from_paths, self.to_paths, strict=True))
+
+    @classmethod
+    def build(
+        cls,
+        path: str | list[str],
+        recursive: bool = False,
+        fun: str = "kebab_case",
+        quiet: bool = False,
+        lowercase_ext: bool = False,
+    ) -> Self:
+        """Plan the renames of :func:`syntactic_rename`, without renaming."""
+        naming_fn = _get_naming_function(fun)
+        if isinstance(path, str):
+            path = [path]
+        entries, listed = _resolve_from_paths(path, recursive)
+        from_paths = [e.path for e in entries]
+        to_paths = _compute_to_paths(entries, naming_fn, quiet, lowercase_ext)
+        collisions = _find_collisions(from_paths, to_paths, listed=listed)
+        return cls(from_paths, to_paths, collisions=collisions)
+
+    def save(self, journal: str) -> None:
+        """Write the plan and its progress to a new journal file.
+
+        Progress of later calls to :meth:`apply` and :meth:`undo` is appended
+        to the journal. Each directory is stored once, followed by the names
+        of its entries.
+        """
+        dirs: dict[str, int] = {}
+        ops: list[list[int | str]] = []
+        for f, t in zip(self.from_paths, self.to_paths, strict=True):
+            dirname, name = os.path.split(f)
+            op: list[int | str] = [dirs.setdefault(dirname, len(dirs)), name]
+            if t != f:
+                op.append(os.path.basename(t))
+            ops.append(op)
+        header = {
+            "version": _JOURNAL_VERSION,
+            "dirs": list(dirs),
+            "ops": ops,
+            "collisions": self.collisions,
+        }
+        with open(journal, "w", encoding="utf-8") as f:
+            f.write(json.dumps(header, separators=(",", ":")) + "\n")
+            f.writelines(f"+{i}\n" for i in self._done)
+        self.journal = journal
+
+    @classmethod
+    def load(cls, journal: str) -> Self:
+        """Read a plan and its progress from a journal file."""
+        with open(journal, encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            # The last record is incomplete, or empty.
+            records = f.read().split("\n")[:-1]
+        if header.get("version") != _JOURNAL_VERSION:
+            raise ValueError(f"Unsupported journal version: {header.get('version')}")
+        dirs = header["dirs"]
+        from_paths = [os.path.join(dirs[op[0]], op[1]) for op in header["ops"]]
+        to_paths = [os.path.join(dirs[op[0]], op[-1]) for op in header["ops"]]
+        plan = cls(from_paths, to_paths, collisions=header["collisions"])
+        for record in records:
+            i = int(record[1:])
+            if record[0] == "+":
+                plan._done[i] = None
+            else:
+                del plan._done[i]
+        plan.journal = journal
+        return plan
+
+    def _open_journal(self) -> AbstractContextManager[TextIO | None]:
+        """Open the journal for appending progress records, if saved."""
+        if self.journal is None:
+            return nullcontext()
+        return open(self.journal, "a", encoding="utf-8")
+
+    def _record(self, journal: TextIO | None, i: int, *, undone: bool = False) -> None:
+        """Record a finished rename, or undo."""
+        if undone:
+            del self._done[i]
+        else:
+            self._done[i] = None
+        if journal is not None:
+            journal.write(f"{'-' if undone else '+'}{i}\n")
+            journal.flush()
+
+    def apply(self, *, workers: int = 1, quiet: bool = False) -> None:
+        """Rename the paths that have not been renamed yet.
+
+        Raises :class:`FileExistsError` if any targets collide, before
+        renaming anything. ``workers`` is as in :func:`syntactic_rename`.
+        """
+        if workers < 1:
+            raise ValueError("workers must be a positive integer.")
+        if self.collisions:
+            target = next(iter(self.collisions))
+            raise FileExistsError(f"Rename target taken by another path: {target}")
+        pending = [i for i in range(len(self.from_paths)) if i not in self._done]
+        with self._open_journal() as journal:
+            _execute_renames(
+                [self.from_paths[i] for i in pending],
+                [self.to_paths[i] for i in pending],
+                quiet,
+                workers=workers,
+                done=lambda k: self._record(journal, pending[k]),
+            )
+
+    def undo(self, *, quiet: bool = False) -> None:
+        """Revert the renames done so far, most recent first."""
+        with self._open_journal() as journal:
+            for i in reversed(list(self._done)):
+                from_path, to_path = self.to_paths[i], self.from_paths[i]
+                if not quiet:
+                    print(f"Renaming {from_path} to {to_path}")
+                _rename(from_path, to_path, via_tmp=_needs_tmp(from_path, to_path))
+                self._record(journal, i, undone=True)
 
 
 def syntactic_rename(
@@ -173,9 +606,15 @@ def syntactic_rename(
     quiet: bool = False,
     dry_run: bool = False,
     lowercase_ext: bool = False,
+    *,
+    workers: int = 1,
 ) -> dict[str, list[str]]:
     """Rename files and/or directories using a syntactic naming function.
 
+    Raises :class:`FileExistsError` before renaming anything if a target name
+    is taken by another path. See :class:`RenamePlan` for planning renames
+    and resuming interrupted ones.
+
     Args:
         path: A file path, directory path, or list of paths. When a single
             directory is given, its contents are renamed.
@@ -184,17 +623,18 @@ def syntactic_rename(
         quiet: Suppress output messages.
         dry_run: Preview changes without renaming.
         lowercase_ext: If True, also convert the file extension to lowercase.
+        workers: Number of threads renaming concurrently. Paths inside a
+            directory are always renamed before the directory itself, and
+            renames that touch the same name keep their input order.
     """
-    naming_fn = _get_naming_function(fun)
-    if isinstance(path, str):
-        path = [path]
-    from_paths = _resolve_from_paths(path, recursive)
-    case_sensitive = _is_case_sensitive_fs(os.path.dirname(from_paths[0]) if from_paths else ".")
-    to_paths = [_compute_to_path(fp, naming_fn, quiet, lowercase_ext) for fp in from_paths]
+    if workers < 1:
+        raise ValueError("workers must be a positive integer.")
+    plan = RenamePlan.build(path, recursive, fun, quiet, lowercase_ext)
+    from_paths, to_paths = plan.from_paths, plan.to_paths
     if dry_run:
         for f, t in zip(from_paths, to_paths, strict=False):
             if not quiet:
                 print(f"[dry-run] {f} -> {t}")
         return {"from": from_paths, "to": to_paths}
-    _execute_renames(from_paths, to_paths, case_sensitive, quiet)
+    plan.apply(workers=workers, quiet=quiet)
     return {"from": from_paths, "to": to_paths}
@@ -0,0 +1,195 @@
+"""Streaming generator variants of the syntactic naming functions.
+
+Each ``iter_*`` function accepts any iterable of strings, consumes it in
+bounded-size chunks, and lazily yields one converted name per input string.
+Memory use is bounded by the chunk size rather than the input length.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from itertools import batched
+
+from syntactic.case_conversion import (
+    camel_case,
+    dotted_case,
+    kebab_case,
+    snake_case,
+    upper_camel_case,
+)
+from syntactic.make_names import _name_pipeline, _Namespace
+from syntactic.make_words import make_words
+from syntactic.pad_zeros import _pad, _scan
+
+_DEFAULT_CHUNK_SIZE = 10000
+
+
+def _iter_chunks(obj: Iterable[str] | str, chunk_size: int) -> Iterator[tuple[str, ...]]:
+    """Split an iterable of strings into tuples of at most ``chunk_size``."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    if isinstance(obj, str):
+        obj = [obj]
+    return batched(obj, chunk_size)
+
+
+def _stream(
+    func: Callable[..., list[str]],
+    obj: Iterable[str] | str,
+    *,
+    chunk_size: int,
+    **kwargs: bool,
+) -> Iterator[str]:
+    """Apply a batch naming function lazily, one chunk at a time."""
+    for chunk in _iter_chunks(obj, chunk_size):
+        yield from func(list(chunk), **kwargs)
+
+
+def iter_make_names(
+    obj: Iterable[str] | str,
+    unique: bool = True,
+    smart: bool = False,
+    *,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Lazily make syntactically valid names out of an iterable of strings.
+
+    Uniqueness is tracked incrementally across chunks, so the yielded names
+    match :func:`~syntactic.make_names` on the fully materialized input.
+
+    Parameters
+    ----------
+    obj : Iterable[str] or str
+        Strings to convert.
+    unique : bool
+        Append numeric suffixes so that the yielded names are unique.
+    smart : bool
+        Replace symbols such as ``&``, ``+``, ``/`` and ``%`` with words.
+    chunk_size : int
+        Maximum number of strings processed per chunk.
+
+    Yields
+    ------
+    str
+        One syntactically valid name per input string.
+
+    Examples
+    --------
+    >>> list(iter_make_names(iter(["a b", "a b"]), chunk_size=1))
+    ['a_b', 'a_b_1']
+    """
+    pipeline = _name_pipeline(unique, smart)
+    namespace = _Namespace() if unique else None
+    for chunk in _iter_chunks(obj, chunk_size):
+        yield from pipeline._apply(chunk, namespace)
+
+
+def iter_camel_case(
+    obj: Iterable[str] | str,
+    strict: bool = True,
+    smart: bool = True,
+    prefix: bool = True,
+    *,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Lazily convert an iterable of strings to lowerCamelCase."""
+    return _stream(
+        camel_case, obj, chunk_size=chunk_size, strict=strict, smart=smart, prefix=prefix
+    )
+
+
+def iter_upper_camel_case(
+    obj: Iterable[str] | str,
+    strict: bool = True,
+    smart: bool = True,
+    prefix: bool = True,
+    *,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Lazily convert an iterable of strings to UpperCamelCase."""
+    return _stream(
+        upper_camel_case, obj, chunk_size=chunk_size, strict=strict, smart=smart, prefix=prefix
+    )
+
+
+def iter_snake_case(
+    obj: Iterable[str] | str,
+    smart: bool = True,
+    prefix: bool = True,
+    *,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Lazily convert an iterable of strings to snake_case."""
+    return _stream(snake_case, obj, chunk_size=chunk_size, smart=smart, prefix=prefix)
+
+
+def iter_dotted_case(
+    obj: Iterable[str] | str,
+    smart: bool = True,
+    prefix: bool = True,
+    *,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Lazily convert an iterable of strings to dotted.case."""
+    return _stream(dotted_case, obj, chunk_size=chunk_size, smart=smart, prefix=prefix)
+
+
+def iter_kebab_case(
+    obj: Iterable[str] | str,
+    smart: bool = True,
+    prefix: bool = True,
+    *,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Lazily convert an iterable of strings to kebab-case."""
+    return _stream(kebab_case, obj, chunk_size=chunk_size, smart=smart, prefix=prefix)
+
+
+def iter_make_words(
+    obj: Iterable[str] | str,
+    *,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Lazily convert an iterable of variable names to human-readable words."""
+    return _stream(make_words, obj, chunk_size=chunk_size)
+
+
+def _iter_padded(obj: Iterable[int] | Iterable[str]) -> Iterator[str]:
+    """Classify strings in a first pass, then pad them in a second pass."""
+    kind, width, _ = _scan(map(str, obj), keep=False)
+    for s in map(str, obj):
+        yield _pad(s, kind, width)
+
+
+def iter_autopad_zeros(obj: Iterable[int] | Iterable[str] | int | str) -> Iterator[str]:
+    """Lazily pad numbers with leading zeros, in two passes over the input.
+
+    The first pass finds the padding width without storing the input, and
+    the second pass yields the padded strings, matching
+    :func:`~syntactic.autopad_zeros`. The input must therefore be iterable
+    twice: for example a sequence, or an object that reopens a file each
+    time it is iterated, but not an iterator or generator.
+
+    Parameters
+    ----------
+    obj : Iterable[int] or Iterable[str]
+        Integers or strings to pad.
+
+    Yields
+    ------
+    str
+        One padded string per input value.
+
+    Raises
+    ------
+    TypeError
+        If the input is a one-shot iterator.
+
+    Examples
+    --------
+    >>> list(iter_autopad_zeros(["A1", "B10", "C100"]))
+    ['A001', 'B010', 'C100']
+    """
+    if isinstance(obj, int | str):
+        obj = [str(obj)]
+    elif iter(obj) is obj:
+        raise TypeError("Input must be iterable twice, not an iterator.")
+    return _iter_padded(obj)
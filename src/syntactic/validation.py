@@ -0,0 +1,188 @@
+"""Check whether strings are already in a syntactic format.
+
+Each check is an anchored match against the strings that a conversion leaves
+unchanged, so no conversion work is done. A string passes if and only if the
+corresponding function returns it unmodified.
+"""
+
+import re
+from collections.abc import Callable, Iterable, Iterator
+
+from syntactic._engine import _RENDERERS, _fixed_point
+
+# Strings that make_names leaves unchanged.
+_NAME_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9]*(?:_[A-Za-z0-9]+)*")
+
+# Format name for checks against make_names(unique=True).
+_NAMES = "names"
+
+
+def _matcher(
+    format: str,
+    *,
+    strict: bool,
+    smart: bool,
+    prefix: bool,
+) -> Callable[[str], object]:
+    """Return the fixed-point matcher for a format."""
+    if format == _NAMES:
+        return _NAME_PATTERN.fullmatch
+    if format not in _RENDERERS:
+        formats = ", ".join([*_RENDERERS, _NAMES])
+        raise ValueError(f"Invalid format '{format}'. Must be one of: {formats}")
+    return _fixed_point(format, strict=strict, smart=smart, prefix=prefix)
+
+
+def _passes(
+    x: Iterable[str],
+    match: Callable[[str], object],
+    *,
+    unique: bool = False,
+) -> Iterator[bool]:
+    """Lazily check each string, optionally failing repeated strings."""
+    seen: set[str] = set()
+    for s in x:
+        if unique:
+            if s in seen:
+                yield False
+                continue
+            seen.add(s)
+        yield match(s) is not None
+
+
+def _check(
+    obj: Iterable[str] | str,
+    format: str,
+    *,
+    strict: bool = True,
+    smart: bool = True,
+    prefix: bool = True,
+) -> list[bool]:
+    """Check each string against the fixed points of a case format."""
+    if isinstance(obj, str):
+        obj = [obj]
+    match = _matcher(format, strict=strict, smart=smart, prefix=prefix)
+    return list(_passes(obj, match))
+
+
+def is_camel_case(
+    obj: Iterable[str] | str,
+    strict: bool = True,
+    smart: bool = True,
+    prefix: bool = True,
+) -> list[bool]:
+    """Check which strings are in lowerCamelCase."""
+    return _check(obj, "camel", strict=strict, smart=smart, prefix=prefix)
+
+
+def is_upper_camel_case(
+    obj: Iterable[str] | str,
+    strict: bool = True,
+    smart: bool = True,
+    prefix: bool = True,
+) -> list[bool]:
+    """Check which strings are in UpperCamelCase."""
+    return _check(obj, "upper_camel", strict=strict, smart=smart, prefix=prefix)
+
+
+def is_snake_case(obj: Iterable[str] | str, smart: bool = True, prefix: bool = True) -> list[bool]:
+    """Check which strings are in snake_case."""
+    return _check(obj, "snake", smart=smart, prefix=prefix)
+
+
+def is_kebab_case(obj: Iterable[str] | str, smart: bool = True, prefix: bool = True) -> list[bool]:
+    """Check which strings are in kebab-case."""
+    return _check(obj, "kebab", smart=smart, prefix=prefix)
+
+
+def is_dotted_case(obj: Iterable[str] | str, smart: bool = True, prefix: bool = True) -> list[bool]:
+    """Check which strings are in dotted.case."""
+    return _check(obj, "dotted", smart=smart, prefix=prefix)
+
+
+def is_screaming_snake_case(
+    obj: Iterable[str] | str,
+    smart: bool = True,
+    prefix: bool = True,
+) -> list[bool]:
+    """Check which strings are in SCREAMING_SNAKE_CASE."""
+    return _check(obj, "screaming_snake", smart=smart, prefix=prefix)
+
+
+def is_train_case(
+    obj: Iterable[str] | str,
+    strict: bool = True,
+    smart: bool = True,
+    prefix: bool = True,
+) -> list[bool]:
+    """Check which strings are in Train-Case."""
+    return _check(obj, "train", strict=strict, smart=smart, prefix=prefix)
+
+
+def is_syntactic_name(obj: Iterable[str] | str, unique: bool = True) -> list[bool]:
+    """Check which strings are syntactically valid names.
+
+    With ``unique=True``, repeated strings fail after their first
+    occurrence, so every check passes if and only if
+    :func:`~syntactic.make_names` returns the input unmodified.
+    """
+    if isinstance(obj, str):
+        obj = [obj]
+    return list(_passes(obj, _NAME_PATTERN.fullmatch, unique=unique))
+
+
+def first_violation(
+    obj: Iterable[str] | str,
+    format: str = "snake",
+    strict: bool = True,
+    smart: bool = True,
+    prefix: bool = True,
+) -> int | None:
+    """Return the position of the first string not in a format.
+
+    Checking stops at the first violation, so the input may be a lazy or
+    unbounded iterable.
+
+    Parameters
+    ----------
+    obj : Iterable[str] or str
+        Strings to check.
+    format : str
+        Case format, as in :func:`~syntactic.convert`, or ``"names"`` for
+        unique syntactically valid names.
+    strict : bool
+        Check against strict camel and train case conversion.
+    smart : bool
+        Check against conversion with acronym sanitization.
+    prefix : bool
+        Check against conversion that prefixes leading numbers with "X".
+
+    Returns
+    -------
+    int or None
+        Index of the first violation, or ``None`` if every string conforms.
+
+    Examples
+    --------
+    >>> first_violation(["sample_id", "sampleID", "n_count"])
+    1
+    """
+    if isinstance(obj, str):
+        obj = [obj]
+    match = _matcher(format, strict=strict, smart=smart, prefix=prefix)
+    passes = _passes(obj, match, unique=format == _NAMES)
+    return next((i for i, ok in enumerate(passes) if not ok), None)
+
+
+def conforms(
+    obj: Iterable[str] | str,
+    format: str = "snake",
+    strict: bool = True,
+    smart: bool = True,
+    prefix: bool = True,
+) -> bool:
+    """Check whether all strings are in a format, stopping at the first violation.
+
+    Takes the same arguments as :func:`first_violation`.
+    """
+    return first_violation(obj, format, strict=strict, smart=smart, prefix=prefix) is None
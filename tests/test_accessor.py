@@ -0,0 +1,98 @@
+"""Tests for the pandas accessors."""
+
+import pytest
+
+from syntactic import cache_enabled, cache_info, camel_case, make_dimnames, snake_case
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+pytest.importorskip("syntactic.accessor")
+
+
+class TestFrameAccessor:
+    def test_snake_case_columns(self) -> None:
+        df = pd.DataFrame({"sampleID": [1, 2], "nCount RNA": [3, 4]})
+        result = df.syntactic.snake_case_columns()
+        assert result.columns.tolist() == ["sample_id", "n_count_rna"]
+        # Original frame is untouched and column data is shared.
+        assert df.columns.tolist() == ["sampleID", "nCount RNA"]
+        assert np.shares_memory(result["sample_id"].to_numpy(), df["sampleID"].to_numpy())
+
+    def test_camel_case_columns(self) -> None:
+        cols = ["HELLO WORLD", "G2M.Score"]
+        df = pd.DataFrame([[1, 2]], columns=cols)
+        result = df.syntactic.camel_case_columns(strict=False)
+        assert result.columns.tolist() == camel_case(cols, strict=False)
+
+    def test_make_dimnames(self) -> None:
+        df = pd.DataFrame([[1, 2], [3, 4]], index=["1-a", "1-a"], columns=["2-b", "2-b"])
+        result = df.syntactic.make_dimnames()
+        expected = make_dimnames(rownames=["1-a", "1-a"], colnames=["2-b", "2-b"])
+        assert result.index.tolist() == expected["rownames"]
+        assert result.columns.tolist() == expected["colnames"]
+
+    def test_range_index_unchanged(self) -> None:
+        df = pd.DataFrame({"a b": [1, 2]})
+        result = df.syntactic.make_dimnames()
+        assert result.index.equals(df.index)
+        assert result.columns.tolist() == ["a_b"]
+
+    def test_conformant_labels_skipped(self) -> None:
+        df = pd.DataFrame({"sample_id": [1], "n_count": [2]})
+        assert df.columns.syntactic.snake_case() is df.columns
+        assert df.syntactic.snake_case_columns().columns.equals(df.columns)
+
+    def test_conformant_labels_not_converted(self) -> None:
+        """Conformant labels are checked without running the conversion."""
+        df = pd.DataFrame({"sample_id": [1], "n_count": [2]})
+        with cache_enabled():
+            df.syntactic.snake_case_columns()
+            df.syntactic.make_names_columns()
+            assert cache_info() == (0, 0, 0, 65536, 0)
+
+
+class TestIndexAccessor:
+    def test_flat_index(self) -> None:
+        labels = ["nCount", "sampleID", "nCount", None]
+        result = pd.Index(labels, name="x").syntactic.snake_case()
+        assert result.name == "x"
+        assert result[:3].tolist() == snake_case(labels[:3])
+        assert pd.isna(result[3])
+
+    def test_multi_index_levels(self) -> None:
+        index = pd.MultiIndex.from_tuples(
+            [("Sample A", "geneID"), ("Sample A", "nCount"), ("sample_a", "geneID")],
+            names=["sample", "feature"],
+        )
+        result = index.syntactic.snake_case()
+        assert result.names == ["sample", "feature"]
+        assert result.tolist() == [
+            ("sample_a", "gene_id"),
+            ("sample_a", "n_count"),
+            ("sample_a", "gene_id"),
+        ]
+        assert result.levels[0].tolist() == ["sample_a"]
+
+    def test_categorical_index(self) -> None:
+        index = pd.CategoricalIndex(["Foo Bar", "foo_bar", "Foo Bar", None], name="x")
+        result = index.syntactic.snake_case()
+        assert isinstance(result, pd.CategoricalIndex)
+        assert result.name == "x"
+        assert result[:3].tolist() == ["foo_bar", "foo_bar", "foo_bar"]
+        assert pd.isna(result[3])
+        assert result.categories.tolist() == ["foo_bar"]
+        assert pd.CategoricalIndex(["a b", "a b"]).syntactic.make_names().tolist() == [
+            "a_b",
+            "a_b_1",
+        ]
+
+    def test_mixed_labels(self) -> None:
+        """String labels are converted and other labels kept in place."""
+        result = pd.Index(["Foo Bar", 1, None]).syntactic.snake_case()
+        assert result.tolist() == ["foo_bar", 1, None]
+        index = pd.Index(["foo_bar", 1])
+        assert index.syntactic.snake_case() is index
+
+    def test_make_names_unique(self) -> None:
+        result = pd.Index(["a b", "a b"]).syntactic.make_names()
+        assert result.tolist() == ["a_b", "a_b_1"]
@@ -0,0 +1,93 @@
+"""Tests for the Apache Arrow backend."""
+
+from collections.abc import Callable
+
+import pytest
+
+from syntactic import (
+    camel_case,
+    dotted_case,
+    kebab_case,
+    make_names,
+    make_words,
+    screaming_snake_case,
+    snake_case,
+    train_case,
+    upper_camel_case,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+NAMES = [
+    "%GC",
+    "10uM",
+    "5'-3' bias",
+    "G2M.Score",
+    "HELLO WORLD",
+    "nCount",
+    "RNAi clones",
+    "TX2GeneID",
+    "worfdbHTMLRemap",
+    "externalIDs",
+    "miRNA_samples",
+    "a - b",
+    "dox-",
+    "-dox",
+    "1,000",
+    "αβγ",
+    "10µM",
+    "a-b",
+    "a-b",
+]
+
+
+class TestArrowCaseConversion:
+    @pytest.mark.parametrize("fun", [snake_case, kebab_case, dotted_case, screaming_snake_case])
+    @pytest.mark.parametrize("smart", [True, False])
+    @pytest.mark.parametrize("prefix", [True, False])
+    def test_delimited(self, fun: Callable[..., list[str]], smart: bool, prefix: bool) -> None:
+        result = fun(pa.array(NAMES), smart=smart, prefix=prefix)
+        assert isinstance(result, pa.Array)
+        assert result.to_pylist() == fun(NAMES, smart=smart, prefix=prefix)
+
+    @pytest.mark.parametrize("fun", [camel_case, upper_camel_case, train_case])
+    def test_camel(self, fun: Callable[..., list[str]]) -> None:
+        assert fun(pa.array(NAMES)).to_pylist() == fun(NAMES)
+
+    def test_make_words(self) -> None:
+        assert make_words(pa.array(NAMES)).to_pylist() == make_words(NAMES)
+
+    def test_nulls(self) -> None:
+        assert snake_case(pa.array(["fooBar", None])).to_pylist() == ["foo_bar", None]
+
+    def test_type_preserved(self) -> None:
+        x = pa.array(["fooBar"], type=pa.large_string())
+        assert snake_case(x).type == pa.large_string()
+
+
+class TestArrowMakeNames:
+    @pytest.mark.parametrize("unique", [True, False])
+    @pytest.mark.parametrize("smart", [True, False])
+    def test_matches_list(self, unique: bool, smart: bool) -> None:
+        result = make_names(pa.array(NAMES), unique=unique, smart=smart)
+        assert result.to_pylist() == make_names(NAMES, unique=unique, smart=smart)
+
+    def test_chunked_unique(self) -> None:
+        x = pa.chunked_array([["a b", "a b"], ["a b"]])
+        result = make_names(x)
+        assert isinstance(result, pa.ChunkedArray)
+        assert result.to_pylist() == ["a_b", "a_b_1", "a_b_2"]
+
+
+class TestArrowDictionary:
+    def test_dictionary_converted(self) -> None:
+        x = pa.array(["a b", "a_b", "nCount", None, "a b"]).dictionary_encode()
+        result = snake_case(x)
+        assert isinstance(result, pa.DictionaryArray)
+        # Entries that converge are merged in the converted dictionary.
+        assert result.dictionary.to_pylist() == ["a_b", "n_count"]
+        assert result.to_pylist() == ["a_b", "a_b", "n_count", None, "a_b"]
+
+    def test_dictionary_unique(self) -> None:
+        x = pa.array(["a b", "a b"]).dictionary_encode()
+        assert make_names(x).to_pylist() == ["a_b", "a_b_1"]
@@ -13,6 +13,13 @@ class TestAutopadZerosInt:
         """Single-digit integers: no padding needed (all same width)."""
         assert autopad_zeros([1, 2, 3]) == ["1", "2", "3"]
 
+    def test_negative(self) -> None:
+        """Negative integers are padded after the sign."""
+        assert autopad_zeros([-1, -10]) == ["-01", "-10"]
+
+    def test_empty(self) -> None:
+        assert autopad_zeros([]) == []
+
 
 class TestAutopadZerosStr:
     def test_left_number(self) -> None:
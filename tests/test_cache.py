@@ -0,0 +1,81 @@
+"""Tests for the conversion cache."""
+
+import pytest
+
+from syntactic import (
+    cache_enabled,
+    cache_info,
+    camel_case,
+    clear_cache,
+    disable_cache,
+    enable_cache,
+    make_words,
+    snake_case,
+)
+
+NAMES = ["sampleID", "nCount", "sampleID", "G2M.Score"]
+
+
+class TestCache:
+    def test_disabled_by_default(self) -> None:
+        assert cache_info() is None
+
+    def test_context_manager(self) -> None:
+        with cache_enabled():
+            assert snake_case(NAMES) == ["sample_id", "n_count", "sample_id", "g2m_score"]
+            first = cache_info()
+            assert first is not None
+            assert first.misses > 0
+            assert snake_case(NAMES) == ["sample_id", "n_count", "sample_id", "g2m_score"]
+            second = cache_info()
+            assert second is not None
+            assert second.misses == first.misses
+            assert second.hits == first.hits + len(NAMES)
+        assert cache_info() is None
+
+    def test_one_entry_per_string(self) -> None:
+        unique = list(dict.fromkeys(NAMES))
+        with cache_enabled():
+            snake_case(NAMES)
+            info = cache_info()
+            assert info is not None
+            assert info.misses == len(unique)
+            assert info.currsize == len(unique)
+            make_words(NAMES)
+            info = cache_info()
+            assert info is not None
+            assert info.currsize == 2 * len(unique)
+
+    def test_results_match_uncached(self) -> None:
+        expected = (camel_case(NAMES, strict=False), make_words(NAMES))
+        with cache_enabled():
+            for _ in range(2):
+                assert camel_case(NAMES, strict=False) == expected[0]
+                assert make_words(NAMES) == expected[1]
+            # Options are part of the key.
+            assert camel_case(NAMES, strict=True) != expected[0]
+
+    def test_eviction(self) -> None:
+        with cache_enabled(maxsize=2):
+            snake_case(["a", "b", "c"])
+            info = cache_info()
+            assert info is not None
+            assert info.currsize == 2
+            assert info.evictions > 0
+
+    def test_global_switch_and_clear(self) -> None:
+        enable_cache(maxsize=16)
+        try:
+            snake_case(["fooBar"])
+            info = cache_info()
+            assert info is not None
+            assert info.currsize > 0
+            clear_cache()
+            assert cache_info() == (0, 0, 0, 16, 0)
+        finally:
+            disable_cache()
+        assert cache_info() is None
+
+    def test_invalid_maxsize(self) -> None:
+        with pytest.raises(ValueError, match="maxsize"), cache_enabled(maxsize=0):
+            pass
@@ -22,6 +22,15 @@ class TestCapitalizeNonStrict:
             "NASA",
         ]
 
+    def test_batch(self) -> None:
+        """Empty strings, repeated spaces, non-ASCII and NUL characters."""
+        assert capitalize(["", "a  b", "élan vital", "a\0b c"]) == [
+            "",
+            "A  B",
+            "Élan Vital",
+            "A\0b C",
+        ]
+
 
 class TestCapitalizeStrict:
     def test_basic(self) -> None:
@@ -55,6 +64,16 @@ class TestSentenceCase:
             "Using AIC for model selection",
         ]
 
+    def test_mixed_case_words(self) -> None:
+        assert sentence_case(["the p.Value of nCount", "Mean UMIs Per Cell"]) == [
+            "The p.Value of nCount",
+            "Mean UMIs per cell",
+        ]
+
+    def test_non_ascii(self) -> None:
+        assert sentence_case(["Élan Vital AIC"]) == ["Élan vital AIC"]
+        assert sentence_case(["ΑΣ ΑΣ"], strict=True) == ["Ασ ας"]
+
     def test_r_fixture(self) -> None:
         """Port of R test-sentenceCase.R: capitalize first word, preserve acronyms."""
         assert sentence_case(R_FIXTURE) == [
@@ -0,0 +1,51 @@
+"""Tests for multi-format conversion."""
+
+import pytest
+
+from syntactic import (
+    camel_case,
+    convert,
+    dotted_case,
+    kebab_case,
+    screaming_snake_case,
+    snake_case,
+    train_case,
+    upper_camel_case,
+)
+
+NAMES = ["%GC", "10uM", "1 foo bar", "nCount", "TX2GeneID", "worfdbHTMLRemap", "nCount"]
+
+FUNS = {
+    "snake": snake_case,
+    "kebab": kebab_case,
+    "dotted": dotted_case,
+    "screaming_snake": screaming_snake_case,
+    "camel": camel_case,
+    "upper_camel": upper_camel_case,
+    "train": train_case,
+}
+
+
+class TestConvert:
+    @pytest.mark.parametrize("strict", [True, False])
+    @pytest.mark.parametrize("prefix", [True, False])
+    def test_matches_single_format(self, strict: bool, prefix: bool) -> None:
+        result = convert(NAMES, formats=FUNS, strict=strict, prefix=prefix)
+        assert list(result) == list(FUNS)
+        for fmt, fun in FUNS.items():
+            if fmt in ("camel", "upper_camel", "train"):
+                expected = fun(NAMES, strict=strict, prefix=prefix)
+            else:
+                expected = fun(NAMES, prefix=prefix)
+            assert result[fmt] == expected
+
+    def test_factorize(self) -> None:
+        formats = ["snake", "camel"]
+        assert convert(NAMES, formats, factorize=True) == convert(NAMES, formats, factorize=False)
+
+    def test_string(self) -> None:
+        assert convert("sampleID", formats=["kebab"]) == {"kebab": ["sample-id"]}
+
+    def test_invalid_format(self) -> None:
+        with pytest.raises(ValueError, match="Invalid format 'pascal'"):
+            convert(NAMES, formats=["snake", "pascal"])
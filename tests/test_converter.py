@@ -0,0 +1,67 @@
+"""Tests for reusable Converter objects."""
+
+from collections.abc import Callable
+
+import pytest
+
+from syntactic import (
+    Converter,
+    cache_enabled,
+    camel_case,
+    convert,
+    kebab_case,
+    snake_case,
+    upper_camel_case,
+)
+
+NAMES = ["%GC", "10uM", "1 foo bar", "nCount", "RNAi clones", "TX2GeneID", "worfdbHTMLRemap"]
+
+
+class TestConverter:
+    @pytest.mark.parametrize(
+        ("fmt", "fun"),
+        [
+            ("snake", snake_case),
+            ("kebab", kebab_case),
+            ("camel", camel_case),
+            ("upper_camel", upper_camel_case),
+        ],
+    )
+    @pytest.mark.parametrize("smart", [True, False])
+    @pytest.mark.parametrize("prefix", [True, False])
+    def test_matches_function(
+        self,
+        fmt: str,
+        fun: Callable[..., list[str]],
+        smart: bool,
+        prefix: bool,
+    ) -> None:
+        converter = Converter(fmt, smart=smart, prefix=prefix)
+        expected = fun(NAMES, smart=smart, prefix=prefix)
+        assert converter(NAMES) == expected
+        assert [converter(s) for s in NAMES] == expected
+
+    @pytest.mark.parametrize("strict", [True, False])
+    def test_strict(self, strict: bool) -> None:
+        for fmt in ("camel", "upper_camel", "train"):
+            converter = Converter(fmt, strict=strict)
+            expected = convert(NAMES, [fmt], strict=strict)[fmt]
+            assert [converter(s) for s in NAMES] == expected
+
+    def test_string_returns_string(self) -> None:
+        assert Converter("snake")("sampleID") == "sample_id"
+
+    def test_cache(self) -> None:
+        converter = Converter("kebab")
+        with cache_enabled():
+            assert converter("sampleID") == "sample-id"
+            assert converter("sampleID") == "sample-id"
+
+    def test_invalid_format(self) -> None:
+        with pytest.raises(ValueError, match="Invalid format"):
+            Converter("pascal")
+
+    def test_repr(self) -> None:
+        assert repr(Converter("camel", strict=False)) == (
+            "Converter(format='camel', strict=False, smart=True, prefix=True)"
+        )
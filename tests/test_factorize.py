@@ -0,0 +1,63 @@
+"""Tests for factorized (dedupe-then-scatter) execution."""
+
+from collections.abc import Callable
+from unittest.mock import patch
+
+import pytest
+
+from syntactic import (
+    camel_case,
+    dotted_case,
+    kebab_case,
+    make_names,
+    make_words,
+    snake_case,
+    upper_camel_case,
+)
+from syntactic._factorize import _factorize, _use_factorize
+
+NAMES = ["sampleID", "nCount", "1 foo bar", "sampleID", "a-b", "a-b", "a_b_1", "%GC"] * 400
+
+
+def test_factorize() -> None:
+    codes, uniques = _factorize(["b", "a", "b", "c", "a"])
+    assert codes == [0, 1, 0, 2, 1]
+    assert uniques == ["b", "a", "c"]
+
+
+class TestUseFactorize:
+    def test_explicit(self) -> None:
+        assert _use_factorize(["a"], True)
+        assert not _use_factorize(NAMES, False)
+
+    def test_auto_repetitive(self) -> None:
+        assert _use_factorize(NAMES, None)
+
+    def test_auto_distinct(self) -> None:
+        assert not _use_factorize([str(i) for i in range(10000)], None)
+
+    def test_auto_small(self) -> None:
+        assert not _use_factorize(["a"] * 10, None)
+
+
+@pytest.mark.parametrize(
+    "fun", [camel_case, upper_camel_case, snake_case, kebab_case, dotted_case, make_words]
+)
+def test_case_conversion(fun: Callable[..., list[str]]) -> None:
+    expected = fun(NAMES, factorize=False)
+    assert fun(NAMES, factorize=True) == expected
+    assert fun(NAMES) == expected
+
+
+@pytest.mark.parametrize("unique", [True, False])
+@pytest.mark.parametrize("smart", [True, False])
+def test_make_names(unique: bool, smart: bool) -> None:
+    expected = make_names(NAMES, unique=unique, smart=smart, factorize=False)
+    assert make_names(NAMES, unique=unique, smart=smart, factorize=True) == expected
+
+
+def test_converts_uniques_once() -> None:
+    with patch("syntactic.case_conversion._convert_case", wraps=lambda x, **_: x) as engine:
+        snake_case(NAMES, factorize=True)
+    (x,), _ = engine.call_args
+    assert x == list(dict.fromkeys(NAMES))
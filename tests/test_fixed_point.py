@@ -0,0 +1,82 @@
+"""Tests for the already-conformant fast path of case conversion."""
+
+import itertools
+import random
+
+import pytest
+
+from syntactic import camel_case, snake_case, upper_camel_case
+from syntactic._engine import _RENDERERS, _fixed_point, _syntactic, _tokenize
+
+ATOMS = [
+    *"abcxyzXYZABmnuMsSid019_-.",
+    *("id", "Id", "ID", "iD", "nM", "RNA", "mRNA", "EtOH", "RNAi", "x1", "X1", "Bcd", "1s"),
+]
+
+
+def _full_pipeline(x: list[str], fmt: str, *, strict: bool, smart: bool, prefix: bool) -> list[str]:
+    """Convert strings without the fast path."""
+    render = _RENDERERS[fmt]
+    return [render(_tokenize(s), strict) for s in _syntactic(x, smart=smart, prefix=prefix)]
+
+
+@pytest.fixture(scope="module")
+def candidates() -> list[str]:
+    rng = random.Random(0)
+    return sorted({"".join(rng.choices(ATOMS, k=rng.randint(1, 5))) for _ in range(20000)})
+
+
+@pytest.mark.parametrize("fmt", list(_RENDERERS))
+@pytest.mark.parametrize(
+    ("strict", "smart", "prefix"), list(itertools.product([True, False], repeat=3))
+)
+def test_fixed_points_match_full_pipeline(
+    candidates: list[str],
+    fmt: str,
+    strict: bool,
+    smart: bool,
+    prefix: bool,
+) -> None:
+    matcher = _fixed_point(fmt, strict=strict, smart=smart, prefix=prefix)
+    converted = _full_pipeline(candidates, fmt, strict=strict, smart=smart, prefix=prefix)
+    expected = [s == t for s, t in zip(candidates, converted, strict=True)]
+    assert any(expected)
+    assert [matcher(s) is not None for s in candidates] == expected
+
+
+class TestFixedPoint:
+    def test_snake(self) -> None:
+        match = _fixed_point("snake", strict=True, smart=True, prefix=True)
+        assert match("sample_id")
+        assert not match("sampleID")
+        assert not match("a__b")
+        assert not match("_a")
+
+    def test_prefix(self) -> None:
+        assert _fixed_point("snake", strict=True, smart=True, prefix=True)("x1_a")
+        assert not _fixed_point("snake", strict=True, smart=True, prefix=False)("x1_a")
+        assert snake_case(["x1_a"], prefix=False) == ["1_a"]
+
+    def test_camel(self) -> None:
+        match = _fixed_point("camel", strict=True, smart=True, prefix=True)
+        assert match("sampleId")
+        assert not match("sampleID")
+        # Molarity is lowercased by acronym sanitization.
+        assert not match("dose10nM")
+        assert camel_case(["dose10nM"]) == ["dose10nm"]
+
+    def test_upper_camel_acronyms(self) -> None:
+        assert not _fixed_point("upper_camel", strict=False, smart=True, prefix=True)("Id")
+        assert upper_camel_case(["Id"], strict=False) == ["ID"]
+        assert _fixed_point("upper_camel", strict=False, smart=False, prefix=True)("Id")
+        assert _fixed_point("upper_camel", strict=True, smart=True, prefix=True)("Id")
+
+    def test_long_acronym(self) -> None:
+        match = _fixed_point("camel", strict=True, smart=True, prefix=True)
+        assert match("aM1Bz9")
+        assert camel_case(["aM1Bz9"]) == ["aM1Bz9"]
+
+
+def test_mixed_batch() -> None:
+    x = ["sample_id", "sampleID", "n_count", "nCount RNA"]
+    assert snake_case(x) == ["sample_id", "sample_id", "n_count", "n_count_rna"]
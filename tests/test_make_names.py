@@ -1,6 +1,6 @@
 """Tests for make_names."""
 
-from syntactic import make_names
+from syntactic import NamePipeline, UniqueNamer, make_names
 
 # Canonical 14-string fixture (same as R's AcidTest syntactic[["character"]]).
 # Note: last element is "123" (pure digits); case-conversion tests use "x123"
@@ -135,3 +135,61 @@ class TestMakeNames:
     def test_smart_times(self) -> None:
         assert make_names(["a*b"], smart=True) == ["a_times_b"]
         assert make_names(["a*b"], smart=False) == ["a_b"]
+
+    def test_micro_sign(self) -> None:
+        """Micro sign, Greek mu, and its HTML entity all map to "u"."""
+        assert make_names(["10µM", "10μM", "10&#181;M"], unique=False) == [
+            "X10uM",
+            "X10uM",
+            "X10uM",
+        ]
+        assert make_names(["Μ"]) == ["Mu"]
+
+    def test_accented_characters(self) -> None:
+        """Characters without a table entry fall back to NFKD decomposition."""
+        assert make_names(["café", "naïve", "ﬁle", "Æon"]) == [
+            "cafe",
+            "naive",
+            "file",
+            "AEon",
+        ]
+        assert make_names(["中文 text"]) == ["text"]
+
+
+class TestNamePipeline:
+    def test_matches_make_names(self) -> None:
+        pipeline = NamePipeline(unique=True, smart=True)
+        assert pipeline(UNNAMED) == make_names(UNNAMED, unique=True, smart=True)
+
+    def test_unique_state_is_per_call(self) -> None:
+        pipeline = NamePipeline(unique=True)
+        assert pipeline(["a", "a"]) == ["a", "a_1"]
+        assert pipeline(["a"]) == ["a"]
+
+    def test_accepts_iterables(self) -> None:
+        pipeline = NamePipeline(unique=False)
+        assert pipeline(s for s in ["a b", "1c"]) == ["a_b", "X1c"]
+
+    def test_underscore_cleanup(self) -> None:
+        assert make_names(["__a__b__", "_", "__1"], unique=False) == ["a_b", "X", "1"]
+
+
+class TestUniqueNamer:
+    def test_batches_match_single_call(self) -> None:
+        batches = [["a", "a_1", "a"], ["a", "b"], ["a_1", "a", "b"]]
+        namer = UniqueNamer()
+        result = [name for batch in batches for name in namer(batch)]
+        assert result == make_names([name for batch in batches for name in batch])
+        assert len(namer) == len(result)
+
+    def test_suffix_collisions(self) -> None:
+        """Duplicates skip past suffixes that are already taken."""
+        names = ["a_1", "a_2", "a", "a", "a", "a_3"]
+        assert make_names(names) == ["a_1", "a_2", "a", "a_3", "a_4", "a_3_1"]
+
+    def test_reset(self) -> None:
+        namer = UniqueNamer(smart=True)
+        assert namer("a+b") == ["a_plus_b"]
+        assert namer("a+b") == ["a_plus_b_1"]
+        namer.reset()
+        assert namer("a+b") == ["a_plus_b"]
@@ -1,6 +1,8 @@
 """Tests for make_words, make_title, make_label."""
 
-from syntactic import make_label, make_title, make_words
+import pytest
+
+from syntactic import make_label, make_labels, make_title, make_words
 
 MW = [
     "log10GenesPerUMI",
@@ -42,3 +44,27 @@ class TestMakeLabel:
             "NASA",
             "N gene",
         ]
+
+
+class TestMakeLabels:
+    def test_matches_single_kind(self) -> None:
+        x = [*MW, "gene", "nGene"]
+        assert make_labels(x) == {
+            "words": make_words(x),
+            "title": make_title(x),
+            "label": make_label(x),
+        }
+
+    def test_kinds(self) -> None:
+        assert make_labels("nGene", kinds=["label", "words"]) == {
+            "label": ["N gene"],
+            "words": ["n gene"],
+        }
+
+    def test_factorize(self) -> None:
+        x = MW * 3
+        assert make_labels(x, factorize=True) == make_labels(x, factorize=False)
+
+    def test_invalid_kind(self) -> None:
+        with pytest.raises(ValueError, match="Invalid kind 'caption'"):
+            make_labels(MW, kinds=["words", "caption"])
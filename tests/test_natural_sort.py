@@ -0,0 +1,70 @@
+"""Tests for natural_sort_key and natural_argsort."""
+
+import pytest
+
+from syntactic import natural_argsort, natural_sort_key, pad_zeros
+
+
+def natural_sorted(x: list[str]) -> list[str]:
+    return [x[i] for i in natural_argsort(x)]
+
+
+class TestNaturalSortKey:
+    def test_key(self) -> None:
+        assert natural_sort_key("sample_01_rep10") == (
+            "sample_",
+            (1, "1"),
+            "_rep",
+            (2, "10"),
+            "",
+        )
+        assert natural_sort_key("") == ("",)
+
+    def test_sorted(self) -> None:
+        x = ["sample_10", "sample_2", "sample_1"]
+        assert sorted(x, key=natural_sort_key) == ["sample_1", "sample_2", "sample_10"]
+
+    def test_long_numbers(self) -> None:
+        """Digit runs beyond the int conversion limit still compare exactly."""
+        big = "9" * 5000
+        x = [f"a{big}", f"a{big}0", "a10", f"a0{big}"]
+        assert sorted(x, key=natural_sort_key) == ["a10", f"a{big}", f"a0{big}", f"a{big}0"]
+
+
+class TestNaturalArgsort:
+    def test_basic(self) -> None:
+        x = ["sample_10", "sample_2", "control", "sample_1"]
+        assert natural_argsort(x) == [2, 3, 1, 0]
+
+    def test_mixed(self) -> None:
+        """Strings need not share a pattern, and numbers sort before text."""
+        x = ["b2", "10", "a10", "2", "a9", "a", "", "a9b", "a9a1"]
+        assert natural_sorted(x) == ["", "2", "10", "a", "a9", "a9a1", "a9b", "a10", "b2"]
+
+    def test_ints(self) -> None:
+        assert natural_argsort([10, 9, 100]) == [1, 0, 2]
+
+    def test_stable(self) -> None:
+        """Numbers that only differ by leading zeros tie in input order."""
+        assert natural_argsort(["x01", "x1", "x001", "x0", "x"]) == [4, 3, 0, 1, 2]
+
+    def test_agrees_with_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Keys of strings with NUL or newline characters fall back."""
+        monkeypatch.setattr(pad_zeros, "_KEY_CHUNK_SIZE", 3)
+        x = ["a\n2", "a\n10", "a1", "b\x001", "b\x0010", "a", "10", "007", "a 2"]
+        for y in (x, x[3:], [s for s in x if "\0" not in s]):
+            assert natural_sorted(y) == sorted(y, key=natural_sort_key)
+
+    def test_long_numbers(self) -> None:
+        big = "9" * 5000
+        x = [f"a{big}0", f"\0{big}", "a10", f"a{big}"]
+        assert natural_argsort(x) == [1, 2, 3, 0]
+        assert natural_argsort(x[1:]) == [0, 1, 2]
+
+    def test_ndarray(self) -> None:
+        np = pytest.importorskip("numpy")
+        result = natural_argsort(np.array(["a10", "a9"]))
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [1, 0]
+        with pytest.raises(ValueError, match="one-dimensional"):
+            natural_argsort(np.array([["a"]]))
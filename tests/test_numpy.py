@@ -0,0 +1,121 @@
+"""Tests for the NumPy array backend."""
+
+from collections.abc import Callable
+
+import pytest
+
+from syntactic import (
+    autopad_zeros,
+    camel_case,
+    dotted_case,
+    kebab_case,
+    make_names,
+    make_words,
+    screaming_snake_case,
+    snake_case,
+    train_case,
+    upper_camel_case,
+)
+
+np = pytest.importorskip("numpy")
+
+NAMES = [
+    "%GC",
+    "10uM",
+    "hello world",
+    "hello_world",
+    "helloWorld",
+    "nCount",
+    "RNAi clones",
+    "TX2GeneID",
+    "abc",
+    "Abc",
+    "x1",
+    "a_b",
+    "a-b",
+    "a.b",
+    "abc",
+]
+
+
+@pytest.fixture(params=["T", "U", "O"])
+def names(request: pytest.FixtureRequest) -> "np.ndarray":
+    dtype = np.dtypes.StringDType() if request.param == "T" else request.param
+    return np.array(NAMES, dtype=dtype)
+
+
+class TestNumpyCaseConversion:
+    @pytest.mark.parametrize("fun", [snake_case, kebab_case, dotted_case, screaming_snake_case])
+    @pytest.mark.parametrize("prefix", [True, False])
+    def test_delimited(
+        self, names: "np.ndarray", fun: Callable[..., list[str]], prefix: bool
+    ) -> None:
+        result = fun(names, prefix=prefix)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype.kind == names.dtype.kind
+        assert result.tolist() == fun(NAMES, prefix=prefix)
+
+    @pytest.mark.parametrize("fun", [camel_case, upper_camel_case, train_case])
+    @pytest.mark.parametrize("strict", [True, False])
+    @pytest.mark.parametrize("prefix", [True, False])
+    def test_camel(
+        self,
+        names: "np.ndarray",
+        fun: Callable[..., list[str]],
+        strict: bool,
+        prefix: bool,
+    ) -> None:
+        result = fun(names, strict=strict, prefix=prefix)
+        assert result.tolist() == fun(NAMES, strict=strict, prefix=prefix)
+
+    def test_make_words(self, names: "np.ndarray") -> None:
+        assert make_words(names).tolist() == make_words(NAMES)
+
+    def test_shape_preserved(self) -> None:
+        result = snake_case(np.array([["fooBar", "a b"], ["c", "D"]]))
+        assert result.shape == (2, 2)
+        assert result.tolist() == [["foo_bar", "a_b"], ["c", "d"]]
+
+
+class TestNumpyMakeNames:
+    @pytest.mark.parametrize("unique", [True, False])
+    @pytest.mark.parametrize("smart", [True, False])
+    def test_matches_list(self, names: "np.ndarray", unique: bool, smart: bool) -> None:
+        result = make_names(names, unique=unique, smart=smart)
+        assert result.tolist() == make_names(NAMES, unique=unique, smart=smart)
+
+    def test_unique_collisions(self) -> None:
+        x = ["a_1", "a", "a", "a b", "a_b"]
+        assert make_names(np.array(x)).tolist() == make_names(x)
+
+
+class TestNumpyAutopadZeros:
+    def test_int_array(self) -> None:
+        result = autopad_zeros(np.array([1, 10, 100]))
+        assert result.tolist() == ["001", "010", "100"]
+
+    def test_uint_array(self) -> None:
+        result = autopad_zeros(np.array([[0, 7], [12, 3]], dtype=np.uint8))
+        assert result.tolist() == [["00", "07"], ["12", "03"]]
+
+    def test_pandas_series(self) -> None:
+        pd = pytest.importorskip("pandas")
+        assert autopad_zeros(pd.Series([1, 10, 100], dtype="Int64")) == ["001", "010", "100"]
+        assert autopad_zeros(pd.Index([5, 50])) == ["05", "50"]
+
+    def test_pandas_strings(self) -> None:
+        pd = pytest.importorskip("pandas")
+        assert autopad_zeros(pd.Series(["a1", "a10"])) == ["a01", "a10"]
+        assert autopad_zeros(pd.Index(["a1", "a10"])) == ["a01", "a10"]
+        assert autopad_zeros(pd.Series(["1-EV", "10-EV"], dtype="string")) == ["01-EV", "10-EV"]
+        assert autopad_zeros(pd.Series([1.0, 10.0])) == ["01.0", "10.0"]
+        assert autopad_zeros(pd.Series([], dtype=object)) == []
+
+    def test_str_array(self) -> None:
+        result = autopad_zeros(np.array(["A1", "B10", "C100"]))
+        assert result.dtype.kind == "U"
+        assert result.tolist() == ["A001", "B010", "C100"]
+
+    def test_partial_padding_raises(self) -> None:
+        with pytest.raises(ValueError, match="Partial padding"):
+            autopad_zeros(np.array(["1", "10", "X"]))
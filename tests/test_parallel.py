@@ -0,0 +1,73 @@
+"""Tests for the process-pool batch executor."""
+
+import os
+from collections.abc import Callable, Iterator
+
+import pytest
+
+from syntactic import (
+    BatchExecutor,
+    camel_case,
+    dotted_case,
+    kebab_case,
+    make_names,
+    make_words,
+    snake_case,
+    upper_camel_case,
+)
+
+NAMES = ["sampleID", "nCount", "1 foo bar", "sampleID", "a-b", "a-b", "a_b_1", "%GC", "αβγ"] * 5
+
+
+@pytest.fixture(scope="module")
+def executor() -> Iterator[BatchExecutor]:
+    with BatchExecutor(workers=2, chunk_size=4) as executor:
+        yield executor
+
+
+class TestBatchExecutor:
+    @pytest.mark.parametrize("unique", [True, False])
+    @pytest.mark.parametrize("smart", [True, False])
+    def test_make_names(self, executor: BatchExecutor, unique: bool, smart: bool) -> None:
+        result = executor.make_names(NAMES, unique=unique, smart=smart)
+        assert result == make_names(NAMES, unique=unique, smart=smart)
+
+    @pytest.mark.parametrize(
+        "fun", [camel_case, upper_camel_case, snake_case, kebab_case, dotted_case]
+    )
+    def test_case_conversion(self, executor: BatchExecutor, fun: Callable[..., list[str]]) -> None:
+        assert getattr(executor, fun.__name__)(NAMES, smart=False) == fun(NAMES, smart=False)
+
+    def test_make_words(self, executor: BatchExecutor) -> None:
+        assert executor.make_words(NAMES) == make_words(NAMES)
+
+    def test_surrogates(self, executor: BatchExecutor) -> None:
+        names = ["file\udcff name", *NAMES]
+        assert executor.map(snake_case, names) == snake_case(names)
+
+    def test_iterable(self, executor: BatchExecutor) -> None:
+        assert executor.snake_case(iter(NAMES)) == snake_case(NAMES)
+
+    def test_serial(self) -> None:
+        executor = BatchExecutor(workers=2)
+        assert executor.snake_case(NAMES) == snake_case(NAMES)
+        assert executor._pool is None
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="workers"):
+            BatchExecutor(workers=0)
+        with pytest.raises(ValueError, match="chunk_size"):
+            BatchExecutor(chunk_size=0)
+
+    def test_failed_chunk_releases_outputs(self) -> None:
+        """Output blocks of the other chunks are released after a failure."""
+        if not os.path.isdir("/dev/shm"):
+            pytest.skip("Shared memory blocks are not listed in /dev/shm.")
+        before = set(os.listdir("/dev/shm"))
+        names = ["", *NAMES * 100]
+        with (
+            BatchExecutor(workers=2, chunk_size=16) as executor,
+            pytest.raises(AssertionError, match="non-empty"),
+        ):
+            executor.make_names(names)
+        assert set(os.listdir("/dev/shm")) <= before
@@ -2,8 +2,12 @@
 
 import os
 import tempfile
+from collections import Counter
+from collections.abc import Callable
 
-from syntactic import syntactic_rename
+import pytest
+
+from syntactic import RenamePlan, rename, snake_case, syntactic_rename
 
 
 class TestRename:
@@ -226,3 +230,329 @@ class TestRename:
                 "level-1",  # level_1 (dir)
                 os.path.basename(real_path),  # root unchanged
             ]
+
+
+def _make_tree(root: str, n: int) -> None:
+    """Create nested directories holding n files each."""
+    for d in ["aaa_bbb", os.path.join("aaa_bbb", "ccc_ddd")]:
+        os.makedirs(os.path.join(root, d))
+        for i in range(n):
+            open(os.path.join(root, d, f"File {i}.txt"), "w").close()
+
+
+class TestTraversal:
+    def _count_calls(self, monkeypatch: pytest.MonkeyPatch, root: str) -> Counter[str]:
+        """Count stat and directory listing calls of a recursive dry run."""
+        calls: Counter[str] = Counter()
+        for name in ("stat", "lstat", "scandir", "listdir"):
+            func = getattr(os, name)
+
+            def counted(
+                *args: object,
+                _name: str = name,
+                _func: Callable[..., object] = func,
+                **kwargs: object,
+            ) -> object:
+                calls[_name] += 1
+                return _func(*args, **kwargs)
+
+            monkeypatch.setattr(os, name, counted)
+        syntactic_rename(root, recursive=True, dry_run=True, quiet=True)
+        monkeypatch.undo()
+        return calls
+
+    def test_stat_calls_independent_of_tree_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Entry types come from the directory listing, one scan per directory."""
+        counts = []
+        for n in (5, 50):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                root = os.path.join(tmpdir, "root")
+                _make_tree(root, n)
+                counts.append(self._count_calls(monkeypatch, root))
+        assert counts[0] == counts[1]
+        assert counts[0]["scandir"] == 3
+        assert counts[0]["listdir"] == 0
+
+    def test_symlinks_resolved(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            real_tmpdir = os.path.realpath(tmpdir)
+            _make_tree(real_tmpdir, 1)
+            target = os.path.join(real_tmpdir, "aaa_bbb", "ccc_ddd")
+            os.symlink(target, os.path.join(real_tmpdir, "Link Dir"))
+            result = syntactic_rename(
+                real_tmpdir, recursive=True, fun="snake_case", dry_run=True, quiet=True
+            )
+            # The symlink resolves to an already visited directory.
+            assert result["from"].count(target) == 1
+            assert os.path.join(real_tmpdir, "Link Dir") not in result["from"]
+
+
+class TestParallelRename:
+    def test_recursive(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = os.path.join(os.path.realpath(tmpdir), "root")
+            _make_tree(root, 20)
+            syntactic_rename(root, recursive=True, fun="snake_case", quiet=True, workers=4)
+            subdir = os.path.join(root, "aaa_bbb", "ccc_ddd")
+            expected = sorted(f"file_{i}.txt" for i in range(20))
+            assert sorted(os.listdir(subdir)) == expected
+            assert sorted(os.listdir(os.path.dirname(subdir))) == ["ccc_ddd", *expected]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_children_before_parent(self, workers: int) -> None:
+        """Directories are renamed after their contents, whatever the input order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            real_tmpdir = os.path.realpath(tmpdir)
+            os.makedirs(os.path.join(real_tmpdir, "Aaa Bbb", "Ccc Ddd"))
+            paths = [
+                os.path.join(real_tmpdir, "Aaa Bbb"),
+                os.path.join(real_tmpdir, "Aaa Bbb", "Ccc Ddd"),
+            ]
+            syntactic_rename(paths, fun="snake_case", quiet=True, workers=workers)
+            assert os.path.isdir(os.path.join(real_tmpdir, "aaa_bbb", "ccc_ddd"))
+
+    def test_conflicts_keep_input_order(self) -> None:
+        """Renames to the same target run in input order, as with one worker."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            real_tmpdir = os.path.realpath(tmpdir)
+            paths = []
+            for name in ["a b.txt", "a_b.txt", "A B.txt"]:
+                p = os.path.join(real_tmpdir, name)
+                with open(p, "w") as f:
+                    f.write(name)
+                paths.append(p)
+            targets = [os.path.join(real_tmpdir, "a-b.txt")] * len(paths)
+            rename._execute_renames(paths, targets, quiet=True, workers=4)
+            assert os.listdir(real_tmpdir) == ["a-b.txt"]
+            with open(os.path.join(real_tmpdir, "a-b.txt")) as f:
+                assert f.read() == "A B.txt"
+
+    def test_invalid_workers(self) -> None:
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            pytest.raises(ValueError, match="workers must be a positive integer"),
+        ):
+            syntactic_rename(tmpdir, quiet=True, workers=0)
+
+
+class TestCaseSensitivity:
+    def _count_renames(self, monkeypatch: pytest.MonkeyPatch) -> Counter[str]:
+        calls: Counter[str] = Counter()
+        real_rename = os.rename
+
+        def counted(src: str, dst: str) -> None:
+            calls["rename"] += 1
+            real_rename(src, dst)
+
+        monkeypatch.setattr(os, "rename", counted)
+        return calls
+
+    def test_single_rename_unless_case_only(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Names that differ by more than case never need the probe or a temp name."""
+
+        def probe(path: str = ".") -> bool:
+            raise AssertionError("Case sensitivity probed.")
+
+        monkeypatch.setattr(rename, "_is_case_sensitive_fs", probe)
+        calls = self._count_renames(monkeypatch)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ["Hello World.txt", "FOO BAR.txt"]:
+                open(os.path.join(tmpdir, name), "w").close()
+            syntactic_rename(tmpdir, fun="snake_case", quiet=True)
+            assert sorted(os.listdir(tmpdir)) == ["foo_bar.txt", "hello_world.txt"]
+        assert calls["rename"] == 2
+
+    def test_probe_cached_per_device(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        probed = []
+
+        def probe(path: str = ".") -> bool:
+            probed.append(path)
+            return False
+
+        monkeypatch.setattr(rename, "_is_case_sensitive_fs", probe)
+        monkeypatch.setattr(rename, "_CASE_SENSITIVE", {})
+        calls = self._count_renames(monkeypatch)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = os.path.join(os.path.realpath(tmpdir), "root")
+            for d in ["aaa", "bbb"]:
+                os.makedirs(os.path.join(root, d))
+                open(os.path.join(root, d, "FOO.txt"), "w").close()
+            syntactic_rename(root, recursive=True, fun="snake_case", quiet=True, workers=2)
+            for d in ["aaa", "bbb"]:
+                assert os.listdir(os.path.join(root, d)) == ["foo.txt"]
+        assert len(probed) == 1
+        assert calls["rename"] == 4
+
+
+class TestBatchedNames:
+    def test_unique_stems_named_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls = []
+
+        def naming_fn(x: list[str], **kwargs: bool) -> list[str]:
+            calls.append(list(x))
+            return snake_case(x, **kwargs)
+
+        monkeypatch.setattr(rename, "snake_case", naming_fn)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = os.path.join(os.path.realpath(tmpdir), "root")
+            for d in ["Run 1", "Run 2"]:
+                os.makedirs(os.path.join(root, d))
+                for name in ["README.md", "Sample Sheet.csv", "Reads.fastq.gz"]:
+                    open(os.path.join(root, d, name), "w").close()
+            result = syntactic_rename(root, recursive=True, fun="snake_case", quiet=True)
+        assert len(calls) == 1
+        assert sorted(calls[0]) == ["README", "Reads", "Run 1", "Run 2", "Sample Sheet", "root"]
+        assert sorted({os.path.basename(p) for p in result["to"]}) == [
+            "readme.md",
+            "reads.fastq.gz",
+            "root",
+            "run_1",
+            "run_2",
+            "sample_sheet.csv",
+        ]
+
+
+def _make_files(root: str, names: list[str]) -> list[str]:
+    """Create files holding their own names, and return their paths."""
+    os.makedirs(root, exist_ok=True)
+    paths = []
+    for name in names:
+        p = os.path.join(root, name)
+        with open(p, "w") as f:
+            f.write(name)
+        paths.append(p)
+    return paths
+
+
+class TestRenamePlan:
+    def test_build(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = os.path.join(os.path.realpath(tmpdir), "root")
+            _make_files(root, ["Hello World.txt", "_skip.txt"])
+            plan = RenamePlan.build(root, fun="snake_case", quiet=True)
+            assert len(plan) == 1
+            assert not plan.collisions
+            assert sorted(os.path.basename(p) for p in plan.to_paths) == [
+                "_skip.txt",
+                "hello_world.txt",
+            ]
+            assert repr(plan) == "RenamePlan(renames=1, done=0, collisions=0)"
+
+    def test_collisions(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = os.path.join(os.path.realpath(tmpdir), "root")
+            a, b, c = _make_files(root, ["a b.txt", "a_b.txt", "c-d.txt"])
+            d = os.path.join(root, "C D.txt")
+            open(d, "w").close()
+            plan = RenamePlan.build(root, fun="kebab_case", quiet=True)
+            assert plan.collisions == {
+                os.path.join(root, "a-b.txt"): [a, b],
+                c: [d, c],
+            }
+            # Renaming anything at all is refused.
+            with pytest.raises(FileExistsError, match="taken by another path"):
+                syntactic_rename(root, fun="kebab_case", quiet=True)
+            assert sorted(os.listdir(root)) == ["C D.txt", "a b.txt", "a_b.txt", "c-d.txt"]
+
+    def test_collision_with_unlisted_path(self) -> None:
+        """Targets outside the listed directories are checked on disk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            a, b = _make_files(os.path.realpath(tmpdir), ["A B.txt", "a-b.txt"])
+            assert RenamePlan.build([a], quiet=True).collisions == {b: [a, b]}
+
+    def test_case_only_collision_with_unlisted_path(self) -> None:
+        """A case-only rename must not overwrite a different file of that name."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = os.path.realpath(tmpdir)
+            upper = os.path.join(root, "FOO")
+            lower = os.path.join(root, "foo")
+            _make_files(root, ["FOO"])
+            if os.path.exists(lower):
+                pytest.skip("Case-insensitive file system.")
+            _make_files(root, ["foo"])
+            assert RenamePlan.build([upper], quiet=True).collisions == {lower: [upper, lower]}
+            with pytest.raises(FileExistsError, match="taken by another path"):
+                syntactic_rename(upper, quiet=True)
+            with open(lower) as f:
+                assert f.read() == "foo"
+
+    def test_case_only_rename_of_unlisted_path(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (upper,) = _make_files(os.path.realpath(tmpdir), ["FOO"])
+            assert not RenamePlan.build([upper], quiet=True).collisions
+
+    def test_targets_in_source_directory(self) -> None:
+        with pytest.raises(ValueError, match="not in the source directory"):
+            RenamePlan(["/a/b"], ["/c/b"])
+
+    def test_save_load(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = os.path.join(os.path.realpath(tmpdir), "root")
+            _make_files(root, ["Hello World.txt", "_skip.txt"])
+            journal = os.path.join(tmpdir, "rename.journal")
+            plan = RenamePlan.build(root, recursive=True, quiet=True)
+            plan.save(journal)
+            loaded = RenamePlan.load(journal)
+            assert loaded.from_paths == plan.from_paths
+            assert loaded.to_paths == plan.to_paths
+            assert loaded.journal == journal
+
+    def test_resume_and_undo(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        real_rename = os.rename
+
+        def interrupt_after(n: int) -> None:
+            """Interrupt the process on the rename after the first n."""
+            calls = iter(range(n + 1))
+
+            def interrupted(src: str, dst: str) -> None:
+                if next(calls) == n:
+                    raise KeyboardInterrupt
+                real_rename(src, dst)
+
+            monkeypatch.setattr(os, "rename", interrupted)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = os.path.join(os.path.realpath(tmpdir), "root")
+            names = [f"File {i}.txt" for i in range(5)]
+            _make_files(root, names)
+            journal = os.path.join(tmpdir, "rename.journal")
+            RenamePlan.build(root, quiet=True).save(journal)
+            interrupt_after(2)
+            with pytest.raises(KeyboardInterrupt):
+                RenamePlan.load(journal).apply(quiet=True)
+            monkeypatch.undo()
+            plan = RenamePlan.load(journal)
+            assert repr(plan) == "RenamePlan(renames=5, done=2, collisions=0)"
+            # A rename done before an interruption, but not recorded.
+            real_rename(plan.from_paths[4], plan.to_paths[4])
+            plan.apply(quiet=True)
+            assert sorted(os.listdir(root)) == sorted(f"file-{i}.txt" for i in range(5))
+            interrupt_after(2)
+            with pytest.raises(KeyboardInterrupt):
+                RenamePlan.load(journal).undo(quiet=True)
+            monkeypatch.undo()
+            RenamePlan.load(journal).undo(quiet=True)
+            assert sorted(os.listdir(root)) == names
+            for name in names:
+                with open(os.path.join(root, name)) as f:
+                    assert f.read() == name
+
+    def test_incomplete_record_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = os.path.join(os.path.realpath(tmpdir), "root")
+            _make_files(root, [f"File {i}.txt" for i in range(12)])
+            journal = os.path.join(tmpdir, "rename.journal")
+            plan = RenamePlan.build(root, quiet=True)
+            plan.save(journal)
+            plan.apply(quiet=True)
+            with open(journal, "a") as f:
+                f.write("-1")
+            assert len(RenamePlan.load(journal)._done) == 12
+
+    def test_unsupported_version(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal = os.path.join(tmpdir, "rename.journal")
+            with open(journal, "w") as f:
+                f.write('{"version": 0}\n')
+            with pytest.raises(ValueError, match="Unsupported journal version"):
+                RenamePlan.load(journal)
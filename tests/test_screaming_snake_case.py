@@ -0,0 +1,47 @@
+"""Tests for SCREAMING_SNAKE_CASE conversion."""
+
+from syntactic import screaming_snake_case, snake_case
+
+UNNAMED = [
+    "%GC",
+    "10uM",
+    "5'-3' bias",
+    "5prime",
+    "G2M.Score",
+    "hello world",
+    "HELLO WORLD",
+    "Mazda RX4",
+    "nCount",
+    "RNAi clones",
+    "tx2gene",
+    "TX2GeneID",
+    "worfdbHTMLRemap",
+    "x123",
+]
+
+
+class TestScreamingSnakeCase:
+    def test_unnamed(self) -> None:
+        assert screaming_snake_case(UNNAMED) == [
+            "PERCENT_GC",
+            "X10UM",
+            "X5_3_BIAS",
+            "X5PRIME",
+            "G2M_SCORE",
+            "HELLO_WORLD",
+            "HELLO_WORLD",
+            "MAZDA_RX4",
+            "N_COUNT",
+            "RNAI_CLONES",
+            "TX2GENE",
+            "TX2_GENE_ID",
+            "WORFDB_HTML_REMAP",
+            "X123",
+        ]
+
+    def test_matches_snake_case(self) -> None:
+        assert screaming_snake_case(UNNAMED) == [s.upper() for s in snake_case(UNNAMED)]
+
+    def test_disable_x_prefix(self) -> None:
+        assert screaming_snake_case(["1 foo bar"]) == ["X1_FOO_BAR"]
+        assert screaming_snake_case(["1 foo bar"], prefix=False) == ["1_FOO_BAR"]
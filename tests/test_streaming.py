@@ -0,0 +1,104 @@
+"""Tests for the streaming iter_* functions."""
+
+import types
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from syntactic import (
+    autopad_zeros,
+    camel_case,
+    dotted_case,
+    iter_autopad_zeros,
+    iter_camel_case,
+    iter_dotted_case,
+    iter_kebab_case,
+    iter_make_names,
+    iter_make_words,
+    iter_snake_case,
+    iter_upper_camel_case,
+    kebab_case,
+    make_names,
+    make_words,
+    snake_case,
+    upper_camel_case,
+)
+
+NAMES = ["sampleID", "nCount", "1 foo bar", "sampleID", "a-b", "a-b", "a_b_1", "%GC"]
+
+
+class TestIterMakeNames:
+    def test_matches_make_names(self) -> None:
+        for unique in (True, False):
+            for smart in (True, False):
+                expected = make_names(NAMES, unique=unique, smart=smart)
+                for chunk_size in (1, 3, 100):
+                    result = iter_make_names(
+                        iter(NAMES), unique=unique, smart=smart, chunk_size=chunk_size
+                    )
+                    assert list(result) == expected
+
+    def test_lazy(self) -> None:
+        def source() -> Iterator[str]:
+            yield "a"
+            yield "a"
+            raise AssertionError("Consumed past the first chunk.")
+
+        result = iter_make_names(source(), chunk_size=2)
+        assert isinstance(result, types.GeneratorType)
+        assert next(result) == "a"
+        assert next(result) == "a_1"
+
+    def test_invalid_chunk_size(self) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            list(iter_make_names(NAMES, chunk_size=0))
+
+
+class TestIterCaseConversion:
+    @pytest.mark.parametrize(
+        ("iter_fun", "fun"),
+        [
+            (iter_camel_case, camel_case),
+            (iter_upper_camel_case, upper_camel_case),
+            (iter_snake_case, snake_case),
+            (iter_dotted_case, dotted_case),
+            (iter_kebab_case, kebab_case),
+            (iter_make_words, make_words),
+        ],
+    )
+    def test_matches_batch(
+        self,
+        iter_fun: Callable[..., Iterator[str]],
+        fun: Callable[..., list[str]],
+    ) -> None:
+        assert list(iter_fun(iter(NAMES), chunk_size=3)) == fun(NAMES)
+
+    def test_options(self) -> None:
+        assert list(iter_snake_case(["1 foo bar"], prefix=False)) == ["1_foo_bar"]
+        assert list(iter_camel_case("HELLO WORLD", strict=False)) == ["helloWORLD"]
+
+
+class TestIterAutopadZeros:
+    def test_matches_autopad_zeros(self) -> None:
+        for x in ([1, 10, 100], ["1-EV", "10-EV"], ["A1", "B10", "C100"], ["A", "B"], []):
+            assert list(iter_autopad_zeros(x)) == autopad_zeros(x)
+
+    def test_file_backed(self, tmp_path: Path) -> None:
+        path = tmp_path / "samples.txt"
+        path.write_text("sample1\nsample10\nsample100\n")
+
+        class Lines:
+            def __iter__(self) -> Iterator[str]:
+                with path.open() as f:
+                    yield from (line.rstrip("\n") for line in f)
+
+        assert list(iter_autopad_zeros(Lines())) == ["sample001", "sample010", "sample100"]
+
+    def test_partial_padding_raises(self) -> None:
+        with pytest.raises(ValueError, match="Partial padding"):
+            list(iter_autopad_zeros(["1", "10", "X"]))
+
+    def test_iterator_raises(self) -> None:
+        with pytest.raises(TypeError, match="iterable twice"):
+            iter_autopad_zeros(iter(["A1", "B10"]))
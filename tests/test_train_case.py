@@ -0,0 +1,62 @@
+"""Tests for Train-Case conversion."""
+
+from syntactic import train_case
+
+UNNAMED = [
+    "%GC",
+    "10uM",
+    "5'-3' bias",
+    "5prime",
+    "G2M.Score",
+    "hello world",
+    "HELLO WORLD",
+    "Mazda RX4",
+    "nCount",
+    "RNAi clones",
+    "tx2gene",
+    "TX2GeneID",
+    "worfdbHTMLRemap",
+    "x123",
+]
+
+
+class TestTrainCase:
+    def test_strict(self) -> None:
+        assert train_case(UNNAMED, strict=True) == [
+            "Percent-Gc",
+            "X10um",
+            "X5-3-Bias",
+            "X5prime",
+            "G2m-Score",
+            "Hello-World",
+            "Hello-World",
+            "Mazda-Rx4",
+            "N-Count",
+            "Rnai-Clones",
+            "Tx2gene",
+            "Tx2-Gene-Id",
+            "Worfdb-Html-Remap",
+            "X123",
+        ]
+
+    def test_not_strict(self) -> None:
+        assert train_case(UNNAMED, strict=False) == [
+            "Percent-GC",
+            "X10um",
+            "X5-3-Bias",
+            "X5prime",
+            "G2M-Score",
+            "Hello-World",
+            "HELLO-WORLD",
+            "Mazda-RX4",
+            "N-Count",
+            "RNAI-Clones",
+            "Tx2gene",
+            "TX2-Gene-ID",
+            "Worfdb-HTML-Remap",
+            "X123",
+        ]
+
+    def test_disable_x_prefix(self) -> None:
+        assert train_case(["1 foo bar"]) == ["X1-Foo-Bar"]
+        assert train_case(["1 foo bar"], prefix=False) == ["1-Foo-Bar"]
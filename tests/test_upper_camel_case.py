@@ -64,3 +64,17 @@ class TestUpperCamelCasePrefix:
     def test_disable_x_prefix(self) -> None:
         assert upper_camel_case(["1 foo bar"]) == ["X1FooBar"]
         assert upper_camel_case(["1 foo bar"], prefix=False) == ["1FooBar"]
+
+
+class TestUpperCamelCaseAcronyms:
+    def test_not_strict(self) -> None:
+        x = ["sampleId", "dose_10nM", "nM", "UMIs", "RNAi", "EtOH", "miRNA_counts"]
+        assert upper_camel_case(x, strict=False) == [
+            "SampleId",
+            "Dose10nm",
+            "Nm",
+            "UMIS",
+            "RNAI",
+            "Etoh",
+            "MIRNACounts",
+        ]
@@ -0,0 +1,132 @@
+"""Tests for case format checks."""
+
+import itertools
+from collections.abc import Iterator
+
+import pytest
+
+from syntactic import (
+    camel_case,
+    conforms,
+    dotted_case,
+    first_violation,
+    is_camel_case,
+    is_dotted_case,
+    is_kebab_case,
+    is_screaming_snake_case,
+    is_snake_case,
+    is_syntactic_name,
+    is_train_case,
+    is_upper_camel_case,
+    kebab_case,
+    make_names,
+    screaming_snake_case,
+    snake_case,
+    train_case,
+    upper_camel_case,
+)
+
+NAMES = [
+    "%GC",
+    "10uM",
+    "1 foo bar",
+    "id",
+    "Id",
+    "ID",
+    "iD",
+    "mRNA",
+    "nCount",
+    "sample_id",
+    "sample-id",
+    "sample.id",
+    "sampleId",
+    "SampleId",
+    "SAMPLE_ID",
+    "Sample-Id",
+    "Sample-ID",
+    "TX2GeneID",
+    "UMIs",
+    "worfdbHTMLRemap",
+    "x1",
+    "X1",
+]
+
+CHECKS = {
+    "snake": (is_snake_case, snake_case),
+    "kebab": (is_kebab_case, kebab_case),
+    "dotted": (is_dotted_case, dotted_case),
+    "screaming_snake": (is_screaming_snake_case, screaming_snake_case),
+    "camel": (is_camel_case, camel_case),
+    "upper_camel": (is_upper_camel_case, upper_camel_case),
+    "train": (is_train_case, train_case),
+}
+
+STRICT_FORMATS = ("camel", "upper_camel", "train")
+
+
+@pytest.mark.parametrize("fmt", list(CHECKS))
+@pytest.mark.parametrize(
+    ("strict", "smart", "prefix"), list(itertools.product([True, False], repeat=3))
+)
+def test_agrees_with_converter(fmt: str, strict: bool, smart: bool, prefix: bool) -> None:
+    check, fun = CHECKS[fmt]
+    kwargs = {"smart": smart, "prefix": prefix}
+    if fmt in STRICT_FORMATS:
+        kwargs["strict"] = strict
+    converted = fun(NAMES, **kwargs)
+    expected = [s == t for s, t in zip(NAMES, converted, strict=True)]
+    assert check(NAMES, **kwargs) == expected
+
+
+class TestChecks:
+    def test_snake_case(self) -> None:
+        assert is_snake_case(["sample_id", "sampleId", "sample__id", "1_a"]) == [
+            True,
+            False,
+            False,
+            False,
+        ]
+        assert is_snake_case("1_a", prefix=False) == [True]
+
+    def test_camel_case(self) -> None:
+        assert is_camel_case(["sampleId", "sampleID", "dose10nM"]) == [True, False, False]
+        assert is_camel_case("sampleID", strict=False) == [True]
+
+    def test_upper_camel_case(self) -> None:
+        assert is_upper_camel_case(["SampleId", "sampleId", "UMIs"]) == [True, False, False]
+
+    def test_train_case(self) -> None:
+        assert is_train_case(["Sample-Id", "Sample-ID"]) == [True, False]
+        assert is_train_case(["Sample-Id", "Sample-ID"], strict=False) == [False, True]
+
+    def test_syntactic_name(self) -> None:
+        x = ["sample_id", "sample_id", "1a", "a__b", "GC"]
+        assert is_syntactic_name(x) == [True, False, False, False, True]
+        assert is_syntactic_name(x, unique=False) == [True, True, False, False, True]
+        for names in (["a", "a_1"], ["a", "a", "a_1"], ["a", "a_b", "b."]):
+            assert all(is_syntactic_name(names)) == (make_names(names) == names)
+
+
+class TestFirstViolation:
+    def test_first_violation(self) -> None:
+        assert first_violation(["sample_id", "sampleID", "n_count"]) == 1
+        assert first_violation(["sample_id", "n_count"]) is None
+        assert first_violation(["sampleId", "SampleId"], format="camel") == 1
+        assert first_violation(["a", "b", "a"], format="names") == 2
+
+    def test_short_circuits(self) -> None:
+        def strings() -> Iterator[str]:
+            yield from ("sample_id", "sampleID")
+            raise AssertionError("Checked past the first violation.")
+
+        assert first_violation(strings()) == 1
+        assert not conforms(strings())
+
+    def test_conforms(self) -> None:
+        assert conforms(["sample_id", "n_count"])
+        assert conforms("Sample-ID", format="train", strict=False)
+        assert not conforms(["sample_id", "n_count"], format="kebab")
+
+    def test_invalid_format(self) -> None:
+        with pytest.raises(ValueError, match="Invalid format 'pascal'"):
+            first_violation(["a"], format="pascal")